@@ -0,0 +1,199 @@
+"""
+Run the Django REST Pandas benchmark suite:
+
+    python -m benchmarks [--sizes 10000 100000] [--filter render.csv]
+                         [--output results.json] [--compare baseline.json]
+
+Each dataset is generated in the test database inside a transaction that
+is rolled back afterwards.
+"""
+import argparse
+import datetime
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tracemalloc
+import warnings
+from importlib import metadata
+from time import perf_counter
+
+import tests  # noqa (configures Django)
+from django.db import transaction
+from .data import DATASETS
+from .cases import DatasetBenchmarks
+
+
+DEFAULT_SIZES = [10000, 100000, 1000000]
+PACKAGES = [
+    "rest-pandas",
+    "pandas",
+    "numpy",
+    "Django",
+    "djangorestframework",
+    "matplotlib",
+    "openpyxl",
+    "xlsxwriter",
+    "pyarrow",
+]
+
+
+def get_metadata():
+    versions = {}
+    for package in PACKAGES:
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+    try:
+        commit = subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "versions": versions,
+    }
+
+
+def cleanup():
+    gc.collect()
+    if "matplotlib.pyplot" in sys.modules:
+        sys.modules["matplotlib.pyplot"].close("all")
+
+
+def measure(benchmark, repeat):
+    """
+    Time repeated runs of benchmark, then run it once more under tracemalloc
+    to record peak memory (tracing is too slow to combine with timing).
+    """
+    times = []
+    for i in range(repeat):
+        args = benchmark.setup()
+        gc.collect()
+        start = perf_counter()
+        benchmark.run(*args)
+        times.append(perf_counter() - start)
+        del args
+        cleanup()
+
+    args = benchmark.setup()
+    gc.collect()
+    tracemalloc.start()
+    benchmark.run(*args)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del args
+    cleanup()
+
+    return {
+        "times": times,
+        "min": min(times),
+        "median": statistics.median(times),
+        "peak_memory": peak_memory,
+    }
+
+
+def run(sizes, repeat=3, filter=None, datasets=None):
+    results = []
+    for dataset in datasets or DATASETS:
+        for rows in sizes:
+            with transaction.atomic():
+                queryset = DATASETS[dataset](rows)
+                for benchmark in DatasetBenchmarks(dataset, queryset):
+                    name = "%s.%s" % (dataset, benchmark.name)
+                    if filter and filter not in name:
+                        continue
+                    result = {"name": name, "rows": rows}
+                    try:
+                        result.update(measure(benchmark, repeat))
+                    except Exception as e:
+                        result["error"] = repr(e)
+                        print("%-44s %9s  %s" % (name, rows, result["error"]))
+                    else:
+                        print(
+                            "%-44s %9s %10.4fs %10.1fMB"
+                            % (
+                                name,
+                                rows,
+                                result["min"],
+                                result["peak_memory"] / 1e6,
+                            )
+                        )
+                    results.append(result)
+                transaction.set_rollback(True)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Print the ratio of each result to the corresponding baseline result,
+    and return the number of regressions exceeding threshold.
+    """
+    baseline = {
+        (result["name"], result["rows"]): result
+        for result in baseline["results"]
+        if "error" not in result
+    }
+    regressions = 0
+    for result in results:
+        old = baseline.get((result["name"], result["rows"]))
+        if not old or "error" in result:
+            continue
+        time_ratio = result["min"] / old["min"]
+        memory_ratio = result["peak_memory"] / max(old["peak_memory"], 1)
+        flag = ""
+        if time_ratio > threshold or memory_ratio > threshold:
+            flag = "REGRESSION"
+            regressions += 1
+        print(
+            "%-44s %9s %8.2fx time %8.2fx memory %s"
+            % (result["name"], result["rows"], time_ratio, memory_ratio, flag)
+        )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--datasets", nargs="+", choices=list(DATASETS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--filter", help="Only run benchmarks containing this string"
+    )
+    parser.add_argument("--output", default="benchmarks.json")
+    parser.add_argument(
+        "--compare", help="Previous output file to compare results with"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="Ratio above which a comparison is flagged as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    # Avoid interleaving (repeated) deprecation warnings with the results
+    warnings.simplefilter("ignore")
+
+    results = run(args.sizes, args.repeat, args.filter, args.datasets)
+    with open(args.output, "w") as file:
+        json.dump({"metadata": get_metadata(), "results": results}, file)
+    print("Results written to %s" % args.output)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
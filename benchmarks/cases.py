@@ -0,0 +1,164 @@
+import pandas
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_pandas import (
+    PandasSerializer,
+    PandasUnstackedSerializer,
+    PandasScatterSerializer,
+    PandasBoxplotSerializer,
+    PandasCSVRenderer,
+    PandasJSONRenderer,
+    PandasExcelRenderer,
+    PandasPNGRenderer,
+)
+from tests.testapp.serializers import (
+    TimeSeriesSerializer,
+    MultiTimeSeriesSerializer,
+    ComplexTimeSeriesSerializer,
+    ComplexScatterSerializer,
+    ComplexBoxplotSerializer,
+)
+
+
+# (list serializer, child serializer) for each dataset and transform.  The
+# first entry for each dataset is used for the serialize, get_dataframe, and
+# render benchmarks.
+SERIALIZERS = {
+    "timeseries": {
+        "none": (PandasSerializer, TimeSeriesSerializer),
+    },
+    "multi": {
+        "unstacked": (PandasUnstackedSerializer, MultiTimeSeriesSerializer),
+        "scatter": (PandasScatterSerializer, MultiTimeSeriesSerializer),
+        "boxplot": (PandasBoxplotSerializer, MultiTimeSeriesSerializer),
+    },
+    "complex": {
+        "unstacked": (PandasUnstackedSerializer, ComplexTimeSeriesSerializer),
+        "scatter": (PandasScatterSerializer, ComplexScatterSerializer),
+        "boxplot": (PandasBoxplotSerializer, ComplexBoxplotSerializer),
+    },
+}
+
+RENDERERS = {
+    "csv": (PandasCSVRenderer, {}),
+    "xlsx": (PandasExcelRenderer, {}),
+    "png": (PandasPNGRenderer, {}),
+}
+for orient in sorted(PandasJSONRenderer.orient_choices):
+    RENDERERS["json-" + orient] = (PandasJSONRenderer, {"orient": orient})
+
+
+class OrjsonRenderer(PandasJSONRenderer):
+    json_backend = "orjson"
+
+
+try:
+    import orjson  # noqa
+except ImportError:
+    pass
+else:
+    RENDERERS["json-records-index-orjson"] = (OrjsonRenderer, {})
+
+
+def get_request(params=None):
+    return Request(APIRequestFactory().get("/", params or {}))
+
+
+def get_serializer(dataset, transform):
+    list_serializer_class, child_class = SERIALIZERS[dataset][transform]
+    return list_serializer_class(
+        child=child_class(), context={"request": get_request()}
+    )
+
+
+def copy_on_write(function, *args):
+    with pandas.option_context("mode.copy_on_write", True):
+        return function(*args)
+
+
+class Benchmark:
+    """
+    A single timed operation.  setup() is called (untimed) before each run
+    and should return the arguments for run().
+    """
+
+    def __init__(self, name, run, setup=tuple):
+        self.name = name
+        self.run = run
+        self.setup = setup
+
+
+class DatasetBenchmarks:
+    """
+    Generates the benchmarks for a dataset, caching intermediate results
+    (serialized records and dataframes) so they are only computed once.
+    """
+
+    def __init__(self, dataset, queryset):
+        self.dataset = dataset
+        self.queryset = queryset
+        self.records = {}
+        self.dataframes = {}
+
+    @property
+    def transforms(self):
+        return list(SERIALIZERS[self.dataset])
+
+    def get_records(self, transform):
+        if transform not in self.records:
+            serializer = get_serializer(self.dataset, transform)
+            self.records[transform] = serializer.to_representation(
+                self.queryset
+            )
+        return self.records[transform]
+
+    def get_dataframe(self, transform):
+        serializer = get_serializer(self.dataset, transform)
+        return serializer.get_dataframe(self.get_records(transform))
+
+    def get_output(self, transform):
+        if transform not in self.dataframes:
+            serializer = get_serializer(self.dataset, transform)
+            self.dataframes[transform] = serializer.transform_dataframe(
+                self.get_dataframe(transform)
+            )
+        return self.dataframes[transform]
+
+    def __iter__(self):
+        default = self.transforms[0]
+        serializer = get_serializer(self.dataset, default)
+        yield Benchmark(
+            "serialize",
+            lambda: serializer.to_representation(self.queryset),
+        )
+        yield Benchmark(
+            "get_dataframe",
+            serializer.get_dataframe,
+            lambda: (self.get_records(default),),
+        )
+        yield Benchmark(
+            "get_dataframe.copy_on_write",
+            lambda records: copy_on_write(serializer.get_dataframe, records),
+            lambda: (self.get_records(default),),
+        )
+
+        for transform in self.transforms:
+            if SERIALIZERS[self.dataset][transform][0] is PandasSerializer:
+                continue
+            serializer = get_serializer(self.dataset, transform)
+            yield Benchmark(
+                "transform." + transform,
+                serializer.transform_dataframe,
+                lambda transform=transform: (self.get_dataframe(transform),),
+            )
+
+        for name, (renderer_class, params) in RENDERERS.items():
+            renderer = renderer_class()
+            context = {"request": get_request(params)}
+            yield Benchmark(
+                "render." + name,
+                lambda data, renderer=renderer, context=context: (
+                    renderer.render(data, renderer.media_type, context)
+                ),
+                lambda: (self.get_output(default).copy(),),
+            )
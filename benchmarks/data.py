@@ -0,0 +1,88 @@
+import datetime
+import random
+from tests.testapp.models import TimeSeries, MultiTimeSeries, ComplexTimeSeries
+
+START_DATE = datetime.date(1970, 1, 1)
+BATCH_SIZE = 5000
+
+
+def get_dates(count):
+    return [START_DATE + datetime.timedelta(days=i) for i in range(count)]
+
+
+def get_names(prefix, rows, max_days=20000):
+    """
+    Generate enough series names to keep dates in a realistic range.
+    """
+    count = max(5, -(-rows // max_days))
+    return ["%s%s" % (prefix, i) for i in range(count)]
+
+
+def generate_timeseries(rows, seed=0):
+    rnd = random.Random(seed)
+    TimeSeries.objects.bulk_create(
+        (
+            TimeSeries(date=date, value=round(rnd.gauss(10, 3), 3))
+            for date in get_dates(rows)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    return TimeSeries.objects.all()
+
+
+def generate_multitimeseries(rows, seed=0):
+    rnd = random.Random(seed)
+    series = get_names("s", rows)
+    dates = get_dates(-(-rows // len(series)))
+    MultiTimeSeries.objects.bulk_create(
+        (
+            MultiTimeSeries(
+                series=name,
+                date=date,
+                value=round(rnd.gauss(10, 3), 3),
+            )
+            for _, (date, name) in zip(
+                range(rows),
+                ((date, name) for date in dates for name in series),
+            )
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    return MultiTimeSeries.objects.all()
+
+
+def generate_complextimeseries(rows, seed=0):
+    rnd = random.Random(seed)
+    sites = get_names("site", rows, max_days=10000)
+    # (Parameters without units are indexed as "-")
+    parameters = (("flow", "cfs"), ("temp", "c"), ("height", None))
+    dates = get_dates(-(-rows // (len(sites) * len(parameters))))
+    keys = (
+        (date, site, parameter, units)
+        for date in dates
+        for site in sites
+        for parameter, units in parameters
+    )
+    ComplexTimeSeries.objects.bulk_create(
+        (
+            ComplexTimeSeries(
+                site=site,
+                parameter=parameter,
+                units=units,
+                date=date,
+                type="routine",
+                value=round(rnd.lognormvariate(0, 1), 3),
+                flag="Q" if rnd.random() < 0.01 else None,
+            )
+            for _, (date, site, parameter, units) in zip(range(rows), keys)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    return ComplexTimeSeries.objects.all()
+
+
+DATASETS = {
+    "timeseries": generate_timeseries,
+    "multi": generate_multitimeseries,
+    "complex": generate_complextimeseries,
+}
@@ -0,0 +1,96 @@
+"""
+Measure the startup cost of importing Django REST Pandas:
+
+    python -m benchmarks.importtime [--repeat 5] [--modules rest_pandas]
+
+Each module is imported in a fresh interpreter with ``python -X importtime``.
+The reported time covers django.setup() (with rest_pandas in INSTALLED_APPS)
+followed by the import, together with whether pandas or matplotlib were
+imported as a side effect.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+
+DEFAULT_MODULES = [
+    "rest_pandas",
+    "rest_pandas.views",
+    "rest_pandas.serializers",
+    "rest_pandas.renderers",
+]
+HEAVY_MODULES = ["pandas", "matplotlib"]
+
+SCRIPT = """
+from django.conf import settings
+settings.configure(
+    INSTALLED_APPS=["rest_framework", "rest_pandas"],
+    DATABASES={{
+        "default": {{
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": ":memory:",
+        }}
+    }},
+)
+import sys
+sys.stderr.write("--- start\\n")
+import django
+django.setup()
+import {module}
+print(",".join(name for name in {heavy!r} if name in sys.modules))
+"""
+
+
+def measure(module):
+    """
+    Import module in a new interpreter and return (cumulative import time in
+    seconds, list of heavy modules that were imported).
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            SCRIPT.format(module=module, heavy=HEAVY_MODULES),
+        ],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    log = result.stderr.split("--- start\n", 1)[-1]
+    total = 0
+    for line in log.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_time, cumulative, name = line[len("import time:") :].split("|")
+        if not name.startswith("  "):
+            # Top-level import (nested imports are indented)
+            total += int(cumulative)
+    heavy = [name for name in result.stdout.strip().split(",") if name]
+    return total / 1e6, heavy
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.importtime")
+    parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    for module in args.modules:
+        times = []
+        for i in range(args.repeat):
+            seconds, heavy = measure(module)
+            times.append(seconds)
+        print(
+            "%-28s %10.4fs  %s"
+            % (module, min(times), ", ".join(heavy) or "-")
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,48 +1,55 @@
-from .views import (
-    PandasMixin,
-    PandasSimpleView,
-    PandasView,
-    PandasViewSet,
-)
-from .serializers import (
-    PandasSerializer,
-    PandasUnstackedSerializer,
-    PandasScatterSerializer,
-    PandasBoxplotSerializer,
-    SimpleSerializer,
-)
-from .renderers import (
-    PandasBaseRenderer,
-    PandasFileRenderer,
-    PandasCSVRenderer,
-    PandasTextRenderer,
-    PandasJSONRenderer,
-    PandasExcelRenderer,
-    PandasOldExcelRenderer,
-    PandasImageRenderer,
-    PandasPNGRenderer,
-    PandasSVGRenderer,
-)
+"""
+Public names are imported from their submodules on first access, so that
+importing rest_pandas (e.g. via INSTALLED_APPS) does not import pandas.
+"""
+from importlib import import_module
 
 
-__all__ = [
-    "PandasMixin",
-    "PandasSimpleView",
-    "PandasView",
-    "PandasViewSet",
-    "PandasSerializer",
-    "PandasUnstackedSerializer",
-    "PandasScatterSerializer",
-    "PandasBoxplotSerializer",
-    "SimpleSerializer",
-    "PandasBaseRenderer",
-    "PandasFileRenderer",
-    "PandasCSVRenderer",
-    "PandasTextRenderer",
-    "PandasJSONRenderer",
-    "PandasExcelRenderer",
-    "PandasOldExcelRenderer",
-    "PandasImageRenderer",
-    "PandasPNGRenderer",
-    "PandasSVGRenderer",
-]
+_exports = {
+    "PandasMixin": "views",
+    "PandasSimpleView": "views",
+    "PandasView": "views",
+    "PandasViewSet": "views",
+    "AsyncPandasMixin": "views",
+    "AsyncPandasSimpleView": "views",
+    "AsyncPandasView": "views",
+    "AsyncPandasViewSet": "views",
+    "PandasSerializer": "serializers",
+    "PandasUnstackedSerializer": "serializers",
+    "PandasScatterSerializer": "serializers",
+    "PandasBoxplotSerializer": "serializers",
+    "SimpleSerializer": "serializers",
+    "PandasPagination": "pagination",
+    "PandasBaseRenderer": "renderers",
+    "PandasFileRenderer": "renderers",
+    "PandasCSVRenderer": "renderers",
+    "PandasStreamingCSVRenderer": "renderers",
+    "PandasTextRenderer": "renderers",
+    "PandasJSONRenderer": "renderers",
+    "PandasStreamingJSONRenderer": "renderers",
+    "PandasCompressedRenderer": "renderers",
+    "PandasParquetRenderer": "renderers",
+    "PandasArrowRenderer": "renderers",
+    "PandasExcelRenderer": "renderers",
+    "PandasOldExcelRenderer": "renderers",
+    "PandasLargeExcelRenderer": "renderers",
+    "PandasImageRenderer": "renderers",
+    "PandasPNGRenderer": "renderers",
+    "PandasSVGRenderer": "renderers",
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    if name not in _exports:
+        raise AttributeError(
+            "module {0!r} has no attribute {1!r}".format(__name__, name)
+        )
+    value = getattr(import_module("." + _exports[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
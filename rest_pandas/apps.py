@@ -0,0 +1,16 @@
+from django.apps import AppConfig
+from . import settings
+
+
+class RestPandasConfig(AppConfig):
+    name = "rest_pandas"
+
+    def ready(self):
+        # Views that enable pandas_cache individually track their models
+        # on first use (see cache.track_model())
+        if settings.CACHE:
+            from django.apps import apps
+            from .cache import track_model
+
+            for model in apps.get_models(include_auto_created=True):
+                track_model(model)
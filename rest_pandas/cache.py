@@ -0,0 +1,167 @@
+from django.core.cache import caches
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from collections import Counter
+import hashlib
+import logging
+import pickle
+import time
+from . import settings
+
+
+logger = logging.getLogger("rest_pandas")
+
+# Per-process cache hit/miss counters (see get_stats())
+stats = Counter()
+
+# Cache aliases where model versions have been requested in this process
+# (in addition to REST_PANDAS["CACHE_ALIAS"], which is always updated)
+aliases = set()
+
+# Tracked models, keyed by the models whose changes invalidate them
+dependents = {}
+
+VERSION_KEY = "rest_pandas:version:%s"
+DATAFRAME_KEY = "rest_pandas:dataframe:%s"
+RENDER_KEY = "rest_pandas:render:%s"
+
+
+def get_cache(alias=None):
+    return caches[alias or settings.CACHE_ALIAS]
+
+
+def make_key(template, *parts):
+    digest = hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()
+    return template % digest
+
+
+def hash_dataframe(dataframe):
+    """
+    Content hash covering the values, index, columns and dtypes of dataframe
+    """
+    from pandas.util import hash_pandas_object
+
+    digest = hashlib.sha1()
+    digest.update(hash_pandas_object(dataframe, index=True).values.tobytes())
+    digest.update(repr(list(dataframe.columns)).encode("utf-8"))
+    digest.update(repr(list(dataframe.columns.names)).encode("utf-8"))
+    digest.update(repr(list(dataframe.index.names)).encode("utf-8"))
+    digest.update(repr(list(dataframe.dtypes)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def get_model_version(model, alias=None):
+    """
+    Version stamp for model (in whole seconds), updated whenever an
+    instance of the model (or of a related model) is saved or deleted.
+    Included in cache keys so stale entries are never reused.  Versions
+    expire after REST_PANDAS["CACHE_TIMEOUT"], to limit how long changes
+    that do not send signals (e.g. queryset.update()) can go unnoticed.
+    """
+    alias = alias or settings.CACHE_ALIAS
+    track_model(model, alias)
+    cache = get_cache(alias)
+    key = VERSION_KEY % model._meta.label_lower
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, int(time.time()), settings.CACHE_TIMEOUT)
+        version = cache.get(key)
+    return version
+
+
+def track_model(model, alias=None):
+    """
+    Update the version of model (in alias) whenever it or a related model
+    changes.  Called for each model with cached data, and for every model
+    if REST_PANDAS["CACHE"] is enabled.
+    """
+    aliases.add(alias or settings.CACHE_ALIAS)
+    if model in dependents.get(model, ()):
+        return
+    for related_model in get_related_models(model):
+        dependents.setdefault(related_model, set()).add(model)
+    connect_signals()
+
+
+def get_related_models(model):
+    """
+    The model and any models it has a relation with (in either direction),
+    since serializers often include fields from related models.
+    """
+    models = [model]
+    for field in model._meta.get_fields(include_hidden=True):
+        related_model = getattr(field, "related_model", None)
+        if field.is_relation and related_model and related_model not in models:
+            models.append(related_model)
+    return models
+
+
+def invalidate_model(sender, **kwargs):
+    """
+    Update the version of any tracked models that depend on sender, in
+    each cache alias in use.
+    """
+    models = dependents.get(sender)
+    if not models or not kwargs.get("action", "post_").startswith("post_"):
+        return
+    now = int(time.time())
+    keys = [VERSION_KEY % model._meta.label_lower for model in models]
+    for alias in {settings.CACHE_ALIAS} | aliases:
+        cache = get_cache(alias)
+        # Always increase the version, even within the same second, so that
+        # it can also be used as the Last-Modified timestamp
+        versions = cache.get_many(keys)
+        cache.set_many(
+            {key: max(now, versions.get(key, 0) + 1) for key in keys},
+            settings.CACHE_TIMEOUT,
+        )
+
+
+def connect_signals():
+    """
+    Invalidate cached data whenever a tracked model is saved or deleted.
+    (Called automatically by track_model().)
+    """
+    post_save.connect(invalidate_model, dispatch_uid="rest_pandas_save")
+    post_delete.connect(invalidate_model, dispatch_uid="rest_pandas_delete")
+    m2m_changed.connect(invalidate_model, dispatch_uid="rest_pandas_m2m")
+
+
+def get_dataframe(key, alias=None):
+    value = get_cache(alias).get(key)
+    if value is None:
+        stats["misses"] += 1
+        logger.debug("DataFrame cache miss: %s", key)
+        return None
+    stats["hits"] += 1
+    logger.debug("DataFrame cache hit: %s", key)
+    return pickle.loads(value)
+
+
+def set_dataframe(key, dataframe, timeout, alias=None):
+    value = pickle.dumps(dataframe, protocol=5)
+    get_cache(alias).set(key, value, timeout)
+
+
+def get_output(key, alias=None):
+    value = get_cache(alias).get(key)
+    if value is None:
+        stats["render_misses"] += 1
+        logger.debug("Render cache miss: %s", key)
+    else:
+        stats["render_hits"] += 1
+        logger.debug("Render cache hit: %s", key)
+    return value
+
+
+def set_output(key, output, timeout, alias=None):
+    get_cache(alias).set(key, output, timeout)
+
+
+def get_stats():
+    """
+    Cache hit/miss counts for the current process
+    """
+    return {
+        name: stats[name]
+        for name in ("hits", "misses", "render_hits", "render_misses")
+    }
@@ -0,0 +1,227 @@
+"""
+Optional process pool for CPU-heavy transforms and renders, enabled via
+REST_PANDAS["EXECUTOR"].  Arguments and results are pickled with protocol 5,
+and the (out-of-band) array buffers are passed via shared memory rather than
+being pickled through the pool's pipes.
+"""
+from concurrent.futures import (
+    CancelledError,
+    ProcessPoolExecutor,
+    TimeoutError,
+)
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context, shared_memory
+from rest_framework.exceptions import APIException
+import logging
+import pickle
+import sys
+import threading
+from . import settings
+
+
+logger = logging.getLogger("rest_pandas")
+
+PICKLE_ERRORS = (pickle.PicklingError, TypeError, AttributeError)
+
+_pool = None
+_lock = threading.Lock()
+
+
+class ExecutorTimeout(APIException):
+    status_code = 503
+    default_detail = "Timed out while processing data."
+    default_code = "executor_timeout"
+
+
+def is_enabled(dataframe=None):
+    """
+    Whether work on dataframe (if given) should be sent to the process pool
+    """
+    if not settings.EXECUTOR:
+        return False
+    return dataframe is None or len(dataframe) >= settings.EXECUTOR_MIN_ROWS
+
+
+class WorkerContext:
+    """
+    Wrapper for a multiprocessing context that keeps a handle on each worker
+    process started by the pool, so that they can be terminated.
+    """
+
+    def __init__(self, context):
+        self.context = context
+        self.processes = []
+
+    def __getattr__(self, name):
+        return getattr(self.context, name)
+
+    def Process(self, *args, **kwargs):
+        process = self.context.Process(*args, **kwargs)
+        self.processes = [
+            process for process in self.processes if process.is_alive()
+        ] + [process]
+        return process
+
+
+class WorkerPool(ProcessPoolExecutor):
+    def __init__(self, max_workers=None, context=None, **kwargs):
+        self.worker_context = WorkerContext(get_context(context))
+        super().__init__(max_workers, mp_context=self.worker_context, **kwargs)
+
+    def terminate(self):
+        """
+        Stop the worker processes immediately, without waiting for any
+        running tasks.
+        """
+        for process in list(self.worker_context.processes):
+            if process.is_alive():
+                process.terminate()
+
+
+def get_pool():
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = WorkerPool(
+                max_workers=settings.EXECUTOR_MAX_WORKERS,
+                context=settings.EXECUTOR_CONTEXT,
+                initializer=init_worker,
+            )
+        return _pool
+
+
+def shutdown(terminate=False, pool=None):
+    """
+    Shut down the process pool (a new one is created as needed).  If pool is
+    given, it is shut down without affecting any newer pool.
+    """
+    global _pool
+    with _lock:
+        if pool is None or pool is _pool:
+            pool, _pool = _pool, None
+    if pool is None:
+        return
+    if terminate:
+        pool.terminate()
+    kwargs = {}
+    if sys.version_info >= (3, 9):
+        kwargs["cancel_futures"] = True
+    pool.shutdown(wait=not terminate, **kwargs)
+
+
+def init_worker():
+    import django
+    from django.apps import apps
+
+    if not apps.ready:
+        django.setup()
+
+
+def run(function, *args):
+    """
+    Call function(*args) in the process pool and return the result.  Falls
+    back to calling it in this process if the pool is disabled, if function
+    or args cannot be pickled, or if the pool is unavailable.  Raises
+    ExecutorTimeout if the call takes longer than EXECUTOR_TIMEOUT.
+    """
+    if not is_enabled():
+        return function(*args)
+
+    try:
+        message, memory = dumps((function, args))
+    except PICKLE_ERRORS + (OSError,) as e:
+        logger.warning("Running %r in process: %s", function, e)
+        return function(*args)
+
+    pool = get_pool()
+    future = None
+    try:
+        future = pool.submit(call, message)
+        message = future.result(timeout=settings.EXECUTOR_TIMEOUT)
+    except TimeoutError:
+        # Stop the running task, since it cannot be cancelled otherwise.
+        # ProcessPoolExecutor cannot replace a single worker, so this stops
+        # the whole pool; any other tasks that were in progress are re-run
+        # in their own request processes (see below).
+        shutdown(terminate=True, pool=pool)
+        raise ExecutorTimeout()
+    except (RuntimeError, CancelledError) as e:
+        # The pool is broken, or was shut down by another thread (any other
+        # RuntimeError raised by the function itself is passed through)
+        if future is not None and not isinstance(
+            e, (BrokenProcessPool, CancelledError)
+        ):
+            raise
+        shutdown(pool=pool)
+        logger.warning("Running %r in process: %r", function, e)
+        return function(*args)
+    finally:
+        release(memory)
+
+    return loads(message, unlink=True)
+
+
+def call(message):
+    """
+    Load the function and arguments in a worker process and call it.
+    """
+    function, args = loads(message)
+    result = function(*args)
+    del function, args
+    message, memory = dumps(result)
+    if memory is not None:
+        # The parent process releases the memory after loading the result
+        memory.close()
+    return message
+
+
+def dumps(obj):
+    """
+    Pickle obj, copying any out-of-band buffers (e.g. numpy arrays) into a
+    single shared memory block.  Returns a (message, memory) pair, where the
+    message refers to the shared memory by name.
+    """
+    buffers = []
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    if not buffers:
+        return (data, None, []), None
+
+    views = [buffer.raw() for buffer in buffers]
+    memory = shared_memory.SharedMemory(
+        create=True, size=max(sum(view.nbytes for view in views), 1)
+    )
+    offsets = []
+    offset = 0
+    for view in views:
+        memory.buf[offset : offset + view.nbytes] = view
+        offsets.append((offset, view.nbytes))
+        offset += view.nbytes
+    return (data, memory.name, offsets), memory
+
+
+def loads(message, unlink=False):
+    """
+    Unpickle a message created by dumps(), copying the buffers out of shared
+    memory so that it can be closed immediately.
+    """
+    data, name, offsets = message
+    if name is None:
+        return pickle.loads(data)
+
+    memory = shared_memory.SharedMemory(name=name)
+    try:
+        buffers = [
+            bytearray(memory.buf[offset : offset + size])
+            for offset, size in offsets
+        ]
+    finally:
+        memory.close()
+        if unlink:
+            memory.unlink()
+    return pickle.loads(data, buffers=buffers)
+
+
+def release(memory):
+    if memory is not None:
+        memory.close()
+        memory.unlink()
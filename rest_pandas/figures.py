@@ -0,0 +1,56 @@
+"""
+Reusable matplotlib figures for PandasImageRenderer.  Figures are created
+with the object-oriented API (Figure and FigureCanvasAgg) rather than
+pyplot, so they are never registered in pyplot's global state and do not
+depend on the pyplot backend.
+"""
+import threading
+
+
+class FigurePool:
+    """
+    Bounded pool of figures that are cleared and reused between renders.
+    Figures beyond the pool size are discarded when released.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.figures = []
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            if self.figures:
+                return self.figures.pop()
+        return create_figure()
+
+    def release(self, figure):
+        reset_figure(figure)
+        with self.lock:
+            if len(self.figures) < self.size:
+                self.figures.append(figure)
+
+    def clear(self):
+        with self.lock:
+            self.figures = []
+
+
+def create_figure():
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    figure = Figure()
+    FigureCanvasAgg(figure)
+    return figure
+
+
+def reset_figure(figure):
+    """
+    Restore the default (empty) state of a figure for reuse
+    """
+    from matplotlib import rcParams
+
+    figure.clear()
+    figure.set_size_inches(rcParams["figure.figsize"])
+    figure.set_dpi(rcParams["figure.dpi"])
+    figure.set_facecolor(rcParams["figure.facecolor"])
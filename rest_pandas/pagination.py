@@ -0,0 +1,177 @@
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, Q
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+import binascii
+import json
+from .serializers import PandasSerializer
+
+
+INVALID_CURSOR = "Invalid cursor"
+
+
+class PandasPagination(LimitOffsetPagination):
+    """
+    Paginates the queryset before it is serialized, on whole index values so
+    that unstacked and scatter rows stay complete.  Supports limit/offset
+    (?limit=100&offset=400) and keyset (?limit=100&after=<cursor>) modes.
+    The total count and next cursor are reported via response headers rather
+    than by wrapping the data, so CSV and other bodies remain valid.
+    """
+
+    cursor_query_param = "after"
+    template = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+
+        self.index = self.get_index_sources(queryset, view)
+        ordering = get_ordering(self.index)
+        keys = queryset.order_by(*ordering).values_list(*self.index)
+        keys = keys.distinct()
+        self.count = self.get_count(keys)
+
+        after = self.get_cursor(request)
+        if after is not None:
+            self.offset = None
+            keys = keys.filter(get_range_filter(self.index, after, "gt"))
+            keys = list(keys[: self.limit + 1])
+            has_next = len(keys) > self.limit
+            keys = keys[: self.limit]
+        else:
+            self.offset = self.get_offset(request)
+            keys = list(keys[self.offset : self.offset + self.limit])
+            has_next = self.offset + self.limit < self.count
+
+        self.next_cursor = None
+        if has_next:
+            self.next_cursor = self.encode_cursor(keys[-1])
+
+        if not keys:
+            return queryset.none()
+        return queryset.filter(
+            get_range_filter(self.index, keys[0], "gte"),
+            get_range_filter(self.index, keys[-1], "lte"),
+        ).order_by(*ordering)
+
+    def get_index_sources(self, queryset, view):
+        """
+        Model fields to order and slice the queryset by (i.e. the index
+        fields of the pandas serializer, or the primary key)
+        """
+        serializer = None
+        if view is not None and hasattr(view, "get_serializer"):
+            serializer = view.get_serializer(queryset, many=True)
+        if not isinstance(serializer, PandasSerializer):
+            return ["pk"]
+
+        sources = serializer.get_index_sources()
+        if sources is None:
+            raise ImproperlyConfigured(
+                "%s cannot paginate %s, as its index fields do not all "
+                "correspond to model fields."
+                % (type(self).__name__, serializer.model_serializer.__name__)
+            )
+        return sources or ["pk"]
+
+    def get_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            values = json.loads(urlsafe_b64decode(encoded.encode("ascii")))
+        except (TypeError, ValueError, binascii.Error):
+            raise NotFound(INVALID_CURSOR)
+        if not isinstance(values, list) or len(values) != len(self.index):
+            raise NotFound(INVALID_CURSOR)
+        return values
+
+    def encode_cursor(self, values):
+        data = json.dumps(list(values), cls=DjangoJSONEncoder)
+        return urlsafe_b64encode(data.encode("utf-8")).decode("ascii")
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        if self.offset is None:
+            url = remove_query_param(url, self.offset_query_param)
+            return replace_query_param(
+                url, self.cursor_query_param, self.next_cursor
+            )
+        return replace_query_param(
+            url, self.offset_query_param, self.offset + self.limit
+        )
+
+    def get_previous_link(self):
+        if self.offset is None:
+            return None
+        return super().get_previous_link()
+
+    def get_paginated_response(self, data):
+        return Response(data, headers=self.get_pagination_headers())
+
+    def get_pagination_headers(self):
+        headers = {"X-Total-Count": str(self.count)}
+        if self.next_cursor is not None:
+            headers["X-Next-Cursor"] = self.next_cursor
+
+        links = []
+        for rel, url in (
+            ("next", self.get_next_link()),
+            ("prev", self.get_previous_link()),
+        ):
+            if url:
+                links.append('<{0}>; rel="{1}"'.format(url, rel))
+        if links:
+            headers["Link"] = ", ".join(links)
+        return headers
+
+
+def get_ordering(fields):
+    """
+    Order by fields with nulls first, so that the ordering is consistent
+    across databases (and matches get_range_filter()).
+    """
+    return [F(field).asc(nulls_first=True) for field in fields]
+
+
+def get_range_filter(fields, values, lookup):
+    """
+    Compare the (composite) value of fields to values in lexicographic
+    order, e.g. (date, type) > (d, t) becomes date > d OR (date = d AND
+    type > t).  Nulls are treated as less than any other value.
+    """
+    strict = {"gte": "gt", "lte": "lt"}.get(lookup, lookup)
+    query = compare(fields[-1], values[-1], lookup)
+    for field, value in zip(fields[-2::-1], values[-2::-1]):
+        query = compare(field, value, strict) | (
+            compare(field, value, "exact") & query
+        )
+    return query
+
+
+def compare(field, value, lookup):
+    """
+    Q object for a single field comparison, using __isnull for nulls.
+    """
+    if value is None:
+        if lookup in ("gte", "lt"):
+            # Everything is >= null, and nothing is < null
+            query = Q(**{"%s__isnull" % field: False})
+            query |= Q(**{"%s__isnull" % field: True})
+            return query if lookup == "gte" else ~query
+        return Q(**{"%s__isnull" % field: lookup != "gt"})
+
+    query = Q(**{"%s__%s" % (field, lookup): value})
+    if lookup in ("lt", "lte"):
+        query |= Q(**{"%s__isnull" % field: True})
+    return query
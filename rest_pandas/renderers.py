@@ -1,9 +1,16 @@
 from rest_framework.renderers import BaseRenderer, TemplateHTMLRenderer
 from rest_framework import status
-from tempfile import mkstemp
-from pandas import DataFrame
+from tempfile import mkstemp, SpooledTemporaryFile
+from pandas import DataFrame, NA, NaT, Series, to_datetime
+from pandas.api.types import infer_dtype, is_datetime64_any_dtype
 from io import StringIO, BytesIO
+from itertools import islice
+import datetime
 import os
+import warnings
+import numpy as np
+from . import settings, cache, executor, resample
+from .figures import FigurePool
 
 
 RESPONSE_ERROR = (
@@ -18,6 +25,18 @@ class PandasBaseRenderer(BaseRenderer):
     Uses a StringIO to capture the output of dataframe.to_[format]()
     """
 
+    # Set to True on renderers that should be wrapped in a
+    # StreamingHttpResponse (see render_stream())
+    streaming = False
+
+    # Cache rendered output, keyed on DataFrame contents and pandas kwargs
+    render_cache = settings.RENDER_CACHE
+    render_cache_alias = settings.CACHE_ALIAS
+    render_cache_timeout = settings.CACHE_TIMEOUT
+
+    # Render in a worker process when REST_PANDAS["EXECUTOR"] is enabled
+    offload = False
+
     def render(self, data, accepted_media_type=None, renderer_context=None):
         if renderer_context and "response" in renderer_context:
             status_code = renderer_context["response"].status_code
@@ -28,12 +47,60 @@ class PandasBaseRenderer(BaseRenderer):
             raise Exception(RESPONSE_ERROR % type(data).__name__)
 
         name = getattr(self, "function", "to_%s" % self.format)
-        if not hasattr(data, name):
+        if name and not hasattr(data, name):
             raise Exception("Data frame is missing %s property!" % name)
 
+        kwargs = self.get_pandas_kwargs(data, renderer_context)
+
+        key = None
+        if self.render_cache:
+            key = self.get_render_cache_key(data, accepted_media_type, kwargs)
+        if key:
+            output = cache.get_output(key, self.render_cache_alias)
+            if output is not None:
+                return output
+
+        if self.offload and executor.is_enabled(data):
+            output = executor.run(self.render_output, data, name, kwargs)
+        else:
+            output = self.render_output(data, name, kwargs)
+        if key:
+            cache.set_output(
+                key, output, self.render_cache_timeout, self.render_cache_alias
+            )
+        return output
+
+    def get_render_cache_key(self, data, accepted_media_type, kwargs):
+        """
+        Cache key covering the DataFrame contents, the renderer class and
+        any simple pandas kwargs.  Returns None if data cannot be hashed.
+        """
+        try:
+            data_hash = cache.hash_dataframe(data)
+        except TypeError:
+            return None
+
+        options = sorted(
+            (key, repr(value))
+            for key, value in kwargs.items()
+            if isinstance(value, (str, int, float, bool, type(None)))
+        )
+        cls = type(self)
+        return cache.make_key(
+            cache.RENDER_KEY,
+            "{0}.{1}".format(cls.__module__, cls.__qualname__),
+            accepted_media_type,
+            data_hash,
+            options,
+        )
+
+    def render_output(self, data, name, kwargs):
+        """
+        Render data to the output format (possibly in a worker process, see
+        rest_pandas.executor)
+        """
         self.init_output()
         args = self.get_pandas_args(data)
-        kwargs = self.get_pandas_kwargs(data, renderer_context)
         self.render_dataframe(data, name, *args, **kwargs)
         return self.get_output()
 
@@ -67,6 +134,13 @@ class PandasFileRenderer(PandasBaseRenderer):
     def get_pandas_args(self, data):
         return [self.filename]
 
+    def render_dataframe(self, data, name, *args, **kwargs):
+        try:
+            super().render_dataframe(data, name, *args, **kwargs)
+        except Exception:
+            os.unlink(self.filename)
+            raise
+
     def get_output(self):
         file = open(self.filename, "rb")
         result = file.read()
@@ -132,9 +206,38 @@ class PandasCSVRenderer(PandasBaseRenderer):
     media_type = "text/csv"
     format = "csv"
 
+    # Number of rows to write per chunk when streaming
+    chunk_size = 10000
+
     def get_pandas_kwargs(self, data, renderer_context):
         return {"encoding": self.charset}
 
+    def render_stream(
+        self, data, accepted_media_type=None, renderer_context=None
+    ):
+        """
+        Generate the CSV in chunks of chunk_size rows, so the full output
+        never needs to be held in memory at once.
+        """
+        if not isinstance(data, DataFrame):
+            raise Exception(RESPONSE_ERROR % type(data).__name__)
+
+        name = getattr(self, "function", "to_%s" % self.format)
+        kwargs = self.get_pandas_kwargs(data, renderer_context)
+        for start in range(0, max(len(data), 1), self.chunk_size):
+            output = StringIO()
+            chunk = data.iloc[start : start + self.chunk_size]
+            getattr(chunk, name)(output, header=(start == 0), **kwargs)
+            yield output.getvalue().encode(self.charset)
+
+
+class PandasStreamingCSVRenderer(PandasCSVRenderer):
+    """
+    Renders data frame as CSV, streaming the output in chunks
+    """
+
+    streaming = True
+
 
 class PandasTextRenderer(PandasCSVRenderer):
     """
@@ -168,6 +271,12 @@ class PandasJSONRenderer(PandasBaseRenderer):
     date_format_choices = {"epoch", "iso"}
     default_date_format = "iso"
 
+    # Number of rows to encode at a time for the records-index orient
+    chunk_size = 10000
+
+    # Encoder for records-index output ("pandas" or "orjson")
+    json_backend = settings.JSON_BACKEND
+
     def get_pandas_kwargs(self, data, renderer_context):
         request = renderer_context["request"]
 
@@ -186,29 +295,414 @@ class PandasJSONRenderer(PandasBaseRenderer):
 
     def render_dataframe(self, data, name, *args, **kwargs):
         if kwargs.get("orient") == "records-index":
-            kwargs["orient"] = "records"
-            data.reset_index(inplace=True)
+            output = args[0]
+            for chunk in self.iter_records_index(data, **kwargs):
+                output.write(chunk)
+            return
         return super().render_dataframe(data, name, *args, **kwargs)
 
+    def render_stream(
+        self, data, accepted_media_type=None, renderer_context=None
+    ):
+        """
+        Generate the JSON in chunks (of chunk_size rows for the default
+        records-index orient, otherwise all at once).
+        """
+        if not isinstance(data, DataFrame):
+            raise Exception(RESPONSE_ERROR % type(data).__name__)
+
+        kwargs = self.get_pandas_kwargs(data, renderer_context)
+        if kwargs["orient"] == "records-index":
+            chunks = self.iter_records_index(data, **kwargs)
+        else:
+            chunks = [data.to_json(**kwargs)]
+        for chunk in chunks:
+            yield chunk.encode(self.charset)
+
+    def iter_records_index(self, data, orient=None, date_format=None):
+        """
+        Generate records-index JSON (i.e. records with the index levels
+        included as fields) in batches of chunk_size rows.  Only one batch
+        at a time is copied, and data itself is not modified.
+        """
+        yield "["
+        for start in range(0, len(data), self.chunk_size):
+            chunk = data.iloc[start : start + self.chunk_size].reset_index()
+            if start:
+                yield ","
+            yield self.encode_records(chunk, date_format)[1:-1]
+        yield "]"
+
+    def encode_records(self, data, date_format):
+        if self.json_backend == "orjson":
+            return self.encode_records_orjson(data, date_format)
+        return data.to_json(orient="records", date_format=date_format)
+
+    def encode_records_orjson(self, data, date_format):
+        import orjson
+
+        def default(value):
+            if value is NA or value is NaT:
+                return None
+            elif isinstance(value, (datetime.date, np.datetime64)):
+                return self.encode_dates(Series([value]), date_format)[0]
+            elif isinstance(value, np.generic):
+                return value.item()
+            else:
+                return str(value)
+
+        keys = [str(column) for column in data.columns]
+        values = []
+        for i in range(len(keys)):
+            column = data.iloc[:, i]
+            if is_datetime64_any_dtype(column) or infer_dtype(
+                column, skipna=True
+            ) in ("date", "datetime"):
+                values.append(self.encode_dates(column, date_format))
+            else:
+                values.append(column.tolist())
+
+        return orjson.dumps(
+            [dict(zip(keys, row)) for row in zip(*values)],
+            default=default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME,
+        ).decode("utf-8")
+
+    def encode_dates(self, column, date_format):
+        """
+        Format a datetime Series the same way as to_json() does.
+        """
+        if not is_datetime64_any_dtype(column):
+            column = to_datetime(column)
+        suffix = ""
+        if column.dt.tz is not None:
+            column = column.dt.tz_convert("UTC").dt.tz_localize(None)
+            suffix = "Z"
+        dates = column.to_numpy("datetime64[ms]")
+        if date_format == "epoch":
+            result = dates.astype("int64").astype(object)
+        else:
+            result = np.char.add(
+                np.datetime_as_string(dates, unit="ms"), suffix
+            ).astype(object)
+        result[np.isnat(dates)] = None
+        return result.tolist()
+
+
+class PandasStreamingJSONRenderer(PandasJSONRenderer):
+    """
+    Renders data frame as JSON, streaming the output in chunks
+    """
+
+    streaming = True
+
+
+class PandasCompressedRenderer(PandasBaseRenderer):
+    """
+    Base class for binary formats with optional compression, which can be
+    selected via the URL (e.g. /path.parquet?compression=zstd)
+    """
+
+    charset = None
+    compression_choices = set()
+    default_compression = None
+
+    def init_output(self):
+        self.output = BytesIO()
+
+    def get_compression(self, renderer_context):
+        request = (renderer_context or {}).get("request", None)
+        compression = request.GET.get("compression", "") if request else ""
+        if compression == "none":
+            return None
+        if compression not in self.compression_choices:
+            return self.default_compression
+        return compression
+
+
+class PandasParquetRenderer(PandasCompressedRenderer):
+    """
+    Renders data frame as Apache Parquet (requires pyarrow)
+    """
+
+    media_type = "application/vnd.apache.parquet"
+    format = "parquet"
+
+    compression_choices = {"snappy", "gzip", "brotli", "lz4", "zstd"}
+    default_compression = "snappy"
+
+    def get_pandas_kwargs(self, data, renderer_context):
+        return {
+            "index": True,
+            "compression": self.get_compression(renderer_context),
+        }
+
 
-class PandasExcelRenderer(PandasFileRenderer):
+class PandasArrowRenderer(PandasCompressedRenderer):
+    """
+    Renders data frame as an Apache Arrow IPC stream (requires pyarrow)
+    """
+
+    media_type = "application/vnd.apache.arrow.stream"
+    format = "arrow"
+    function = None
+
+    compression_choices = {"lz4", "zstd"}
+    default_compression = None
+
+    def get_pandas_kwargs(self, data, renderer_context):
+        return {"compression": self.get_compression(renderer_context)}
+
+    def render_dataframe(self, data, name, *args, **kwargs):
+        import pyarrow
+
+        table = pyarrow.Table.from_pandas(data, preserve_index=True)
+        options = pyarrow.ipc.IpcWriteOptions(
+            compression=kwargs["compression"]
+        )
+        with pyarrow.ipc.new_stream(
+            self.output, table.schema, options=options
+        ) as writer:
+            writer.write_table(table)
+
+
+class PandasExcelRenderer(PandasBaseRenderer):
     """
     Renders data frame as Excel (.xlsx)
+    Uses a pandas.ExcelWriter to write the workbook to a BytesIO
     """
 
     media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"  # noqa
     format = "xlsx"
     function = "to_excel"
 
+    # ExcelWriter engine (e.g. "openpyxl" or "xlsxwriter") and options
+    engine = settings.EXCEL_ENGINE
+    engine_kwargs = settings.EXCEL_ENGINE_KWARGS
+    offload = True
+
+    def init_output(self):
+        self.output = BytesIO()
+
+    def get_pandas_args(self, data):
+        return []
+
+    def get_writer_kwargs(self):
+        kwargs = {}
+        if self.engine:
+            kwargs["engine"] = self.engine
+        if self.engine_kwargs:
+            kwargs["engine_kwargs"] = self.get_engine_kwargs()
+        return kwargs
+
+    def get_engine_kwargs(self):
+        engine_kwargs = dict(self.engine_kwargs)
+        options = engine_kwargs.get("options") or {}
+        if options.get("constant_memory"):
+            # to_excel() writes column by column, which constant_memory
+            # (row by row) worksheets cannot handle without losing data.
+            warnings.warn(
+                "xlsxwriter's constant_memory option is not supported by %s"
+                " and will be ignored; use PandasLargeExcelRenderer instead."
+                % type(self).__name__
+            )
+            engine_kwargs["options"] = {
+                key: value
+                for key, value in options.items()
+                if key != "constant_memory"
+            }
+        return engine_kwargs
+
+    def render_dataframe(self, data, name, *args, **kwargs):
+        from pandas import ExcelWriter
 
-class PandasOldExcelRenderer(PandasFileRenderer):
+        with ExcelWriter(self.output, **self.get_writer_kwargs()) as writer:
+            super().render_dataframe(data, name, writer, *args, **kwargs)
+
+
+class PandasLargeExcelRenderer(PandasExcelRenderer):
+    """
+    Renders data frame as Excel (.xlsx) one row at a time, using
+    constant_memory (xlsxwriter) or write-only (openpyxl) worksheets.
+    Output is split across multiple sheets if it exceeds Excel's row limit,
+    and the finished workbook is streamed to the client.
+    """
+
+    streaming = True
+
+    # Maximum rows per worksheet (including header rows)
+    max_rows = 1048576
+
+    # Number of DataFrame rows to prepare at a time
+    chunk_size = 10000
+
+    # Size of blocks sent to the client when streaming
+    block_size = 65536
+
+    # Keep workbooks up to this size in memory (larger ones spill to disk)
+    spool_size = 16 * 1024 * 1024
+
+    def render_dataframe(self, data, name, *args, **kwargs):
+        self.write_workbook(data, self.output)
+
+    def render_stream(
+        self, data, accepted_media_type=None, renderer_context=None
+    ):
+        if not isinstance(data, DataFrame):
+            raise Exception(RESPONSE_ERROR % type(data).__name__)
+
+        with SpooledTemporaryFile(max_size=self.spool_size) as output:
+            self.write_workbook(data, output)
+            output.seek(0)
+            for block in iter(lambda: output.read(self.block_size), b""):
+                yield block
+
+    def get_engine(self):
+        if self.engine:
+            return self.engine
+        try:
+            import xlsxwriter  # noqa
+        except ImportError:
+            return "openpyxl"
+        else:
+            return "xlsxwriter"
+
+    def get_header_cells(self, data):
+        """
+        Header cells, computed by pandas' own Excel formatter so that the
+        multi-row column headers match to_excel() exactly.  Returns a list of
+        (row, col, value, merge_end_row, merge_end_col) tuples, plus the
+        number of header rows.
+        """
+        from pandas.io.formats.excel import ExcelFormatter
+
+        cells = list(
+            ExcelFormatter(data.iloc[:1], merge_cells=True)
+            .get_formatted_cells()
+        )
+        # Formatter output for a single-row frame: the body is the last row
+        header_rows = max(cell.row for cell in cells)
+        header = sorted(
+            (cell.row, cell.col, cell.val, cell.mergestart, cell.mergeend)
+            for cell in cells
+            if cell.row < header_rows
+        )
+        return header, header_rows
+
+    def iter_rows(self, data):
+        """
+        Yield each row as a list of index and column values, with missing
+        values replaced by None.
+        """
+        for start in range(0, len(data), self.chunk_size):
+            chunk = data.iloc[start : start + self.chunk_size]
+            chunk = chunk.astype(object).where(chunk.notna(), None)
+            index = chunk.index
+            if index.nlevels == 1:
+                index = [(value,) for value in index]
+            for row_index, row in zip(index, chunk.itertuples(index=False)):
+                yield list(row_index) + list(row)
+
+    def write_workbook(self, data, output):
+        if data.empty:
+            data.to_excel(output, engine=self.get_engine())
+            return
+
+        header, header_rows = self.get_header_cells(data)
+        rows_per_sheet = self.max_rows - header_rows
+        engine = self.get_engine()
+        if engine == "xlsxwriter":
+            write_sheets = self.write_xlsxwriter
+        elif engine == "openpyxl":
+            write_sheets = self.write_openpyxl
+        else:
+            raise Exception("Unsupported engine for large export: %s" % engine)
+
+        def sheets():
+            rows = self.iter_rows(data)
+            for start in range(0, len(data), rows_per_sheet):
+                name = "Sheet%s" % (start // rows_per_sheet + 1)
+                yield name, islice(rows, rows_per_sheet)
+
+        write_sheets(output, header, header_rows, sheets())
+
+    def write_xlsxwriter(self, output, header, header_rows, sheets):
+        import xlsxwriter
+
+        options = {"constant_memory": True}
+        options.update((self.engine_kwargs or {}).get("options", {}))
+        workbook = xlsxwriter.Workbook(output, options)
+        date_format = workbook.add_format({"num_format": "YYYY-MM-DD"})
+        datetime_format = workbook.add_format(
+            {"num_format": "YYYY-MM-DD HH:MM:SS"}
+        )
+        header_format = workbook.add_format(
+            {"bold": True, "align": "center", "valign": "top", "border": 1}
+        )
+
+        for name, rows in sheets:
+            worksheet = workbook.add_worksheet(name)
+            for row, col, val, end_row, end_col in header:
+                if end_row is not None and end_col is not None:
+                    worksheet.merge_range(
+                        row, col, end_row, end_col, val, header_format
+                    )
+                else:
+                    worksheet.write(row, col, val, header_format)
+            for i, values in enumerate(rows):
+                for col, val in enumerate(values):
+                    if val is None:
+                        continue
+                    elif isinstance(val, datetime.datetime):
+                        worksheet.write_datetime(
+                            header_rows + i, col, val, datetime_format
+                        )
+                    elif isinstance(val, datetime.date):
+                        worksheet.write_datetime(
+                            header_rows + i, col, val, date_format
+                        )
+                    else:
+                        worksheet.write(header_rows + i, col, val)
+        workbook.close()
+
+    def write_openpyxl(self, output, header, header_rows, sheets):
+        from openpyxl import Workbook
+        from openpyxl.utils import get_column_letter
+
+        workbook = Workbook(write_only=True)
+        for name, rows in sheets:
+            worksheet = workbook.create_sheet(name)
+            header_values = [[] for i in range(header_rows)]
+            for row, col, val, end_row, end_col in header:
+                values = header_values[row]
+                values.extend([None] * (col + 1 - len(values)))
+                values[col] = val
+                if end_row is not None and end_col is not None:
+                    worksheet.merged_cells.add(
+                        "%s%s:%s%s"
+                        % (
+                            get_column_letter(col + 1),
+                            row + 1,
+                            get_column_letter(end_col + 1),
+                            end_row + 1,
+                        )
+                    )
+            for values in header_values:
+                worksheet.append(values)
+            for values in rows:
+                worksheet.append(values)
+        workbook.save(output)
+
+
+class PandasOldExcelRenderer(PandasExcelRenderer):
     """
     Renders data frame as Excel (.xls)
     """
 
     media_type = "application/vnd.ms-excel"
     format = "xls"
-    function = "to_excel"
+    engine = "xlwt"
+    engine_kwargs = None
 
 
 class PandasImageRenderer(PandasBaseRenderer):
@@ -217,26 +711,139 @@ class PandasImageRenderer(PandasBaseRenderer):
     """
 
     function = "plot"
-    matplotlib_backend = "Agg"
+    offload = True
 
-    def init_output(self):
-        import matplotlib
+    # Shared by all image renderers (see rest_pandas.figures)
+    figure_pool = FigurePool(settings.FIGURE_POOL_SIZE)
+
+    # Figures are always drawn with FigureCanvasAgg, so other backends are
+    # not supported (kept for compatibility with existing subclasses)
+    matplotlib_backend = "Agg"
 
-        matplotlib.use(self.matplotlib_backend)
-        import matplotlib.pyplot as plt
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        backend = cls.matplotlib_backend
+        if backend and backend.lower() != "agg":
+            warnings.warn(
+                "%s.matplotlib_backend (%r) is ignored, since images are "
+                "always rendered with the Agg backend."
+                % (cls.__name__, backend),
+                stacklevel=2,
+            )
+
+    # Image options, which can be overridden via the view's
+    # pandas_image_options dict, or via query parameters.  The default
+    # size and dpi are those of matplotlib's rcParams, and max_points
+    # defaults to the width in pixels.
+    width = None
+    height = None
+    dpi = None
+    kind = "line"
+    max_points = None
+    kind_choices = ["line", "area", "bar", "barh", "hist", "box"]
+    max_size = 4000
+    max_dpi = 600
+
+    # Kinds that are downsampled to max_points before plotting
+    downsample_kinds = ["line", "area"]
+
+    # Lines and collections with more points than this are rasterized in
+    # vector output formats
+    vector_formats = ["svg"]
+    rasterize_threshold = 5000
+
+    def render_output(self, data, name, kwargs):
+        self.fig = self.figure_pool.acquire()
+        try:
+            return super().render_output(data, name, kwargs)
+        finally:
+            # Always return the figure, even if plotting fails
+            self.figure_pool.release(self.fig)
+            self.fig = self.ax = None
 
-        self.fig = plt.figure()
+    def init_output(self):
         self.ax = self.fig.add_subplot(111)
 
     def get_pandas_args(self, data):
         return []
 
     def get_pandas_kwargs(self, data, renderer_context):
-        return {"ax": self.ax}
+        view = (renderer_context or {}).get("view", None)
+        request = (renderer_context or {}).get("request", None)
+        options = {
+            "width": self.width,
+            "height": self.height,
+            "dpi": self.dpi,
+            "kind": self.kind,
+            "max_points": self.max_points,
+        }
+        options.update(getattr(view, "pandas_image_options", None) or {})
+        if request:
+            for name in options:
+                if name in request.GET:
+                    options[name] = request.GET[name]
+
+        kwargs = {"kind": options["kind"]}
+        if kwargs["kind"] not in self.kind_choices:
+            kwargs["kind"] = self.kind
+        for name, limit in (
+            ("width", self.max_size),
+            ("height", self.max_size),
+            ("dpi", self.max_dpi),
+            ("max_points", None),
+        ):
+            value = parse_positive_int(options[name])
+            if value and limit:
+                value = min(value, limit)
+            kwargs[name] = value
+        return kwargs
+
+    def render_dataframe(
+        self,
+        data,
+        name,
+        *args,
+        width=None,
+        height=None,
+        dpi=None,
+        max_points=None,
+        **kwargs,
+    ):
+        from matplotlib import rcParams
+
+        default_width, default_height = rcParams["figure.figsize"]
+        dpi = dpi or rcParams["figure.dpi"]
+        width = width or default_width * dpi
+        height = height or default_height * dpi
+        self.fig.set_dpi(dpi)
+        self.fig.set_size_inches(width / dpi, height / dpi)
+
+        if kwargs.get("kind") in self.downsample_kinds:
+            # There is no point in plotting more points than pixels
+            max_points = max(max_points or int(width), 3)
+            data = resample.downsample_dataframe(data, max_points)
+
+        super().render_dataframe(data, name, *args, ax=self.ax, **kwargs)
+
+        if self.format in self.vector_formats:
+            self.rasterize_dense_artists()
+
+    def rasterize_dense_artists(self):
+        """
+        Rasterize lines and collections that would make vector output
+        excessively large, while keeping text and axes as vectors.
+        """
+        for line in self.ax.get_lines():
+            if len(line.get_xydata()) > self.rasterize_threshold:
+                line.set_rasterized(True)
+        for collection in self.ax.collections:
+            points = sum(len(path) for path in collection.get_paths())
+            if points > self.rasterize_threshold:
+                collection.set_rasterized(True)
 
     def get_output(self):
         data = BytesIO()
-        self.fig.savefig(data, format=self.format)
+        self.fig.savefig(data, format=self.format, dpi=self.fig.dpi)
         return data.getvalue()
 
 
@@ -248,3 +855,14 @@ class PandasPNGRenderer(PandasImageRenderer):
 class PandasSVGRenderer(PandasImageRenderer):
     media_type = "image/svg"
     format = "svg"
+
+
+def parse_positive_int(value):
+    """
+    Parse an integer option, returning None if it is missing or invalid.
+    """
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return None
+    return value if value > 0 else None
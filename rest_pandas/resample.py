@@ -0,0 +1,142 @@
+import re
+import numpy as np
+from pandas import Grouper, to_datetime
+from pandas.api.types import is_numeric_dtype
+from rest_framework.exceptions import ParseError
+from django.db.models import Avg, Max, Min, Sum
+from .stats import lttb
+
+
+LTTB = "lttb"
+
+AGGREGATES = ["mean", "min", "max", "last", "sum"]
+
+# Aggregates that only apply to numeric columns (text columns may contain
+# nulls, which cannot be compared or summed)
+NUMERIC_AGGREGATES = ["mean", "min", "max", "sum"]
+
+# Aggregates that can be computed in the database
+SQL_AGGREGATES = {
+    "mean": Avg,
+    "min": Min,
+    "max": Max,
+    "sum": Sum,
+}
+
+# Frequency unit: (pandas offset alias, Grouper options, Trunc kind).
+# Periods are labeled by their start, consistent with Trunc().
+UNITS = {
+    "min": ("min", {}, "minute"),
+    "h": ("h", {}, "hour"),
+    "d": ("D", {}, "day"),
+    "w": ("W-MON", {"closed": "left", "label": "left"}, "week"),
+    "m": ("MS", {}, "month"),
+    "q": ("QS", {}, "quarter"),
+    "y": ("YS", {}, "year"),
+}
+
+FREQUENCY = re.compile(r"^(\d*)(min|h|d|w|m|q|y)$", re.IGNORECASE)
+
+
+def parse_frequency(value):
+    """
+    Parse a frequency like "1D" or "15min" into a (count, unit) pair.
+    """
+    match = FREQUENCY.match(value.strip())
+    count = match and int(match.group(1) or 1)
+    if not count:
+        raise ParseError("Invalid resample frequency: %s" % value)
+    return count, match.group(2).lower()
+
+
+def parse_aggregate(value):
+    if value not in AGGREGATES:
+        raise ParseError("Invalid aggregate: %s" % value)
+    return value
+
+
+def parse_points(value):
+    try:
+        points = int(value)
+    except (TypeError, ValueError):
+        points = 0
+    if points < 3:
+        raise ParseError("Invalid points: %s" % value)
+    return points
+
+
+def get_trunc_kind(count, unit):
+    """
+    Trunc() kind equivalent to the frequency, if any.
+    """
+    if count == 1:
+        return UNITS[unit][2]
+    return None
+
+
+def resample_dataframe(dataframe, date, keys, count, unit, aggregate):
+    """
+    Aggregate the values in dataframe by period (and any other key columns),
+    returning a new dataframe with the same columns.
+    """
+    freq, options = UNITS[unit][:2]
+    dataframe = dataframe.copy()
+    try:
+        dataframe[date] = to_datetime(dataframe[date])
+    except ValueError:
+        # Mixed UTC offsets
+        dataframe[date] = to_datetime(dataframe[date], utc=True)
+
+    values = [
+        col for col in dataframe.columns if col != date and col not in keys
+    ]
+    if aggregate in NUMERIC_AGGREGATES:
+        values = [col for col in values if is_numeric_dtype(dataframe[col])]
+
+    grouper = Grouper(key=date, freq="%s%s" % (count, freq), **options)
+    groups = dataframe.groupby([grouper] + keys, dropna=False)[values]
+    result = groups.agg(aggregate)
+    result = result[groups.size() > 0]
+    columns = [date] + keys + values
+    return result.reset_index()[
+        [col for col in dataframe.columns if col in columns]
+    ]
+
+
+def get_x(index):
+    """
+    Numeric x values for the first level of index (e.g. dates), or the row
+    position if the values are not numeric or dates.
+    """
+    values = index.get_level_values(0)
+    if is_numeric_dtype(values):
+        return values.to_numpy(dtype=float)
+    try:
+        dates = to_datetime(values)
+    except (TypeError, ValueError):
+        return np.arange(len(values), dtype=float)
+    return dates.asi8.astype(float)
+
+
+def downsample_dataframe(dataframe, points):
+    """
+    Select the rows needed to preserve the shape of each numeric column,
+    with at most points rows per column.
+    """
+    if len(dataframe) <= points:
+        return dataframe
+
+    x = get_x(dataframe.index)
+    order = np.argsort(x, kind="stable")
+    dataframe = dataframe.iloc[order]
+    x = x[order]
+
+    selected = np.zeros(len(dataframe), dtype=bool)
+    for i in range(dataframe.shape[1]):
+        column = dataframe.iloc[:, i]
+        if not is_numeric_dtype(column):
+            continue
+        y = column.to_numpy(dtype=float)
+        (valid,) = np.nonzero(~np.isnan(y))
+        selected[valid[lttb(x[valid], y[valid], points)]] = True
+    return dataframe[selected]
@@ -0,0 +1,323 @@
+"""
+Single-pass equivalents of repeated DataFrame.unstack() calls, which avoid
+building an intermediate DataFrame (and index) for each unstacked level.
+"""
+import math
+import numpy as np
+from pandas import DataFrame, MultiIndex, factorize, isna, unique
+from pandas.api.extensions import take
+
+
+# Above this many possible keys, group with np.unique() instead of
+# flattening the level codes into a single integer key
+MAX_FLAT_KEYS = 2**62
+
+
+def unstack_levels(dataframe, levels):
+    """
+    Move the named index levels to the columns, appending them (in the
+    given order) as the innermost column levels.  Equivalent to calling
+    dataframe.unstack(level) for each level in turn and then dropping any
+    rows and columns that are entirely empty, except that the empty rows
+    and columns are never created.
+    """
+    if not can_reshape(dataframe, levels):
+        for level in levels:
+            dataframe = dataframe.unstack(level)
+        dataframe = dataframe.dropna(axis=0, how="all")
+        return dataframe.dropna(axis=1, how="all")
+
+    index = dataframe.index.remove_unused_levels()
+    positions = [index.names.index(level) for level in levels]
+    row_positions = [i for i in range(index.nlevels) if i not in positions]
+    row_ids, row_codes = group_codes(index, row_positions)
+    col_ids, col_codes = group_codes(index, positions)
+    nrows, ngroups = len(row_codes[0]), len(col_codes[0])
+
+    cells = row_ids * ngroups + col_ids
+
+    # As with unstack(), columns that cannot hold NaN are upcast if any
+    # combination of row and column levels is missing
+    size = nrows * math.prod(len(index.levels[i]) for i in positions)
+    upcast = len(cells) < size
+
+    valid = ~isna(dataframe).to_numpy()
+    row_mask = np.bincount(row_ids[valid.any(axis=1)], minlength=nrows) > 0
+
+    # Source row for each (row, column group) cell, or -1 if it is empty
+    indexer = np.full(nrows * ngroups, -1, dtype=np.intp)
+    indexer[cells] = np.arange(len(cells))
+    if (indexer[cells] != np.arange(len(cells))).any():
+        raise ValueError("Index contains duplicate entries, cannot reshape")
+    indexer = indexer.reshape(nrows, ngroups)[row_mask]
+
+    data = []
+    column_codes = [[] for i in range(len(positions) + 1)]
+    for i in range(dataframe.shape[1]):
+        groups = np.bincount(col_ids[valid[:, i]], minlength=ngroups)
+        (groups,) = np.nonzero(groups)
+        if not len(groups):
+            continue
+
+        series = dataframe.iloc[:, i]
+        if isinstance(series.dtype, np.dtype):
+            values = upcast_values(series.to_numpy(), upcast)
+            block = take(values, indexer.ravel(), allow_fill=True)
+            block = block.reshape(indexer.shape)
+            data += [block[:, group] for group in groups]
+        else:
+            values = series.array
+            data += [
+                take(values, indexer[:, group], allow_fill=True)
+                for group in groups
+            ]
+
+        column_codes[0].append(np.full(len(groups), i))
+        for codes, level_codes in zip(column_codes[1:], col_codes):
+            codes.append(level_codes[groups])
+
+    row_index = get_index(
+        [index.levels[i] for i in row_positions],
+        [index.names[i] for i in row_positions],
+        row_codes,
+        row_mask,
+    )
+    columns = MultiIndex(
+        levels=[dataframe.columns] + [index.levels[i] for i in positions],
+        codes=[
+            np.concatenate(codes) if codes else np.array([], dtype=int)
+            for codes in column_codes
+        ],
+        names=[dataframe.columns.name] + [index.names[i] for i in positions],
+    )
+    result = DataFrame(dict(enumerate(data)), index=row_index)
+    result.columns = columns
+    return result
+
+
+def unstack_scatter(dataframe, coords, headers):
+    """
+    Equivalent to unstacking the coords levels (in the given order),
+    dropping empty columns and incomplete rows (i.e. where any of x, y, etc.
+    is missing), and then unstacking the headers levels.  Both unstacks are
+    done with a single reshape.
+    """
+    if not can_reshape(dataframe, coords + headers):
+        return unstack_scatter_loop(dataframe, coords, headers)
+
+    index = dataframe.index.remove_unused_levels()
+    coord_positions = [index.names.index(level) for level in coords]
+    series_positions = [
+        i for i in range(index.nlevels) if i not in coord_positions
+    ]
+    coord_ids, coord_codes = group_codes(index, coord_positions)
+    series_ids, series_codes = group_codes(index, series_positions)
+    ncoords, nseries = len(coord_codes[0]), len(series_codes[0])
+
+    # First unstack: one row for each combination of the other levels
+    cells = series_ids * ncoords + coord_ids
+    size = nseries * math.prod(len(index.levels[i]) for i in coord_positions)
+    upcast = len(cells) < size
+
+    indexer = np.full(nseries * ncoords, -1, dtype=np.intp)
+    indexer[cells] = np.arange(len(cells))
+    if (indexer[cells] != np.arange(len(cells))).any():
+        raise ValueError("Index contains duplicate entries, cannot reshape")
+    indexer = indexer.reshape(nseries, ncoords)
+
+    # Coordinate columns with any data, and rows with data for all of them
+    valid = ~isna(dataframe).to_numpy()
+    coord_groups = []
+    counts = np.zeros(nseries, dtype=int)
+    for i in range(dataframe.shape[1]):
+        groups = np.bincount(coord_ids[valid[:, i]], minlength=ncoords)
+        coord_groups.append(np.nonzero(groups)[0])
+        counts += np.bincount(series_ids[valid[:, i]], minlength=nseries)
+    complete = counts == sum(len(groups) for groups in coord_groups)
+    if not counts.any() or not complete.any():
+        return unstack_scatter_loop(dataframe, coords, headers)
+    indexer = indexer[complete]
+
+    # As with unstack(), any levels that are no longer fully used are
+    # reordered by first appearance before the second unstack
+    levels, codes = {}, {}
+    for position, level_codes in zip(series_positions, series_codes):
+        levels[position], codes[position] = remove_unused(
+            index.levels[position], level_codes[complete]
+        )
+    header_positions = [index.names.index(level) for level in headers]
+    row_positions = [i for i in series_positions if i not in header_positions]
+
+    # Second unstack: one row for each remaining row, and one column for
+    # each combination of the header values
+    row_ids, row_codes = group_arrays(
+        [codes[i] for i in row_positions],
+        [len(levels[i]) for i in row_positions],
+    )
+    header_shape = [len(levels[i]) for i in header_positions]
+    header_ids = np.zeros(len(indexer), dtype=int)
+    if header_positions:
+        header_ids = np.ravel_multi_index(
+            [codes[i] for i in header_positions], header_shape
+        )
+    ncombinations = math.prod(header_shape)
+    nrows = len(row_codes[0])
+    upcast = upcast or len(indexer) < nrows * ncombinations
+
+    final = np.full((nrows, ncombinations, ncoords), -1, dtype=np.intp)
+    final[row_ids, header_ids] = indexer
+    header_codes = [
+        level_codes.ravel() for level_codes in np.indices(header_shape)
+    ]
+
+    data = []
+    column_codes = [[] for i in range(len(coords) + len(headers) + 1)]
+    for i, groups in enumerate(coord_groups):
+        if not len(groups):
+            continue
+        series = dataframe.iloc[:, i]
+        if isinstance(series.dtype, np.dtype):
+            values = upcast_values(series.to_numpy(), upcast)
+            block = take(values, final.ravel(), allow_fill=True)
+            block = block.reshape(final.shape)
+            data += [
+                block[:, j, group]
+                for group in groups
+                for j in range(ncombinations)
+            ]
+        else:
+            values = series.array
+            data += [
+                take(values, final[:, j, group], allow_fill=True)
+                for group in groups
+                for j in range(ncombinations)
+            ]
+
+        column_codes[0].append(np.full(len(groups) * ncombinations, i))
+        for level_codes, coord_level in zip(column_codes[1:], coord_codes):
+            level_codes.append(np.repeat(coord_level[groups], ncombinations))
+        for level_codes, combinations in zip(
+            column_codes[len(coords) + 1 :], header_codes
+        ):
+            level_codes.append(np.tile(combinations, len(groups)))
+
+    columns = MultiIndex(
+        levels=[dataframe.columns]
+        + [index.levels[i] for i in coord_positions]
+        + [levels[i] for i in header_positions],
+        codes=[np.concatenate(level_codes) for level_codes in column_codes],
+        names=[dataframe.columns.name] + list(coords) + list(headers),
+    )
+    row_index = get_index(
+        [levels[i] for i in row_positions],
+        [index.names[i] for i in row_positions],
+        row_codes,
+        slice(None),
+    )
+    result = DataFrame(dict(enumerate(data)), index=row_index)
+    result.columns = columns
+    return result
+
+
+def unstack_scatter_loop(dataframe, coords, headers):
+    """
+    Fallback for unstack_scatter() using repeated unstack() calls
+    """
+    for level in coords:
+        dataframe = dataframe.unstack(level)
+    dataframe = dataframe.dropna(axis=1, how="all")
+    dataframe = dataframe.dropna(axis=0, how="any")
+    for level in headers:
+        dataframe = dataframe.unstack(level)
+    return dataframe
+
+
+def upcast_values(values, upcast):
+    """
+    Convert values that cannot hold NaN, as unstack() does when some
+    combinations are missing
+    """
+    if upcast and values.dtype.kind in "iu":
+        return values.astype(float)
+    elif upcast and values.dtype.kind == "b":
+        return values.astype(object)
+    return values
+
+
+def can_reshape(dataframe, levels):
+    """
+    Whether unstack_levels() can reshape dataframe directly (otherwise it
+    falls back to repeated unstack() calls).
+    """
+    index = dataframe.index
+    if not levels or not isinstance(index, MultiIndex) or not len(index):
+        return False
+    names = list(index.names)
+    if len(set(names)) < len(names) or len(set(levels)) < len(levels):
+        return False
+    if any(level not in names for level in levels):
+        return False
+    if len(levels) >= index.nlevels:
+        return False
+    if isinstance(dataframe.columns, MultiIndex):
+        return False
+    if not dataframe.columns.is_unique:
+        return False
+    # Missing index values (code -1) are handled specially by unstack()
+    return all((codes >= 0).all() for codes in index.codes)
+
+
+def group_codes(index, positions):
+    """
+    Dense group ids (in sorted order) for the combinations of the codes of
+    the given index levels, and the level codes of each group.
+    """
+    return group_arrays(
+        [index.codes[i] for i in positions],
+        [len(index.levels[i]) for i in positions],
+    )
+
+
+def group_arrays(codes, shape):
+    """
+    Dense group ids (in sorted order) for the combinations of the given
+    code arrays (with the given number of values each).
+    """
+    if math.prod(shape) < MAX_FLAT_KEYS:
+        keys = np.ravel_multi_index(codes, shape)
+        ids, keys = factorize(keys, sort=True)
+        return ids, np.unravel_index(keys, shape)
+    keys, ids = np.unique(
+        np.column_stack(codes), axis=0, return_inverse=True
+    )
+    return ids.ravel(), list(keys.T)
+
+
+def remove_unused(level, codes):
+    """
+    Equivalent of MultiIndex.remove_unused_levels() for a single level,
+    which keeps the level order if all values are used and otherwise orders
+    the remaining values by first appearance.
+    """
+    uniques = unique(codes)
+    if len(uniques) == len(level):
+        return level, codes
+    mapping = np.zeros(len(level), dtype=np.intp)
+    mapping[uniques] = np.arange(len(uniques))
+    return level.take(uniques), mapping[codes]
+
+
+def get_index(levels, names, codes, rows):
+    """
+    Index for the remaining levels, given the level codes of each group and
+    the groups to include (as a mask or as integer positions).
+    """
+    if len(levels) == 1:
+        result = levels[0].take(codes[0][rows])
+        result.name = names[0]
+        return result
+    return MultiIndex(
+        levels=levels,
+        codes=[level_codes[rows] for level_codes in codes],
+        names=names,
+    )
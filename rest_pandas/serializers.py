@@ -1,11 +1,126 @@
 from rest_framework import serializers
-from pandas import DataFrame
+from rest_framework.exceptions import ParseError
+from asgiref.sync import sync_to_async
+from pandas import (
+    CategoricalIndex,
+    DataFrame,
+    Index,
+    MultiIndex,
+    Series,
+    factorize,
+    to_datetime,
+)
 from pandas.api.types import is_numeric_dtype
-from django.core.exceptions import ImproperlyConfigured
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db import connections
+from django.db.models import F, QuerySet
+from django.db.models.functions import (
+    ExtractDay,
+    ExtractMonth,
+    ExtractQuarter,
+    ExtractWeek,
+    ExtractYear,
+    Trunc,
+)
+from django.db.models.manager import BaseManager
+from django.http import QueryDict
 from django.utils.functional import cached_property
-import datetime
+import numpy as np
+import logging
 from collections import OrderedDict
-from . import settings
+from types import SimpleNamespace
+from . import settings, executor
+from .stats import boxplot_stats, database_boxplot_stats
+from . import resample, reshape
+
+
+logger = logging.getLogger("rest_pandas")
+
+
+NUMERIC_FIELD_TYPES = (
+    "AutoField",
+    "BigAutoField",
+    "BigIntegerField",
+    "DecimalField",
+    "FloatField",
+    "IntegerField",
+    "PositiveBigIntegerField",
+    "PositiveIntegerField",
+    "PositiveSmallIntegerField",
+    "SmallAutoField",
+    "SmallIntegerField",
+)
+
+
+INTERVAL_FUNCTIONS = {
+    "year": ExtractYear,
+    "quarter": ExtractQuarter,
+    "month": ExtractMonth,
+    "week": ExtractWeek,
+    "day": ExtractDay,
+}
+
+
+def get_representation_class(field):
+    """
+    The class that defines field.to_representation() (e.g. CharField for
+    SlugField)
+    """
+    for cls in type(field).__mro__:
+        if "to_representation" in cls.__dict__:
+            return cls
+
+
+def get_column(values, dtype, name=None):
+    """
+    Convert a column of serialized values to the given dtype, or leave the
+    dtype to be inferred (with a warning) if the values are not compatible
+    with it.
+    """
+    if dtype is None:
+        return values
+    try:
+        return Series(values, dtype=dtype)
+    except (TypeError, ValueError) as e:
+        logger.warning("Could not convert %s to %s: %s", name, dtype, e)
+        return values
+
+
+def fill_index(index, value):
+    """
+    Replace missing values in each level of index with value.  Only the
+    level values are converted (to object, or by adding a category), and
+    the levels are kept in the same order as if value had been in the
+    original columns.
+    """
+    if not isinstance(index, MultiIndex):
+        missing = index.isna()
+        if not missing.any():
+            return index
+        if isinstance(index, CategoricalIndex):
+            if value not in index.categories:
+                index = index.add_categories([value])
+            return index.fillna(value)
+        values = np.where(missing, value, index.to_numpy(dtype=object))
+        return Index(values, dtype=object, name=index.name)
+
+    levels, codes = [], []
+    for level, level_codes in zip(index.levels, index.codes):
+        missing = level_codes == -1
+        if missing.any():
+            categorical = isinstance(level, CategoricalIndex)
+            values = np.append(level.to_numpy(dtype=object), value)
+            mapping, uniques = factorize(values, sort=True)
+            level = Index(uniques, dtype=object)
+            if categorical:
+                level = CategoricalIndex(level, categories=level)
+            # Missing values (-1) map to the last entry, i.e. value
+            level_codes = mapping[np.where(missing, -1, level_codes)]
+        levels.append(level)
+        codes.append(level_codes)
+    return MultiIndex(
+        levels=levels, codes=codes, names=index.names, verify_integrity=False
+    )
 
 
 def get_label(field, name):
@@ -25,7 +140,41 @@ class PandasSerializer(serializers.ListSerializer):
     read_only = True
     apply_field_labels = settings.APPLY_FIELD_LABELS
     index_none_value = settings.INDEX_NONE_VALUE
+    columnar = settings.COLUMNAR
+    categorical = settings.CATEGORICAL
+    typed = settings.TYPED
     wq_chart_type = None
+    fields_selected = False
+    resampled = False
+    resample_aggregate = "mean"
+    lttb_points = 1000
+
+    # Field classes whose to_representation() can be applied to raw column
+    # values loaded via values_list(), rather than to model instances.
+    columnar_field_classes = (
+        serializers.BooleanField,
+        serializers.CharField,
+        serializers.ChoiceField,
+        serializers.DateField,
+        serializers.DateTimeField,
+        serializers.DecimalField,
+        serializers.FloatField,
+        serializers.IntegerField,
+        serializers.TimeField,
+        serializers.UUIDField,
+    )
+
+    # Column dtypes for the values generated by each field class, so that
+    # the DataFrame is built with typed columns rather than inferring them
+    # (if enabled via REST_PANDAS["TYPED"] or Meta.pandas_typed).
+    # (Date and time fields are serialized as text by default, and are left
+    # as-is so that the rendered output is unchanged.)
+    field_dtypes = {
+        serializers.BooleanField: "boolean",
+        serializers.ChoiceField: "category",
+        serializers.FloatField: "float64",
+        serializers.IntegerField: "Int64",
+    }
 
     def get_index(self, dataframe):
         return self.get_index_fields()
@@ -38,25 +187,75 @@ class PandasSerializer(serializers.ListSerializer):
         }
 
     def get_dataframe(self, data):
-        dataframe = DataFrame(data)
+        dataframe = self.get_typed_dataframe(data)
         if self.apply_field_labels:
             dataframe.rename(columns=self.field_labels, inplace=True)
+        options = self.resample_options
+        if options and "unit" in options and not self.resampled:
+            dataframe = resample.resample_dataframe(
+                dataframe,
+                options["date"],
+                options["keys"],
+                options["count"],
+                options["unit"],
+                options["aggregate"],
+            )
         index = self.get_index(dataframe)
         if index:
-            if self.index_none_value is not None:
-                for key in index:
-                    try:
-                        dataframe[key].fillna(
-                            self.index_none_value, inplace=True
-                        )
-                    except ValueError:
-                        pass
+            for key in self.get_categorical_fields(dataframe):
+                if key in dataframe and dataframe[key].dtype == object:
+                    dataframe[key] = dataframe[key].astype("category")
             dataframe.set_index(index, inplace=True)
+            if self.index_none_value is not None:
+                dataframe.index = fill_index(
+                    dataframe.index, self.index_none_value
+                )
         else:
             # Name auto-index column to ensure valid CSV output
             dataframe.index.name = "row"
         return dataframe
 
+    def get_typed_dataframe(self, data):
+        """
+        Create a DataFrame from the serialized data, with the dtypes from
+        get_dtypes() applied to the corresponding columns.
+        """
+        dtypes = self.get_dtypes()
+        if isinstance(data, DataFrame):
+            # The caller's DataFrame is renamed and indexed in place later
+            dataframe = data.copy(deep=False)
+            for name, dtype in dtypes.items():
+                if name in dataframe and dataframe[name].dtype != dtype:
+                    dataframe[name] = get_column(
+                        dataframe[name], dtype, name
+                    )
+            return dataframe
+        elif not dtypes or not data:
+            return DataFrame(data)
+        return DataFrame(
+            {
+                name: get_column(
+                    [row[name] for row in data], dtypes.get(name), name
+                )
+                for name in data[0]
+            }
+        )
+
+    def get_dtypes(self):
+        """
+        Mapping of field names to column dtypes, based on field_dtypes (if
+        typed columns are enabled) and Meta.pandas_dtypes (where a dtype of
+        None disables the conversion).
+        """
+        dtypes = {}
+        if self.get_meta_option("typed", self.typed):
+            for field in self.child._readable_fields:
+                dtype = self.field_dtypes.get(get_representation_class(field))
+                if dtype:
+                    dtypes[field.field_name] = dtype
+        dtypes.update(self.get_meta_option("dtypes", {}))
+        return {name: dtype for name, dtype in dtypes.items() if dtype}
+
     def transform_dataframe(self, dataframe):
         view = self.context.get("view", None)
         if view and hasattr(view, "transform_dataframe"):
@@ -65,18 +264,365 @@ class PandasSerializer(serializers.ListSerializer):
 
     @property
     def data(self):
+        view = self.context.get("view", None)
+        if view and hasattr(view, "get_cached_dataframe"):
+            return view.get_cached_dataframe(self)
+        return self.build_dataframe()
+
+    def build_dataframe(self):
+        """
+        Serialize the data, then create and transform the DataFrame
+        """
         data = super(serializers.ListSerializer, self).data
         if isinstance(data, DataFrame) or data:
             dataframe = self.get_dataframe(data)
-            return self.transform_dataframe(dataframe)
+            if self.can_offload(dataframe):
+                dataframe = executor.run(
+                    self.detach().transform_dataframe, dataframe
+                )
+            else:
+                dataframe = self.transform_dataframe(dataframe)
+            dataframe.columns = decategorize(dataframe.columns)
+            options = self.resample_options
+            if options and "points" in options:
+                dataframe = resample.downsample_dataframe(
+                    dataframe, options["points"]
+                )
+            return dataframe
         else:
             return DataFrame([])
 
+    def can_offload(self, dataframe):
+        """
+        Whether to run transform_dataframe() in a worker process (see
+        rest_pandas.executor).  Transforms defined on the view are always
+        run in this process.
+        """
+        if not executor.is_enabled(dataframe):
+            return False
+        transform = type(self).transform_dataframe
+        if transform is PandasSerializer.transform_dataframe:
+            return False
+        view = self.context.get("view", None)
+        return not (view and hasattr(view, "transform_dataframe"))
+
+    def detach(self):
+        """
+        Picklable copy of this serializer for use in a worker process, with
+        the request (query parameters only) but without the view or data.
+        """
+        request = self.context.get("request", None)
+        serializer = type(self)(
+            child=self.model_serializer(),
+            context={
+                "request": SimpleNamespace(
+                    GET=request.GET if request else QueryDict()
+                )
+            },
+        )
+        for name in ("field_labels", "resample_options"):
+            if name in self.__dict__:
+                serializer.__dict__[name] = self.__dict__[name]
+        return serializer
+
     def to_representation(self, data):
         if isinstance(data, DataFrame):
             return data
+        if isinstance(data, (QuerySet, BaseManager)) and self.fields_selected:
+            only = self.get_only_fields(data.model)
+            if only is not None:
+                data = data.only(*only)
+        options = self.resample_options
+        if isinstance(data, (QuerySet, BaseManager)) and options:
+            if "unit" in options:
+                resampled = self.get_resampled_data(data, options)
+                if resampled is not None:
+                    return resampled
+        if isinstance(data, (QuerySet, BaseManager)) and self.get_meta_option(
+            "columnar", self.columnar
+        ):
+            columns = self.get_columnar_fields(data.model)
+            if columns is not None:
+                return self.get_columnar_data(data, columns)
         return super().to_representation(data)
 
+    async def aload(self, chunk_size=2000):
+        """
+        Fetch the queryset with the async ORM (chunk_size rows per round
+        trip) and replace it with the loaded data, so that build_dataframe()
+        does not need to access the database.  Returns False if the data
+        needs to be loaded synchronously instead (e.g. when resampling in
+        the database).
+        """
+        queryset = self.instance
+        if isinstance(queryset, BaseManager):
+            queryset = queryset.all()
+        if not isinstance(queryset, QuerySet) or not self.can_aload():
+            return False
+
+        if self.fields_selected:
+            only = self.get_only_fields(queryset.model)
+            if only is not None:
+                queryset = queryset.only(*only)
+
+        columns = None
+        if self.get_meta_option("columnar", self.columnar):
+            columns = self.get_columnar_fields(queryset.model)
+        if columns is not None:
+            rows = queryset.values_list(*[f.source for f, _ in columns])
+            batches = []
+            async for batch in abatches(rows, chunk_size):
+                batches += batch
+            self.instance = self.get_columnar_dataframe(batches, columns)
+            return True
+
+        data = []
+        async for batch in abatches(queryset, chunk_size):
+            # Serialize in a thread, in case fields access related objects
+            data += await sync_to_async(
+                super(PandasSerializer, self).to_representation
+            )(batch)
+        self.instance = DataFrame(data) if data else []
+        return True
+
+    def can_aload(self):
+        options = self.resample_options
+        return not (options and "unit" in options)
+
+    def get_required_fields(self):
+        """
+        Fields that are always serialized, even when only a subset of fields
+        is selected, since the index and transform depend on them.
+        """
+        return self.get_index(None)
+
+    def select_fields(self, names):
+        """
+        Restrict the child serializer to the given fields (by name or label)
+        plus the required fields, so that other fields are never loaded,
+        serialized or rendered.
+        """
+        fields = self.child.fields
+        labels = self.field_labels
+        known = set(labels) | set(labels.values())
+        unknown = [name for name in names if name not in known]
+        if unknown:
+            raise ParseError("Unknown field(s): %s" % ", ".join(unknown))
+
+        selected = set(names) | set(self.get_required_fields())
+        for name in list(fields):
+            if name not in selected and labels.get(name) not in selected:
+                del fields[name]
+        self.fields_selected = True
+
+    def get_only_fields(self, model):
+        """
+        Model fields needed to serialize the (selected) child fields, for use
+        with QuerySet.only(), or None if any field is not backed by a model
+        field.
+        """
+        only = []
+        for field in self.child._readable_fields:
+            if field.source == "*":
+                return None
+            try:
+                model_field = model._meta.get_field(field.source_attrs[0])
+            except FieldDoesNotExist:
+                return None
+            if not model_field.concrete or model_field.many_to_many:
+                return None
+            only.append(model_field.name)
+        return only
+
+    @cached_property
+    def resample_options(self):
+        """
+        Resampling requested via e.g. ?resample=1D&aggregate=max, or LTTB
+        downsampling requested via ?resample=lttb&points=500.
+        """
+        request = self.context.get("request", None)
+        value = request.GET.get("resample", None) if request else None
+        if not value:
+            return None
+        if value.lower() == resample.LTTB:
+            return {
+                "points": resample.parse_points(
+                    request.GET.get("points", self.lttb_points)
+                )
+            }
+
+        count, unit = resample.parse_frequency(value)
+        date = self.get_resample_date_field()
+        return {
+            "date": date,
+            "keys": [
+                field for field in self.get_index(None) if field != date
+            ],
+            "count": count,
+            "unit": unit,
+            "aggregate": resample.parse_aggregate(
+                request.GET.get("aggregate", None) or self.resample_aggregate
+            ),
+        }
+
+    def get_resample_date_field(self):
+        """
+        Date index field to resample by (the first index field by default)
+        """
+        index = self.get_index(None)
+        date = self.get_meta_option("resample_date", False)
+        if date and self.apply_field_labels:
+            date = self.field_labels.get(date, date)
+        elif not date and self.get_meta_option("index", False):
+            date = index[0]
+
+        names = {label: name for name, label in self.field_labels.items()}
+        field = self.child.fields.get(names.get(date, date))
+        if date not in index or not isinstance(
+            field, (serializers.DateField, serializers.DateTimeField)
+        ):
+            raise ParseError("Resampling is not supported for this data")
+        return date
+
+    def get_resampled_data(self, queryset, options):
+        """
+        Resample the queryset in the database, using Trunc() and aggregate
+        functions, and load the results as a DataFrame.  Returns None if the
+        frequency, aggregate, or any field is not supported.
+        """
+        kind = resample.get_trunc_kind(options["count"], options["unit"])
+        aggregate = resample.SQL_AGGREGATES.get(options["aggregate"])
+        columns = self.get_columnar_fields(queryset.model)
+        if not kind or not aggregate or columns is None:
+            return None
+
+        labels = self.field_labels if self.apply_field_labels else {}
+        model = queryset.model
+        date, keys, values = None, {}, {}
+        for field, needs_conversion in columns:
+            label = labels.get(field.field_name, field.field_name)
+            model_field = model._meta.get_field(field.source)
+            if label == options["date"]:
+                date = field
+                if kind in ("hour", "minute") and not isinstance(
+                    field, serializers.DateTimeField
+                ):
+                    return None
+                expression = Trunc(
+                    field.source, kind, output_field=type(model_field)()
+                )
+            elif label in options["keys"]:
+                expression = F(field.source)
+            elif options["aggregate"] in resample.NUMERIC_AGGREGATES and (
+                model_field.get_internal_type() not in NUMERIC_FIELD_TYPES
+            ):
+                continue
+            else:
+                values["pandas_" + field.field_name] = aggregate(field.source)
+                continue
+            keys["pandas_" + field.field_name] = expression
+
+        if date is None:
+            return None
+
+        if isinstance(queryset, BaseManager):
+            queryset = queryset.all()
+        rows = list(
+            queryset.order_by()
+            .values(**keys)
+            .annotate(**values)
+            .order_by("pandas_" + date.field_name)
+        )
+        self.resampled = True
+        if not rows:
+            return []
+
+        dataframe = DataFrame(rows)
+        dataframe.columns = [
+            name[len("pandas_") :] for name in dataframe.columns
+        ]
+        for field, needs_conversion in columns:
+            name = field.field_name
+            if name == date.field_name:
+                dataframe[name] = to_datetime(dataframe[name])
+            elif needs_conversion and name in dataframe.columns:
+                dataframe[name] = [
+                    None if value is None else field.to_representation(value)
+                    for value in dataframe[name]
+                ]
+        return dataframe[
+            [f.field_name for f, _ in columns if f.field_name in dataframe]
+        ]
+
+    def get_columnar_fields(self, model):
+        """
+        List of (field, needs_conversion) pairs for loading the queryset
+        column-by-column via values_list(), or None if any field can only be
+        computed from model instances (e.g. SerializerMethodField).
+        """
+        columns = []
+        for field in self.child._readable_fields:
+            if len(field.source_attrs) != 1:
+                return None
+            try:
+                model_field = model._meta.get_field(field.source)
+            except FieldDoesNotExist:
+                return None
+            if not model_field.concrete or model_field.is_relation:
+                return None
+
+            cls = get_representation_class(field)
+            if cls not in self.columnar_field_classes:
+                return None
+
+            if cls in (serializers.DateField, serializers.DateTimeField):
+                needs_conversion = getattr(field, "format", True) is not None
+            else:
+                needs_conversion = cls not in (
+                    serializers.CharField,
+                    serializers.FloatField,
+                    serializers.IntegerField,
+                )
+            columns.append((field, needs_conversion))
+        return columns
+
+    def get_columnar_data(self, queryset, columns):
+        """
+        Load queryset as a DataFrame directly from values_list(), skipping
+        the per-row OrderedDict generated by the child serializer.
+        """
+        if isinstance(queryset, BaseManager):
+            queryset = queryset.all()
+        rows = list(queryset.values_list(*[f.source for f, _ in columns]))
+        return self.get_columnar_dataframe(rows, columns)
+
+    def get_columnar_dataframe(self, rows, columns):
+        """
+        Convert rows loaded via values_list() to a DataFrame
+        """
+        if not rows:
+            return []
+
+        dtypes = self.get_dtypes()
+        values = list(zip(*rows))
+        for i, (field, needs_conversion) in enumerate(columns):
+            if needs_conversion:
+                values[i] = [
+                    None if value is None else field.to_representation(value)
+                    for value in values[i]
+                ]
+
+        return DataFrame(
+            {
+                field.field_name: get_column(
+                    list(column),
+                    dtypes.get(field.field_name),
+                    field.field_name,
+                )
+                for (field, _), column in zip(columns, values)
+            }
+        )
+
     @property
     def model_serializer(self):
         serializer = type(self.child)
@@ -106,6 +652,46 @@ class PandasSerializer(serializers.ListSerializer):
 
         return []
 
+    def get_categorical_fields(self, dataframe):
+        """
+        List of fields to convert to categorical dtype before indexing.
+        Meta.pandas_categorical can be True (for all index fields, including
+        any header fields that will be unstacked) or a list of fields.
+        """
+        categorical = self.get_meta_option("categorical", self.categorical)
+        if categorical is True:
+            return self.get_index(dataframe)
+        elif not categorical:
+            return []
+        elif self.apply_field_labels:
+            labels = self.field_labels
+            return [labels.get(field, field) for field in categorical]
+        else:
+            return list(categorical)
+
+    def get_index_sources(self):
+        """
+        Model field lookups (e.g. for ordering or filtering the queryset)
+        corresponding to the index fields, or None if any index field is not
+        backed by a model field.
+        """
+        names = {label: name for name, label in self.field_labels.items()}
+        model = getattr(self.model_serializer_meta, "model", None)
+        fields = self.child.fields
+        sources = []
+        for index_field in self.get_index_fields():
+            if self.apply_field_labels:
+                index_field = names.get(index_field, index_field)
+            field = fields.get(index_field)
+            if field is None or field.source == "*" or model is None:
+                return None
+            try:
+                model._meta.get_field(field.source_attrs[0])
+            except FieldDoesNotExist:
+                return None
+            sources.append("__".join(field.source_attrs))
+        return sources
+
     def get_meta_option(self, name, default=None, apply_field_labels=False):
         meta_name = "pandas_" + name
         value = getattr(self.model_serializer_meta, meta_name, None)
@@ -147,14 +733,10 @@ class PandasUnstackedSerializer(PandasSerializer):
         """
         dataframe.columns.name = ""
 
-        for i in range(len(self.get_header_fields())):
-            dataframe = dataframe.unstack()
-
-        # Remove blank rows / columns
-        dataframe = dataframe.dropna(axis=0, how="all").dropna(
-            axis=1, how="all"
-        )
-        return dataframe
+        # Equivalent to calling unstack() once per header field (i.e.
+        # innermost level first), then removing blank rows / columns
+        header_fields = self.get_header_fields()
+        return reshape.unstack_levels(dataframe, header_fields[::-1])
 
     def get_header_fields(self):
         """
@@ -191,39 +773,42 @@ class PandasScatterSerializer(PandasSerializer):
         coord_fields = self.get_coord_fields()
         header_fields = self.get_header_fields()
 
-        # Remove any pairs that don't have data for both x & y
-        for i in range(len(coord_fields)):
-            dataframe = dataframe.unstack()
-        dataframe = dataframe.dropna(axis=1, how="all")
-        dataframe = dataframe.dropna(axis=0, how="any")
-
-        # Unstack series header
-        for i in range(len(header_fields)):
-            dataframe = dataframe.unstack()
+        # Unstack coord and series header fields, removing any pairs that
+        # don't have data for both x & y
+        dataframe = reshape.unstack_scatter(
+            dataframe, coord_fields[::-1], header_fields[::-1]
+        )
 
         # Compute new column headers
-        columns = []
-        for i in range(len(header_fields) + 1):
-            columns.append([])
-
-        for col in dataframe.columns:
-            value_name = col[0]
-            coord_names = list(col[1 : len(coord_fields) + 1])
-            header_names = list(col[len(coord_fields) + 1 :])
-            coord_name = ""
-            for name in coord_names:
-                if name != self.index_none_value:
-                    coord_name += name + "-"
-            coord_name += value_name
-            columns[0].append(coord_name)
-            for i, header_name in enumerate(header_names):
-                columns[1 + i].append(header_name)
-
-        dataframe.columns = columns
+        columns = dataframe.columns
+        ncoords = len(coord_fields)
+        names = columns.droplevel(list(range(ncoords + 1, columns.nlevels)))
+        names = names.remove_unused_levels()
+        coord_name = np.full(len(columns), "", dtype=object)
+        for i in range(1, ncoords + 1):
+            level = names.levels[i].map(self.get_coord_prefix)
+            coord_name += level.to_numpy(dtype=object)[names.codes[i]]
+        coord_name += names.get_level_values(0).to_numpy(dtype=object)
+
+        dataframe.columns = MultiIndex.from_arrays(
+            [coord_name]
+            + [
+                columns.get_level_values(i)
+                for i in range(ncoords + 1, columns.nlevels)
+            ]
+        )
         dataframe.columns.names = [""] + header_fields
 
         return dataframe
 
+    def get_coord_prefix(self, name):
+        """
+        Prefix for each coordinate name in the composite 'value' header.
+        """
+        if name == self.index_none_value:
+            return ""
+        return name + "-"
+
     def get_coord_fields(self):
         """
         Fields that will be collapsed into a single header with the name of
@@ -247,6 +832,11 @@ class PandasBoxplotSerializer(PandasSerializer):
 
     index_none_value = "-"
     wq_chart_type = "boxplot"
+    intervals = ["year", "quarter", "month", "week", "day"]
+
+    # Compute statistics in the database when supported
+    database_boxplots = True
+    database_vendors = ["postgresql"]
 
     def get_index(self, dataframe):
         group_field = self.get_group_field()
@@ -262,12 +852,17 @@ class PandasBoxplotSerializer(PandasSerializer):
         index += header_fields
         return index
 
+    def build_dataframe(self):
+        dataframe = self.get_database_boxplots()
+        if dataframe is None:
+            dataframe = super().build_dataframe()
+        return dataframe
+
     def transform_dataframe(self, dataframe):
         """
-        Use matplotlib to compute boxplot statistics on e.g. timeseries data.
+        Compute boxplot statistics on e.g. timeseries data.
         """
         grouping = self.get_grouping(dataframe)
-        group_field = self.get_group_field()
         header_fields = self.get_header_fields()
 
         if "series" in grouping:
@@ -275,38 +870,41 @@ class PandasBoxplotSerializer(PandasSerializer):
             for i in range(len(header_fields) + 1):
                 dataframe = dataframe.unstack()
 
-        groups = {col: dataframe[col] for col in dataframe.columns}
-
-        if "year" in grouping:
-            interval = "year"
-        elif "month" in grouping:
-            interval = "month"
-        else:
-            interval = None
+        interval = self.get_interval(grouping)
 
         # Compute stats for each column, potentially grouped by year
+        return self.get_boxplot_dataframe(
+            self.compute_boxplots(dataframe, interval),
+            dataframe.columns.names[1:],
+            grouping,
+            interval,
+        )
+
+    def get_boxplot_dataframe(self, boxplots, names, grouping, interval):
+        """
+        Create the output dataframe from (column, stats) pairs, where each
+        column is a value name or a tuple of the value name and the values
+        of the named header fields.
+        """
+        group_field = self.get_group_field()
+        header_fields = self.get_header_fields()
+
         series_infos = OrderedDict()
-        for header, series in groups.items():
-            if interval:
-                series_stats = self.boxplots_for_interval(series, interval)
+        for header, series_stat in boxplots:
+            if isinstance(header, tuple):
+                value_name = header[0]
+                col_values = header[1:]
             else:
-                series_stats = [self.compute_boxplot(series)]
-
-            for series_stat in series_stats:
-                if isinstance(header, tuple):
-                    value_name = header[0]
-                    col_values = header[1:]
-                else:
-                    value_name = header
-                    col_values = []
-                col_names = tuple(zip(dataframe.columns.names[1:], col_values))
-                if interval in series_stat:
-                    col_names += ((interval, series_stat[interval]),)
-                series_infos.setdefault(col_names, dict(col_names))
-                series_info = series_infos[col_names]
-                for stat_name, val in series_stat.items():
-                    if stat_name != interval:
-                        series_info[value_name + "-" + stat_name] = val
+                value_name = header
+                col_values = []
+            col_names = tuple(zip(names, col_values))
+            if interval in series_stat:
+                col_names += ((interval, series_stat[interval]),)
+            series_infos.setdefault(col_names, dict(col_names))
+            series_info = series_infos[col_names]
+            for stat_name, val in series_stat.items():
+                if stat_name != interval:
+                    series_info[value_name + "-" + stat_name] = val
 
         dataframe = DataFrame(list(series_infos.values()))
         if "series" in grouping:
@@ -328,6 +926,131 @@ class PandasBoxplotSerializer(PandasSerializer):
         dataframe = dataframe.dropna(axis=1, how="all")
         return dataframe
 
+    def can_aload(self):
+        queryset = self.instance
+        if isinstance(queryset, BaseManager):
+            queryset = queryset.all()
+        if (
+            self.database_boxplots
+            and connections[queryset.db].vendor in self.database_vendors
+        ):
+            return False
+        return super().can_aload()
+
+    def get_database_boxplots(self):
+        """
+        Compute the boxplot statistics in the database (if supported), so
+        that only the statistics and outliers for each group are loaded.
+        Returns None if the data, database or fields are not supported.
+        """
+        queryset = self.instance
+        if isinstance(queryset, BaseManager):
+            queryset = queryset.all()
+        if (
+            not self.database_boxplots
+            or not isinstance(queryset, QuerySet)
+            or connections[queryset.db].vendor not in self.database_vendors
+            or self.resample_options
+        ):
+            return None
+        columns = self.get_columnar_fields(queryset.model)
+        if columns is None:
+            return None
+
+        labels = self.field_labels if self.apply_field_labels else {}
+        group_field = self.get_group_field()
+        date_field = self.get_date_field()
+        header_fields = self.get_header_fields()
+        index = self.get_index(None)
+
+        fields, values = {}, []
+        for field, needs_conversion in columns:
+            label = labels.get(field.field_name, field.field_name)
+            model_field = queryset.model._meta.get_field(field.source)
+            if label in index:
+                fields[label] = field, needs_conversion
+            elif needs_conversion or (
+                model_field.get_internal_type() not in NUMERIC_FIELD_TYPES
+            ):
+                # Use non_numeric_stats()
+                return None
+            else:
+                values.append((label, field))
+
+        grouping = self.get_grouping(
+            DataFrame(columns=[label for label, field in values])
+        )
+        interval = self.get_interval(grouping)
+        if "series" in grouping:
+            names = [group_field] + header_fields
+        elif interval:
+            names = []
+        else:
+            return None
+        if interval and date_field not in fields:
+            return None
+
+        select = {}
+        for i, name in enumerate(names):
+            select["pandas_key%s" % i] = F(fields[name][0].source)
+        keys = list(select)
+        if interval:
+            select["pandas_interval"] = INTERVAL_FUNCTIONS[interval](
+                fields[date_field][0].source
+            )
+            keys.append("pandas_interval")
+        # List outliers in the same order as the DataFrame columns, i.e.
+        # sorted by the remaining index fields after unstacking, or in
+        # queryset order.
+        if "series" in grouping:
+            ordering = [
+                fields[name][0].source for name in index if name not in names
+            ]
+        else:
+            ordering = [
+                name
+                for name in queryset.query.order_by
+                or queryset.model._meta.ordering
+                if isinstance(name, str) and name != "?"
+            ] or ["pk"]
+        order = []
+        for name in ordering:
+            alias = "pandas_order%s" % len(order)
+            select[alias] = F(name.lstrip("-"))
+            order.append(alias + (" DESC" if name.startswith("-") else ""))
+        for i, (label, field) in enumerate(values):
+            select["pandas_value%s" % i] = F(field.source)
+
+        query, params = queryset.values(**select).query.sql_with_params()
+        boxplots = []
+        with connections[queryset.db].cursor() as cursor:
+            for i, (label, field) in enumerate(values):
+                for key_values, series_stat in database_boxplot_stats(
+                    cursor,
+                    query,
+                    params,
+                    keys,
+                    "pandas_value%s" % i,
+                    order=order,
+                    required=keys[len(names) :],
+                ):
+                    header = [label]
+                    for name, value in zip(names, key_values):
+                        field, needs_conversion = fields[name]
+                        if value is None:
+                            value = self.index_none_value
+                        elif needs_conversion:
+                            value = field.to_representation(value)
+                        header.append(value)
+                    if interval:
+                        series_stat[interval] = int(key_values[-1])
+                    header = tuple(header) if names else label
+                    boxplots.append((header, series_stat))
+
+        if not boxplots:
+            return DataFrame([])
+        return self.get_boxplot_dataframe(boxplots, names, grouping, interval)
+
     def get_grouping(self, dataframe):
         request = self.context.get("request", None)
         datasets = len(dataframe.columns)
@@ -337,37 +1060,74 @@ class PandasBoxplotSerializer(PandasSerializer):
                 return group
         return default_grouping(datasets, self.get_date_field())
 
-    def boxplots_for_interval(self, series, interval):
-        def get_interval_name(date):
-            if isinstance(date, tuple):
-                date = date[0]
-            if hasattr(date, "count") and date.count("-") == 2:
-                date = datetime.datetime.strptime(date, "%Y-%m-%d")
-            return getattr(date, interval)
-
-        interval_stats = []
-        groups = series.groupby(get_interval_name).groups
-        for interval_name, group in groups.items():
-            stats = self.compute_boxplot(series[group])
-            stats[interval] = interval_name
-            interval_stats.append(stats)
-        return interval_stats
+    def get_interval(self, grouping):
+        """
+        Date interval (if any) to group statistics by.
+        """
+        for interval in self.intervals:
+            if interval in grouping:
+                return interval
+        return None
+
+    def get_interval_names(self, index, interval):
+        """
+        Compute the interval name (e.g. year) for each row, from the dates
+        in the first index level.
+        """
+        dates = to_datetime(index.get_level_values(0))
+        if interval == "week":
+            return dates.isocalendar().week.to_numpy()
+        return getattr(dates, interval).to_numpy()
+
+    def compute_boxplots(self, dataframe, interval=None):
+        """
+        Compute boxplots for each column in the dataframe (and each interval,
+        if specified), yielding (column, stats) pairs.  Statistics for all
+        numeric columns are computed at once.
+        """
+        if interval:
+            intervals = self.get_interval_names(dataframe.index, interval)
+            codes, names = factorize(intervals, sort=True)
+        else:
+            codes, names = np.zeros(len(dataframe.index), dtype=int), [None]
+
+        numeric = [
+            col
+            for col in dataframe.columns
+            if is_numeric_dtype(dataframe[col])
+        ]
+        values = dataframe[numeric].to_numpy(dtype=float)
+        groups = codes[:, np.newaxis] + np.arange(len(numeric)) * len(names)
+        valid = ~np.isnan(values) & (codes >= 0)[:, np.newaxis]
+        stats = boxplot_stats(
+            values[valid], groups[valid], len(numeric) * len(names)
+        ).to_dict("records")
+        numeric = {col: i * len(names) for i, col in enumerate(numeric)}
+
+        for col in dataframe.columns:
+            series = dataframe[col]
+            for code, name in enumerate(names):
+                if col in numeric:
+                    series_stat = stats[numeric[col] + code]
+                    if not series_stat["count"]:
+                        series_stat = {}
+                else:
+                    series_stat = self.compute_boxplot(series[codes == code])
+                if interval:
+                    series_stat[interval] = name
+                yield col, series_stat
 
     def compute_boxplot(self, series):
         """
         Compute boxplot for given pandas Series.
         """
-        from matplotlib.cbook import boxplot_stats
-
         series = series[series.notnull()]
         if len(series.values) == 0:
             return {}
         elif not is_numeric_dtype(series):
             return self.non_numeric_stats(series)
-        stats = boxplot_stats(list(series.values))[0]
-        stats["count"] = len(series.values)
-        stats["fliers"] = "|".join(map(str, stats["fliers"]))
-        return stats
+        stats = boxplot_stats(series.values, np.zeros(len(series), dtype=int))
+        return stats.to_dict("records")[0]
 
     def non_numeric_stats(self, series):
         return {
@@ -400,6 +1160,36 @@ class PandasBoxplotSerializer(PandasSerializer):
         return self.get_meta_option("boxplot_extra_index", [], True)
 
 
+def decategorize(index):
+    """
+    Convert any categorical levels in the (column) index back to their
+    original dtype, since the column headers of Parquet and Arrow output
+    cannot be categorical.
+    """
+    if isinstance(index, MultiIndex):
+        return index.set_levels(
+            [decategorize(level) for level in index.levels]
+        )
+    elif isinstance(index, CategoricalIndex):
+        return index.astype(index.categories.dtype)
+    return index
+
+
+async def abatches(queryset, chunk_size):
+    """
+    Iterate over queryset asynchronously, yielding lists of up to
+    chunk_size results.
+    """
+    batch = []
+    async for obj in queryset.aiterator(chunk_size=chunk_size):
+        batch.append(obj)
+        if len(batch) >= chunk_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
 class SimpleSerializer(serializers.Serializer):
     """
     Simple serializer for non-model (simple) views
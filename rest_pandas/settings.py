@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from importlib.util import find_spec
 
 
 if hasattr(settings, "PANDAS_RENDERERS"):
@@ -19,6 +20,17 @@ RENDERERS = REST_PANDAS.get(
         "rest_pandas.renderers.PandasCSVRenderer",
         "rest_pandas.renderers.PandasTextRenderer",
         "rest_pandas.renderers.PandasJSONRenderer",
+    )
+    + (
+        # pyarrow is optional, so only enable these renderers if installed
+        (
+            "rest_pandas.renderers.PandasParquetRenderer",
+            "rest_pandas.renderers.PandasArrowRenderer",
+        )
+        if find_spec("pyarrow")
+        else ()
+    )
+    + (
         "rest_pandas.renderers.PandasExcelRenderer",
         "rest_pandas.renderers.PandasOldExcelRenderer",
         "rest_pandas.renderers.PandasPNGRenderer",
@@ -28,3 +40,19 @@ RENDERERS = REST_PANDAS.get(
 
 APPLY_FIELD_LABELS = REST_PANDAS.get("APPLY_FIELD_LABELS", True)
 INDEX_NONE_VALUE = REST_PANDAS.get("INDEX_NONE_VALUE", None)
+COLUMNAR = REST_PANDAS.get("COLUMNAR", False)
+CATEGORICAL = REST_PANDAS.get("CATEGORICAL", False)
+TYPED = REST_PANDAS.get("TYPED", False)
+CACHE = REST_PANDAS.get("CACHE", False)
+CACHE_ALIAS = REST_PANDAS.get("CACHE_ALIAS", "default")
+CACHE_TIMEOUT = REST_PANDAS.get("CACHE_TIMEOUT", 300)
+RENDER_CACHE = REST_PANDAS.get("RENDER_CACHE", False)
+EXCEL_ENGINE = REST_PANDAS.get("EXCEL_ENGINE", None)
+EXCEL_ENGINE_KWARGS = REST_PANDAS.get("EXCEL_ENGINE_KWARGS", None)
+JSON_BACKEND = REST_PANDAS.get("JSON_BACKEND", "pandas")
+EXECUTOR = REST_PANDAS.get("EXECUTOR", False)
+EXECUTOR_MAX_WORKERS = REST_PANDAS.get("EXECUTOR_MAX_WORKERS", None)
+EXECUTOR_TIMEOUT = REST_PANDAS.get("EXECUTOR_TIMEOUT", 60)
+EXECUTOR_MIN_ROWS = REST_PANDAS.get("EXECUTOR_MIN_ROWS", 10000)
+EXECUTOR_CONTEXT = REST_PANDAS.get("EXECUTOR_CONTEXT", None)
+FIGURE_POOL_SIZE = REST_PANDAS.get("FIGURE_POOL_SIZE", 4)
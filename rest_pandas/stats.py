@@ -0,0 +1,243 @@
+import numpy as np
+from pandas import DataFrame, Series
+
+
+BOXPLOT_STATS = [
+    "mean",
+    "iqr",
+    "cilo",
+    "cihi",
+    "whishi",
+    "whislo",
+    "fliers",
+    "q1",
+    "med",
+    "q3",
+    "count",
+]
+
+
+def percentile(values, start, count, q):
+    """
+    Compute the q-th percentile of each (sorted) group in values, using the
+    same linear interpolation as numpy.percentile().
+    """
+    q = q / 100
+    virtual = count * q + (1 - q) - 1
+    previous = np.floor(virtual).astype(int)
+    above = virtual >= count - 1
+    previous[above] = count[above] - 1
+    next = np.where(above, previous, previous + 1)
+    gamma = virtual - np.where(above, -1, previous)
+
+    a = values[start + previous]
+    b = values[start + next]
+    diff = b - a
+    return np.where(gamma >= 0.5, b - diff * (1 - gamma), a + diff * gamma)
+
+
+def boxplot_stats(values, groups, ngroups=None, whis=1.5):
+    """
+    Vectorized equivalent of matplotlib.cbook.boxplot_stats(), computing
+    statistics for every group at once.  values should be a 1-D array
+    without missing values, and groups an array of the same length
+    containing integer group codes.  Returns a DataFrame indexed by group
+    code, with a count of 0 for any groups without values.
+    """
+    values = np.asarray(values, dtype=float)
+    groups = np.asarray(groups, dtype=int)
+    if ngroups is None:
+        ngroups = groups.max() + 1 if len(groups) else 0
+
+    if not len(values):
+        stats = DataFrame(index=range(ngroups), columns=BOXPLOT_STATS)
+        return stats.assign(count=0)
+
+    counts = np.bincount(groups, minlength=ngroups)
+    codes = np.flatnonzero(counts)
+    count = counts[codes]
+    start = np.concatenate(([0], np.cumsum(count)[:-1])).astype(int)
+
+    # Values grouped together in their original order, and sorted by value
+    # within each group
+    grouped = values[np.argsort(groups, kind="stable")]
+    ordered = values[np.lexsort((values, groups))]
+    group = np.repeat(np.arange(len(codes)), count)
+
+    mean = np.add.reduceat(grouped, start) / count
+    q1, med, q3 = (percentile(ordered, start, count, q) for q in (25, 50, 75))
+    iqr = q3 - q1
+
+    # Confidence interval around median
+    cilo = med - 1.57 * iqr / np.sqrt(count)
+    cihi = med + 1.57 * iqr / np.sqrt(count)
+
+    # Lowest/highest non-outliers
+    loval = q1 - whis * iqr
+    hival = q3 + whis * iqr
+    whishi = np.full(len(codes), -np.inf)
+    whislo = np.full(len(codes), np.inf)
+    inner = grouped <= hival[group]
+    np.maximum.at(whishi, group[inner], grouped[inner])
+    inner = grouped >= loval[group]
+    np.minimum.at(whislo, group[inner], grouped[inner])
+    whishi = np.where(whishi < q3, q3, whishi)
+    whislo = np.where(whislo > q1, q1, whislo)
+
+    # Outliers, with low values first (as in matplotlib)
+    low = np.flatnonzero(grouped < whislo[group])
+    high = np.flatnonzero(grouped > whishi[group])
+    outliers = np.concatenate((low, high))
+    is_high = np.repeat([0, 1], [len(low), len(high)])
+    outliers = outliers[np.lexsort((is_high, group[outliers]))]
+    fliers = (
+        Series(grouped[outliers].astype(object))
+        .map(str)
+        .groupby(group[outliers])
+        .agg("|".join)
+        .reindex(range(len(codes)), fill_value="")
+    )
+
+    stats = DataFrame(
+        {
+            "mean": mean,
+            "iqr": iqr,
+            "cilo": cilo,
+            "cihi": cihi,
+            "whishi": whishi,
+            "whislo": whislo,
+            "fliers": fliers.to_numpy(),
+            "q1": q1,
+            "med": med,
+            "q3": q3,
+            "count": count,
+        },
+        index=codes,
+    )
+    return stats.reindex(range(ngroups)).fillna({"count": 0}).astype(
+        {"count": int}
+    )
+
+
+def lttb(x, y, points):
+    """
+    Select the indices of (at most) points values that preserve the visual
+    shape of the series, using the Largest-Triangle-Three-Buckets algorithm
+    (Steinarsson, 2013).  x must be sorted.
+    """
+    count = len(x)
+    if points >= count:
+        return np.arange(count)
+    points = max(points, 3)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    x = x - x[0]
+
+    # Bucket i spans bounds[i]:bounds[i + 1]; the first and last values are
+    # always selected.
+    bounds = (np.arange(points - 1) * ((count - 2) / (points - 2))).astype(int)
+    bounds += 1
+    bounds[-1] = count - 1
+
+    selected = np.empty(points, dtype=int)
+    selected[0] = 0
+    selected[-1] = count - 1
+    a = 0
+    for i in range(points - 2):
+        start, end = bounds[i], bounds[i + 1]
+        if i + 2 < len(bounds):
+            next_start, next_end = bounds[i + 1], bounds[i + 2]
+        else:
+            next_start, next_end = count - 1, count
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+# Boxplot statistics for each group of rows in a subquery, computed in
+# PostgreSQL.  Only the statistics and the outliers are returned.
+BOXPLOT_SQL = """
+WITH data AS (
+    SELECT {keys}, CAST({value} AS double precision) AS v,
+        dense_rank() OVER (ORDER BY {keys}) AS g,
+        row_number() OVER ({order}) AS rn
+    FROM ({query}) AS q
+    {where}
+), stats AS (
+    SELECT g, {keys}, COUNT(v) AS count, AVG(v) AS mean,
+        percentile_cont(0.25) WITHIN GROUP (ORDER BY v) AS q1,
+        percentile_cont(0.5) WITHIN GROUP (ORDER BY v) AS med,
+        percentile_cont(0.75) WITHIN GROUP (ORDER BY v) AS q3
+    FROM data
+    GROUP BY g, {keys}
+), whiskers AS (
+    SELECT s.g,
+        GREATEST(
+            MAX(d.v) FILTER (WHERE d.v <= s.q3 + %s * (s.q3 - s.q1)), s.q3
+        ) AS whishi,
+        LEAST(
+            MIN(d.v) FILTER (WHERE d.v >= s.q1 - %s * (s.q3 - s.q1)), s.q1
+        ) AS whislo
+    FROM stats s JOIN data d ON d.g = s.g
+    GROUP BY s.g, s.q1, s.q3
+)
+SELECT {stats_keys}, s.count, s.mean, s.q1, s.med, s.q3,
+    w.whishi, w.whislo, ARRAY(
+        SELECT d.v FROM data d
+        WHERE d.g = s.g AND (d.v < w.whislo OR d.v > w.whishi)
+        ORDER BY d.v > w.whishi, d.rn
+    ) AS fliers
+FROM stats s JOIN whiskers w ON w.g = s.g
+ORDER BY s.g
+"""
+
+
+def database_boxplot_stats(
+    cursor, query, params, keys, value, order=(), required=(), whis=1.5
+):
+    """
+    Compute the same statistics as boxplot_stats() in the database, for
+    each distinct combination of keys in query (which should select the key
+    and value columns).  Rows with null values for any required keys are
+    excluded.  Outliers are listed in the specified order (or the query
+    order).  Yields (keys, stats) pairs.
+    """
+    sql = BOXPLOT_SQL.format(
+        keys=", ".join(keys),
+        value=value,
+        order="ORDER BY %s" % ", ".join(order) if order else "",
+        query=query,
+        where="WHERE %s" % " AND ".join(
+            "%s IS NOT NULL" % key for key in required
+        )
+        if required
+        else "",
+        stats_keys=", ".join("s.%s" % key for key in keys),
+    )
+    cursor.execute(sql, list(params) + [whis, whis])
+    for row in cursor.fetchall():
+        count, mean, q1, med, q3, whishi, whislo, fliers = row[len(keys) :]
+        if not count:
+            yield row[: len(keys)], {}
+            continue
+        iqr = q3 - q1
+        yield row[: len(keys)], {
+            "mean": mean,
+            "iqr": iqr,
+            "cilo": med - 1.57 * iqr / np.sqrt(count),
+            "cihi": med + 1.57 * iqr / np.sqrt(count),
+            "whishi": whishi,
+            "whislo": whislo,
+            "fliers": "|".join(str(flier) for flier in fliers),
+            "q1": q1,
+            "med": med,
+            "q3": q3,
+            "count": count,
+        }
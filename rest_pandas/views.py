@@ -1,5 +1,3 @@
-from .renderers import PandasBaseRenderer
-
 try:
     from rest_framework.views import APIView
 except ImportError as e:
@@ -9,24 +7,109 @@ except ImportError as e:
         )
     else:
         raise
+from rest_framework import status
 from rest_framework.generics import ListAPIView
 from rest_framework.mixins import ListModelMixin
 from rest_framework.viewsets import GenericViewSet
 from rest_framework.response import Response
+from django.core.exceptions import EmptyResultSet
+from django.db.models import QuerySet
+from django.db.models.manager import BaseManager
+from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from django.utils.decorators import classonlymethod
+from django.utils.functional import classproperty
+from asgiref.sync import sync_to_async
+from functools import wraps
+from inspect import isawaitable
+
+try:
+    from asgiref.sync import iscoroutinefunction
+except ImportError:
+    # asgiref < 3.6
+    from asyncio import iscoroutinefunction
 
-from . import settings
+from . import settings, cache
 from rest_framework.settings import perform_import
 
-from .serializers import SimpleSerializer, PandasSerializer
+# pandas, the renderers and the serializers are imported on first use, so
+# that importing views (e.g. when loading URLs) does not import pandas.
+
+_pandas_renderers = None
+
+
+def get_pandas_renderers():
+    """
+    Renderer classes from REST_PANDAS["RENDERERS"], imported on first use
+    """
+    global _pandas_renderers
+    if _pandas_renderers is None:
+        _pandas_renderers = perform_import(
+            settings.RENDERERS, 'REST_PANDAS["RENDERERS"]'
+        )
+    return _pandas_renderers
+
+
+def __getattr__(name):
+    if name == "PANDAS_RENDERERS":
+        return get_pandas_renderers()
+    raise AttributeError(
+        "module {0!r} has no attribute {1!r}".format(__name__, name)
+    )
+
+
+def is_pandas_renderer(renderer):
+    from .renderers import PandasBaseRenderer
+
+    return isinstance(renderer, PandasBaseRenderer)
+
+
+def is_pandas_serializer(serializer):
+    from .serializers import PandasSerializer
+
+    return isinstance(serializer, PandasSerializer)
+
+
+def is_dataframe(data):
+    from pandas import DataFrame
 
+    return isinstance(data, DataFrame)
 
-PANDAS_RENDERERS = perform_import(
-    settings.RENDERERS, 'REST_PANDAS["RENDERERS"]'
-)
+
+def qualname(cls):
+    return "{0}.{1}".format(cls.__module__, cls.__qualname__)
 
 
 class PandasMixin(object):
-    pandas_serializer_class = PandasSerializer
+    pandas_cache = settings.CACHE
+    pandas_cache_alias = settings.CACHE_ALIAS
+    pandas_cache_timeout = settings.CACHE_TIMEOUT
+    pandas_cache_params = [
+        "group",
+        "orient",
+        "date_format",
+        "fields",
+        "columns",
+        "resample",
+        "aggregate",
+        "points",
+    ]
+    pandas_fields_params = ["fields", "columns"]
+
+    @classonlymethod
+    def as_view(cls, *args, **kwargs):
+        queryset = getattr(cls, "queryset", None)
+        if cls.pandas_cache and queryset is not None:
+            # Start tracking changes before the first (cached) request
+            cache.track_model(queryset.model, cls.pandas_cache_alias)
+        return super().as_view(*args, **kwargs)
+
+    @classproperty
+    def pandas_serializer_class(cls):
+        from .serializers import PandasSerializer
+
+        return PandasSerializer
 
     def with_list_serializer(self, cls):
         meta = getattr(cls, "Meta", object)
@@ -54,27 +137,164 @@ class PandasMixin(object):
             # BrowsableAPIRenderer
             renderer = renderer.get_default_renderer(self)
 
-        if isinstance(renderer, PandasBaseRenderer):
+        if is_pandas_renderer(renderer):
             return self.with_list_serializer(self.serializer_class)
         else:
             return self.serializer_class
 
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        if is_pandas_serializer(serializer):
+            fields = self.get_pandas_fields(self.request)
+            if fields:
+                serializer.select_fields(fields)
+        return serializer
+
+    def get_pandas_fields(self, request):
+        """
+        Field names requested via e.g. ?fields=date,value (comma-separated
+        and/or repeated).  An empty list means all fields.
+        """
+        fields = []
+        for param in self.pandas_fields_params:
+            for value in request.GET.getlist(param):
+                fields += [name for name in value.split(",") if name]
+        return fields
+
+    def get_cached_dataframe(self, serializer):
+        """
+        Load the transformed DataFrame from the cache, or build and store it
+        """
+        key = None
+        if self.pandas_cache:
+            key = self.get_pandas_cache_key(serializer)
+        if key is None:
+            return serializer.build_dataframe()
+
+        dataframe = cache.get_dataframe(key, self.pandas_cache_alias)
+        if dataframe is None:
+            dataframe = serializer.build_dataframe()
+            cache.set_dataframe(
+                key,
+                dataframe,
+                self.pandas_cache_timeout,
+                self.pandas_cache_alias,
+            )
+        return dataframe
+
+    def get_pandas_cache_key(self, serializer):
+        """
+        Cache key covering the queryset SQL, the serializer classes and the
+        request parameters that affect the transformed DataFrame.  Returns
+        None if the data was not loaded from a queryset.
+        """
+        queryset = serializer.instance
+        if isinstance(queryset, BaseManager):
+            queryset = queryset.all()
+        if not isinstance(queryset, QuerySet):
+            return None
+
+        try:
+            sql = str(queryset.query)
+        except EmptyResultSet:
+            sql = ""
+
+        params = [
+            (name, self.request.GET.getlist(name))
+            for name in self.pandas_cache_params
+        ]
+
+        return cache.make_key(
+            cache.DATAFRAME_KEY,
+            sql,
+            qualname(type(self)),
+            qualname(type(serializer)),
+            qualname(serializer.model_serializer),
+            params,
+            cache.get_model_version(queryset.model, self.pandas_cache_alias),
+        )
+
+    def get_pandas_validators(self, request):
+        """
+        Weak ETag and Last-Modified timestamp for the response, computed
+        from the model version without evaluating the queryset.  Only
+        available when caching is enabled (so that model versions are
+        tracked) and the view renders a queryset with a pandas renderer.
+        """
+        if hasattr(self, "_pandas_validators"):
+            return self._pandas_validators
+
+        self._pandas_validators = None, None
+        renderer = request.accepted_renderer
+        if not self.pandas_cache or not is_pandas_renderer(renderer):
+            return self._pandas_validators
+        if not hasattr(self, "get_queryset"):
+            return self._pandas_validators
+
+        queryset = self.filter_queryset(self.get_queryset())
+        try:
+            sql = str(queryset.query)
+        except EmptyResultSet:
+            sql = ""
+
+        version = cache.get_model_version(
+            queryset.model, self.pandas_cache_alias
+        )
+        etag = cache.make_key(
+            "%s",
+            sql,
+            qualname(type(self)),
+            qualname(self.serializer_class),
+            qualname(self.pandas_serializer_class),
+            qualname(type(renderer)),
+            request.accepted_media_type,
+            request.path,
+            sorted(request.GET.lists()),
+            version,
+        )
+        # Weak, since the ETag does not depend on the content itself
+        self._pandas_validators = "W/" + quote_etag(etag), int(version)
+        return self._pandas_validators
+
+    def get_pandas_conditional_response(self, request):
+        """
+        Return a 304 Not Modified response if the client's copy (as
+        identified by If-None-Match or If-Modified-Since) is still current.
+        """
+        etag, last_modified = self.get_pandas_validators(request)
+        if not etag:
+            return None
+        response = get_conditional_response(
+            request._request, etag=etag, last_modified=last_modified
+        )
+        if response is not None:
+            response["ETag"] = etag
+            response["Last-Modified"] = http_date(last_modified)
+        return response
+
     def get_pandas_filename(self, request, format):
         return None
 
     def get_pandas_headers(self, request):
+        headers = {}
+        etag, last_modified = self.get_pandas_validators(request)
+        if etag:
+            headers["ETag"] = etag
+            headers["Last-Modified"] = http_date(last_modified)
+
         format = request.accepted_renderer.format
         filename = self.get_pandas_filename(request, format)
         if not filename:
-            return {}
+            return headers
 
         extension = "." + format
         if not filename.endswith(extension):
             filename += extension
 
-        return {
-            "Content-Disposition": 'attachment; filename="{}"'.format(filename)
-        }
+        headers["Content-Disposition"] = 'attachment; filename="{}"'.format(
+            filename
+        )
+        return headers
 
     def update_pandas_headers(self, response):
         headers = self.get_pandas_headers(self.request)
@@ -82,12 +302,55 @@ class PandasMixin(object):
             response[key] = val
         return response
 
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(
+            request, response, *args, **kwargs
+        )
+        renderer = getattr(response, "accepted_renderer", None)
+        if (
+            getattr(renderer, "streaming", False)
+            and is_dataframe(getattr(response, "data", None))
+            and status.is_success(response.status_code)
+        ):
+            return self.get_streaming_response(response)
+        return response
+
+    def get_streaming_response(self, response):
+        """
+        Wrap a streaming renderer's output in a StreamingHttpResponse
+        """
+        renderer = response.accepted_renderer
+        content_type = response.accepted_media_type or renderer.media_type
+        if renderer.charset:
+            content_type = "{0}; charset={1}".format(
+                content_type, renderer.charset
+            )
+        streaming_response = StreamingHttpResponse(
+            self.get_streaming_content(response),
+            status=response.status_code,
+            content_type=content_type,
+        )
+        for key, val in response.items():
+            if key.lower() != "content-type":
+                streaming_response[key] = val
+        return streaming_response
+
+    def get_streaming_content(self, response):
+        return response.accepted_renderer.render_stream(
+            response.data,
+            response.accepted_media_type,
+            response.renderer_context,
+        )
+
 
 class PandasViewBase(PandasMixin):
-    renderer_classes = PANDAS_RENDERERS
     pagination_class = None
     template_name = "rest_pandas/viewer.html"
 
+    @classproperty
+    def renderer_classes(cls):
+        return get_pandas_renderers()
+
 
 class PandasSimpleView(PandasViewBase, APIView):
     """
@@ -95,7 +358,11 @@ class PandasSimpleView(PandasViewBase, APIView):
     with a function that returns a list of dicts.
     """
 
-    serializer_class = SimpleSerializer
+    @classproperty
+    def serializer_class(cls):
+        from .serializers import SimpleSerializer
+
+        return SimpleSerializer
 
     def get_data(self, request, *args, **kwargs):
         return []
@@ -114,7 +381,9 @@ class PandasView(PandasViewBase, ListAPIView):
     """
 
     def list(self, request, *args, **kwargs):
-        response = super().list(request, *args, **kwargs)
+        response = self.get_pandas_conditional_response(request)
+        if response is None:
+            response = super().list(request, *args, **kwargs)
         return self.update_pandas_headers(response)
 
 
@@ -124,5 +393,179 @@ class PandasViewSet(PandasViewBase, ListModelMixin, GenericViewSet):
     """
 
     def list(self, request, *args, **kwargs):
-        response = super().list(request, *args, **kwargs)
+        response = self.get_pandas_conditional_response(request)
+        if response is None:
+            response = super().list(request, *args, **kwargs)
+        return self.update_pandas_headers(response)
+
+
+class AsyncPandasMixin(PandasMixin):
+    """
+    Async request handling for ASGI deployments.  The queryset is fetched
+    with the async ORM, while the pandas transform and render steps run in
+    worker threads so that the event loop can serve other requests.
+    """
+
+    # Rows to fetch per database round trip
+    pandas_chunk_size = 2000
+
+    async def dispatch(self, request, *args, **kwargs):
+        # c.f. rest_framework.views.APIView.dispatch()
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            # Authentication, permissions and throttles may use the database
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if isawaitable(response):
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(
+            request, response, *args, **kwargs
+        )
+        if is_pandas_renderer(
+            getattr(self.response, "accepted_renderer", None)
+        ) and not getattr(self.response, "is_rendered", True):
+            await sync_to_async(self.response.render, thread_sensitive=False)()
+        return self.response
+
+    async def aget_cached_dataframe(self, serializer):
+        """
+        Async version of get_cached_dataframe()
+        """
+        key = None
+        if self.pandas_cache:
+            key = await sync_to_async(self.get_pandas_cache_key)(serializer)
+        if key is not None:
+            dataframe = await sync_to_async(cache.get_dataframe)(
+                key, self.pandas_cache_alias
+            )
+            if dataframe is not None:
+                return dataframe
+
+        if is_pandas_serializer(serializer) and await serializer.aload(
+            self.pandas_chunk_size
+        ):
+            # Data is loaded, so the transform does not need the database
+            dataframe = await sync_to_async(
+                serializer.build_dataframe, thread_sensitive=False
+            )()
+        else:
+            dataframe = await sync_to_async(lambda: serializer.data)()
+
+        if key is not None:
+            await sync_to_async(cache.set_dataframe)(
+                key,
+                dataframe,
+                self.pandas_cache_timeout,
+                self.pandas_cache_alias,
+            )
+        return dataframe
+
+    async def alist(self, request, *args, **kwargs):
+        """
+        Async version of list(), c.f. rest_framework.mixins.ListModelMixin
+        """
+        response = await sync_to_async(self.get_pandas_conditional_response)(
+            request
+        )
+        if response is None:
+            page, serializer = await sync_to_async(self.get_list_serializer)()
+            if is_pandas_serializer(serializer):
+                data = await self.aget_cached_dataframe(serializer)
+            else:
+                data = await sync_to_async(lambda: serializer.data)()
+            if page is not None:
+                response = self.get_paginated_response(data)
+            else:
+                response = Response(data)
+        return self.update_pandas_headers(response)
+
+    def get_list_serializer(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return page, self.get_serializer(page, many=True)
+        return None, self.get_serializer(queryset, many=True)
+
+    def get_streaming_content(self, response):
+        return aiterate(super().get_streaming_content(response))
+
+
+class AsyncPandasSimpleView(AsyncPandasMixin, PandasSimpleView):
+    """
+    Async version of PandasSimpleView; get_data may be a coroutine function
+    """
+
+    async def get(self, request, *args, **kwargs):
+        if iscoroutinefunction(self.get_data):
+            data = await self.get_data(request, *args, **kwargs)
+        else:
+            data = await sync_to_async(self.get_data)(
+                request, *args, **kwargs
+            )
+        serializer_class = self.get_serializer_class()
+        serializer = serializer_class(data, many=True)
+        data = await sync_to_async(
+            lambda: serializer.data, thread_sensitive=False
+        )()
+        response = Response(data)
         return self.update_pandas_headers(response)
+
+
+class AsyncPandasView(AsyncPandasMixin, PandasView):
+    """
+    Async version of PandasView
+    """
+
+    async def get(self, request, *args, **kwargs):
+        return await self.alist(request, *args, **kwargs)
+
+
+class AsyncPandasViewSet(AsyncPandasMixin, PandasViewSet):
+    """
+    Async version of PandasViewSet
+    """
+
+    @classonlymethod
+    def as_view(cls, actions=None, **initkwargs):
+        view = super().as_view(actions, **initkwargs)
+
+        # ViewSetMixin.as_view() always creates a sync view function
+        @wraps(view)
+        async def async_view(request, *args, **kwargs):
+            return await view(request, *args, **kwargs)
+
+        return async_view
+
+    def list(self, request, *args, **kwargs):
+        return self.alist(request, *args, **kwargs)
+
+
+async def aiterate(chunks):
+    """
+    Generate each chunk of a (sync) streaming render in a worker thread
+    """
+    chunks = iter(chunks)
+    while True:
+        chunk = await sync_to_async(next, thread_sensitive=False)(
+            chunks, None
+        )
+        if chunk is None:
+            break
+        yield chunk
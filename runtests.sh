@@ -1,4 +1,4 @@
 set -e
 python -m unittest discover -s tests -t . -v
-flake8 tests rest_pandas --exclude migrations
+flake8 tests rest_pandas benchmarks --exclude migrations
 npm run test
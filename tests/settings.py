@@ -17,6 +17,15 @@ DATABASES = {
         "NAME": "rest_pandas_test.sqlite3",
     }
 }
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "pandas": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "pandas",
+    },
+}
 ROOT_URLCONF = "tests.urls"
 STATIC_URL = "/static"
 STATIC_ROOT = "docs/static"
@@ -48,6 +57,22 @@ else:
     HAS_MATPLOTLIB = True
 
 
+try:
+    import pyarrow  # noqa
+except ImportError:
+    HAS_PYARROW = False
+else:
+    HAS_PYARROW = True
+
+
+try:
+    import orjson  # noqa
+except ImportError:
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
+
+
 try:
     import django_pandas  # noqa
 except ImportError:
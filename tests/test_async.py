@@ -0,0 +1,99 @@
+from rest_framework.test import APITestCase
+from tests.testapp.models import TimeSeries, MultiTimeSeries, ComplexTimeSeries
+from tests.testapp.views import AsyncTimeSeriesView
+from django.urls import resolve
+from asgiref.sync import iscoroutinefunction
+
+
+class AsyncTestCase(APITestCase):
+    def setUp(self):
+        data = (
+            ("test1", "2015-01-01", 0.5),
+            ("test1", "2015-01-02", 0.4),
+            ("test1", "2015-01-03", 0.6),
+            ("test2", "2015-01-01", 0.7),
+            ("test2", "2015-01-02", 0.8),
+            ("test2", "2015-01-03", 0.0),
+        )
+        for series, date, value in data:
+            MultiTimeSeries.objects.create(
+                series=series, date=date, value=value
+            )
+            if series == "test1":
+                TimeSeries.objects.create(date=date, value=value)
+            ComplexTimeSeries.objects.create(
+                site="site1",
+                parameter=series,
+                date=date,
+                type="routine",
+                value=value,
+            )
+
+    def test_view_is_async(self):
+        self.assertTrue(AsyncTimeSeriesView.view_is_async)
+        match = resolve("/router/asynctimeseries.csv")
+        self.assertTrue(iscoroutinefunction(match.func))
+
+    async def test_timeseries(self):
+        await self.assert_same("/asynctimeseries.csv", "/timeseries.csv")
+        await self.assert_same("/asynctimeseries.json", "/timeseries.json")
+
+    async def test_viewset(self):
+        await self.assert_same(
+            "/router/asynctimeseries.csv", "/router/timeseries.csv"
+        )
+
+    async def test_simple(self):
+        response = await self.async_client.get("/asyncnomodel.csv")
+        self.assertEqual(
+            response.content.decode("utf-8"),
+            "row,x,y\n0,5,7\n1,3,2\n",
+        )
+
+    async def test_unstacked(self):
+        response = await self.assert_same(
+            "/asyncmultitimeseries.csv", "/multitimeseries.csv"
+        )
+        self.assertIn("ETag", response)
+        # Second request is loaded from the cache
+        await self.assert_same(
+            "/asyncmultitimeseries.csv", "/multitimeseries.csv"
+        )
+
+    async def test_boxplot(self):
+        await self.assert_same(
+            "/asyncmultiboxplot.csv?group=series",
+            "/multiboxplot.csv?group=series",
+        )
+
+    async def test_fields(self):
+        await self.assert_same(
+            "/asynccomplextimeseries.csv?fields=value",
+            "/complextimeseries.csv?fields=value",
+        )
+
+    async def test_streaming(self):
+        response = await self.async_client.get("/asyncstreaming.csv")
+        self.assertTrue(response.streaming)
+        self.assertTrue(response.is_async)
+        content = b"".join(
+            [chunk async for chunk in response.streaming_content]
+        )
+        expected = await self.async_client.get("/timeseries.csv")
+        self.assertEqual(content, expected.content)
+
+    async def test_not_allowed(self):
+        response = await self.async_client.post("/asynctimeseries.csv")
+        self.assertEqual(response.status_code, 405)
+
+    def test_sync_client(self):
+        response = self.client.get("/asynctimeseries.csv")
+        expected = self.client.get("/timeseries.csv")
+        self.assertEqual(response.content, expected.content)
+
+    async def assert_same(self, url, expected_url):
+        response = await self.async_client.get(url)
+        expected = await self.async_client.get(expected_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, expected.content)
+        return response
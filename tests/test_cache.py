@@ -0,0 +1,170 @@
+from rest_framework.test import APITestCase
+from django.core.cache import caches
+from tests.testapp.models import TimeSeries, MultiTimeSeries
+from tests.weather.models import Station, Weather
+from rest_pandas import cache
+from itertable import load_string
+from django.utils.http import http_date
+from unittest.mock import patch
+import time
+
+
+class CacheTestCase(APITestCase):
+    def setUp(self):
+        caches["default"].clear()
+        caches["pandas"].clear()
+        cache.stats.clear()
+        data = (
+            ("2014-01-01", 0.5),
+            ("2014-01-02", 0.4),
+            ("2014-01-03", 0.6),
+        )
+        for date, value in data:
+            TimeSeries.objects.create(date=date, value=value)
+            MultiTimeSeries.objects.create(
+                series="test1", date=date, value=value
+            )
+
+    def test_cache_hit(self):
+        response = self.client.get("/cache.csv")
+        self.assertStats(hits=0, misses=1)
+        with self.assertNumQueries(0):
+            cached = self.client.get("/cache.csv")
+        self.assertStats(hits=1, misses=1)
+        self.assertEqual(response.content, cached.content)
+
+        # Cached DataFrame is reusable across renderers
+        self.client.get("/cache.json")
+        self.assertStats(hits=2, misses=1)
+
+    def test_cache_invalidate(self):
+        response = self.client.get("/cache.csv")
+        self.assertEqual(len(self.load_string(response)), 3)
+
+        TimeSeries.objects.create(date="2014-01-04", value=0.2)
+        response = self.client.get("/cache.csv")
+        self.assertEqual(len(self.load_string(response)), 4)
+        self.assertStats(hits=0, misses=2)
+
+        TimeSeries.objects.filter(date="2014-01-04").delete()
+        response = self.client.get("/cache.csv")
+        self.assertEqual(len(self.load_string(response)), 3)
+        self.assertStats(hits=0, misses=3)
+
+    def test_invalidate_related(self):
+        version = cache.get_model_version(Weather)
+        time.sleep(0.01)
+        Station.objects.create(name="Test", code="TEST")
+        self.assertNotEqual(version, cache.get_model_version(Weather))
+
+    def test_untracked_model(self):
+        from django.contrib.auth.models import Group
+
+        self.assertNotIn(Group, cache.dependents)
+        with patch.object(cache, "get_cache") as get_cache:
+            Group.objects.create(name="test")
+        get_cache.assert_not_called()
+
+    def test_cache_unstacked(self):
+        expected = self.client.get("/multitimeseries.csv")
+        self.client.get("/multicache.csv")
+        response = self.client.get("/multicache.csv")
+        self.assertEqual(expected.content, response.content)
+        self.assertStats(hits=1, misses=1)
+
+        self.client.get("/multicache.csv?orient=split")
+        self.assertStats(hits=1, misses=2)
+
+    def test_render_cache(self):
+        response = self.client.get("/rendercache.csv")
+        self.assertStats(render_hits=0, render_misses=1)
+        cached = self.client.get("/rendercache.csv")
+        self.assertStats(render_hits=1, render_misses=1)
+        self.assertEqual(response.content, cached.content)
+
+        TimeSeries.objects.create(date="2014-01-04", value=0.2)
+        response = self.client.get("/rendercache.csv")
+        self.assertStats(render_hits=1, render_misses=2)
+        self.assertEqual(len(self.load_string(response)), 4)
+
+    def test_etag(self):
+        response = self.client.get("/cache.csv")
+        etag = response["ETag"]
+        self.assertTrue(etag.startswith('W/"'))
+        self.assertEqual(etag, self.client.get("/cache.csv")["ETag"])
+        self.assertNotEqual(etag, self.client.get("/cache.json")["ETag"])
+
+        with self.assertNumQueries(0):
+            response = self.client.get(
+                "/cache.csv", HTTP_IF_NONE_MATCH=etag
+            )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+        TimeSeries.objects.create(date="2014-01-04", value=0.2)
+        response = self.client.get("/cache.csv", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(len(self.load_string(response)), 4)
+
+    def test_etag_cache_alias(self):
+        response = self.client.get("/cachealias.csv")
+        etag = response["ETag"]
+        response = self.client.get("/cachealias.csv", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        time.sleep(0.01)
+        TimeSeries.objects.create(date="2014-01-04", value=0.2)
+        response = self.client.get("/cachealias.csv", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(len(self.load_string(response)), 4)
+
+    def test_last_modified(self):
+        response = self.client.get("/cache.csv")
+        last_modified = response["Last-Modified"]
+        response = self.client.get(
+            "/cache.csv", HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+        self.assertEqual(response.status_code, 304)
+
+        response = self.client.get(
+            "/cache.csv", HTTP_IF_MODIFIED_SINCE=http_date(time.time() - 60)
+        )
+        self.assertEqual(response.status_code, 200)
+
+        # Changes within the same second are detected as well
+        TimeSeries.objects.create(date="2014-01-04", value=0.2)
+        response = self.client.get(
+            "/cache.csv", HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["Last-Modified"], last_modified)
+
+    def test_version_timeout(self):
+        with patch("rest_pandas.settings.CACHE_TIMEOUT", 0.5):
+            caches["default"].clear()
+            etag = self.client.get("/cache.csv")["ETag"]
+            # queryset.update() does not send signals
+            TimeSeries.objects.update(value=0)
+            response = self.client.get("/cache.csv", HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 304)
+
+            time.sleep(1.1)
+            response = self.client.get("/cache.csv", HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(self.load_string(response)[0].value, "0.0")
+
+    def test_no_etag(self):
+        response = self.client.get("/timeseries.csv")
+        self.assertNotIn("ETag", response)
+
+    def assertStats(self, **expected):
+        stats = cache.get_stats()
+        self.assertEqual(
+            expected, {name: stats[name] for name in expected}
+        )
+
+    def load_string(self, response):
+        return load_string(response.content.decode("utf-8"))
@@ -1,8 +1,16 @@
 import unittest
 from rest_framework.test import APITestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from tests.testapp.models import ComplexTimeSeries
 from rest_pandas.test import parse_csv
-from .settings import HAS_MATPLOTLIB
+from io import BytesIO
+import pandas as pd
+
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
 
 
 class ComplexTestCase(APITestCase):
@@ -98,6 +106,160 @@ class ComplexTestCase(APITestCase):
         self.assertEqual(d2["date"], "2015-01-05")
         self.assertEqual(d2["value"], 0.8)
 
+    def test_complex_series_columnar(self):
+        expected = self.client.get("/complextimeseries.csv")
+        response = self.client.get("/complexcolumnar.csv")
+        self.assertEqual(
+            expected.content.decode("utf-8"),
+            response.content.decode("utf-8"),
+        )
+
+    def test_complex_series_categorical(self):
+        for name, expected_name, query in (
+            ("complexcategorical", "complextimeseries", ""),
+            ("complexcategoricalscatter", "complexscatter", ""),
+            ("complexcategoricalboxplot", "complexboxplot", ""),
+            ("complexcategoricalboxplot", "complexboxplot", "group=series"),
+        ):
+            for format in "csv", "json":
+                response = self.client.get(
+                    "/%s.%s?%s" % (name, format, query)
+                )
+                expected = self.client.get(
+                    "/%s.%s?%s" % (expected_name, format, query)
+                )
+                self.assertEqual(expected.content, response.content)
+
+    def test_complex_series_copy_on_write(self):
+        for url in ("/complextimeseries.csv", "/complexscatter.csv"):
+            expected = self.client.get(url)
+            with pd.option_context("mode.copy_on_write", True):
+                response = self.client.get(url)
+            self.assertEqual(expected.content, response.content)
+
+        # Missing units are filled with "-"
+        with pd.option_context("mode.copy_on_write", True):
+            response = self.client.get("/complextimeseries.csv")
+        self.assertIn(b"\nunits,,-,-,cfs,cfs", response.content)
+
+    def test_complex_series_streaming(self):
+        expected = self.client.get("/complextimeseries.csv")
+        response = self.client.get("/complexstreaming.csv")
+        self.assertTrue(response.streaming)
+        self.assertEqual(
+            expected.content.decode("utf-8"),
+            b"".join(response.streaming_content).decode("utf-8"),
+        )
+
+    def test_complex_series_fields(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/complextimeseries.csv?fields=value")
+        self.assertNotIn("flag", queries[0]["sql"])
+        self.assertEqual(
+            """,,value,value,value,value
+            units,,-,-,cfs,cfs
+            parameter,,height,height,flow,flow
+            site,,site1,site2,site1,site2
+            date,type,,,,
+            2015-01-01,routine,0.5,1.0,,0.0
+            2015-01-01,special,,,0.7,
+            2015-01-02,routine,0.4,1.1,0.8,0.7
+            2015-01-03,routine,0.6,,0.0,0.2
+            2015-01-04,routine,,,0.9,0.3
+            2015-01-04,special,0.2,,,
+            2015-01-05,routine,0.1,1.5,0.3,0.8
+            """.replace(
+                " ", ""
+            ),
+            response.content.decode("utf-8"),
+        )
+
+        response = self.client.get("/complexcolumnar.csv?columns=value")
+        self.assertEqual(
+            self.client.get("/complextimeseries.csv?fields=value").content,
+            response.content,
+        )
+
+    def test_complex_series_unknown_field(self):
+        response = self.client.get("/complextimeseries.csv?fields=value,qual")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.content.decode("utf-8"), "Error: Unknown field(s): qual"
+        )
+
+    def test_complex_series_resample(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/complextimeseries.csv?resample=1W")
+        self.assertIn("GROUP BY", queries[0]["sql"])
+        self.assertEqual(
+            """,,value,value,value,value
+            units,,-,-,cfs,cfs
+            parameter,,height,height,flow,flow
+            site,,site1,site2,site1,site2
+            date,type,,,,
+            2014-12-29,routine,0.5,1.05,0.5666666666666668,0.3
+            2014-12-29,special,0.2,,0.7,
+            2015-01-05,routine,0.1,1.5,0.3,0.8
+            """.replace(
+                " ", ""
+            ),
+            response.content.decode("utf-8"),
+        )
+
+    def test_complex_series_resample_fallback(self):
+        # "last" is not available in SQL
+        url = "/complextimeseries.csv?resample=1W&aggregate=last"
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertNotIn("GROUP BY", queries[0]["sql"])
+        self.assertEqual(
+            """,,value,value,value,value,flag
+            units,,-,-,cfs,cfs,cfs
+            parameter,,height,height,flow,flow,flow
+            site,,site1,site2,site1,site2,site1
+            date,type,,,,,
+            2014-12-29,routine,0.6,1.1,0.9,0.3,Q
+            2014-12-29,special,0.2,,0.7,,
+            2015-01-05,routine,0.1,1.5,0.3,0.8,
+            """.replace(
+                " ", ""
+            ),
+            response.content.decode("utf-8"),
+        )
+
+    def test_complex_series_resample_min_max(self):
+        # Multi-unit frequencies are resampled with pandas, which should skip
+        # the (nullable) text column like the database does
+        header = """,,value,value,value,value
+            units,,-,-,cfs,cfs
+            parameter,,height,height,flow,flow
+            site,,site1,site2,site1,site2
+            date,type,,,,
+        """
+        expected = {
+            "min": """
+                2015-01-01,routine,0.4,1.0,0.8,0.0
+                2015-01-01,special,,,0.7,
+                2015-01-03,routine,0.6,,0.0,0.2
+                2015-01-03,special,0.2,,,
+                2015-01-05,routine,0.1,1.5,0.3,0.8
+            """,
+            "max": """
+                2015-01-01,routine,0.5,1.1,0.8,0.7
+                2015-01-01,special,,,0.7,
+                2015-01-03,routine,0.6,,0.9,0.3
+                2015-01-03,special,0.2,,,
+                2015-01-05,routine,0.1,1.5,0.3,0.8
+            """,
+        }
+        for aggregate, rows in expected.items():
+            url = "/complextimeseries.csv?resample=2d&aggregate=" + aggregate
+            response = self.client.get(url)
+            self.assertEqual(
+                (header + rows.lstrip()).replace(" ", ""),
+                response.content.decode("utf-8"),
+            )
+
     def test_complex_scatter(self):
         response = self.client.get("/complexscatter.csv")
         self.assertEqual(
@@ -166,7 +328,6 @@ class ComplexTestCase(APITestCase):
             datasets,
         )
 
-    @unittest.skipUnless(HAS_MATPLOTLIB, "requires matplotlib")
     def test_complex_boxplot(self):
         # Default group=series-year
         response = self.client.get("/complexboxplot.csv")
@@ -219,7 +380,6 @@ class ComplexTestCase(APITestCase):
         self.assertEqual(stats["value-mean"], 0.4)
         self.assertEqual(stats["value-whishi"], 0.8)
 
-    @unittest.skipUnless(HAS_MATPLOTLIB, "requires matplotlib")
     def test_complex_boxplot_series(self):
         response = self.client.get("/complexboxplot.csv?group=series")
         datasets = self.parse_csv(response)
@@ -265,7 +425,6 @@ class ComplexTestCase(APITestCase):
         self.assertEqual(stats["value-mean"], 0.4)
         self.assertEqual(stats["value-whishi"], 0.8)
 
-    @unittest.skipUnless(HAS_MATPLOTLIB, "requires matplotlib")
     def test_complex_boxplot_month_group(self):
         response = self.client.get("/complexboxplot.csv?group=series-month")
         datasets = self.parse_csv(response)
@@ -311,7 +470,6 @@ class ComplexTestCase(APITestCase):
         self.assertEqual(stats["value-mean"], 0.4)
         self.assertEqual(stats["value-whishi"], 0.8)
 
-    @unittest.skipUnless(HAS_MATPLOTLIB, "requires matplotlib")
     def test_complex_boxplot_year(self):
         response = self.client.get("/complexboxplot.csv?group=year")
         datasets = self.parse_csv(response)
@@ -322,7 +480,38 @@ class ComplexTestCase(APITestCase):
         self.assertEqual(round(stats["value-mean"], 5), 0.56111)
         self.assertEqual(stats["value-whishi"], 1.5)
 
-    @unittest.skipUnless(HAS_MATPLOTLIB, "requires matplotlib")
+    def test_complex_boxplot_quarter(self):
+        response = self.client.get("/complexboxplot.csv?group=quarter")
+        datasets = self.parse_csv(response)
+        self.assertEqual(len(datasets), 1)
+        stats = datasets[0]["data"][0]
+        self.assertEqual(stats["quarter"], 1)
+        self.assertEqual(round(stats["value-mean"], 5), 0.56111)
+
+    def test_complex_boxplot_week(self):
+        response = self.client.get("/complexboxplot.csv?group=week")
+        datasets = self.parse_csv(response)
+        self.assertEqual(len(datasets), 1)
+        week1, week2 = datasets[0]["data"]
+        self.assertEqual(week1["week"], 1)
+        self.assertEqual(week1["value-count"], 14)
+        self.assertEqual(week2["week"], 2)
+        self.assertEqual(week2["value-count"], 4)
+        self.assertEqual(week2["value-whislo"], 0.1)
+        self.assertEqual(week2["value-mean"], 0.675)
+        self.assertEqual(week2["value-whishi"], 1.5)
+
+    def test_complex_boxplot_series_day(self):
+        response = self.client.get("/complexboxplot.csv?group=series-day")
+        datasets = self.parse_csv(response)
+        self.assertEqual(len(datasets), 4)
+        for dataset in datasets:
+            days = [stats["day"] for stats in dataset["data"]]
+            if dataset["site"] == "site2" and dataset["parameter"] == "height":
+                self.assertEqual(days, ["1", "2", "5"])
+            else:
+                self.assertEqual(days, ["1", "2", "3", "4", "5"])
+
     def test_complex_boxplot_extra(self):
         self.create_row(
             "site1", "flow", "cfs", "2015-01-01", "routine", 0.3, None
@@ -332,5 +521,59 @@ class ComplexTestCase(APITestCase):
         response = self.client.get("/complexboxplotextra.csv")
         self.assertEqual(1, len(response.data))
 
+    def test_complex_large_excel(self):
+        self.assert_large_excel("openpyxl")
+
+    @unittest.skipUnless(xlsxwriter, "requires xlsxwriter")
+    def test_complex_large_excel_xlsxwriter(self):
+        self.assert_large_excel("xlsxwriter")
+
+    def assert_large_excel(self, engine):
+        from openpyxl import load_workbook
+
+        expected = load_workbook(
+            BytesIO(self.client.get("/complextimeseries.xlsx").content)
+        ).active
+        response = self.client.get("/complexlargeexcel.xlsx?engine=" + engine)
+        self.assertTrue(response.streaming)
+        workbook = load_workbook(BytesIO(b"".join(response.streaming_content)))
+
+        # 5 header rows + 7 data rows, 3 data rows per sheet
+        self.assertEqual(workbook.sheetnames, ["Sheet1", "Sheet2", "Sheet3"])
+        expected_rows = [
+            [cell.value for cell in row] for row in expected.iter_rows()
+        ]
+        header = expected_rows[:5]
+        data = []
+        for sheet in workbook.worksheets:
+            rows = [[cell.value for cell in row] for row in sheet.iter_rows()]
+            self.assertEqual(header, rows[:5])
+            self.assertEqual(
+                {
+                    str(r)
+                    for r in expected.merged_cells.ranges
+                    if r.max_row <= 5
+                },
+                {str(r) for r in sheet.merged_cells.ranges},
+            )
+            data += rows[5:]
+
+        self.assertEqual(len(data), 7)
+        for row, expected_row in zip(data, expected_rows[5:]):
+            # to_excel() merges repeated index values, large export does not
+            self.assertEqual(row[2:], expected_row[2:])
+        self.assertEqual(
+            [row[0] for row in data],
+            [
+                "2015-01-01",
+                "2015-01-01",
+                "2015-01-02",
+                "2015-01-03",
+                "2015-01-04",
+                "2015-01-04",
+                "2015-01-05",
+            ],
+        )
+
     def parse_csv(self, response):
         return parse_csv(response.content.decode("utf-8"))
@@ -1,13 +1,24 @@
 from rest_framework.test import APITestCase
 from tests.testapp.models import TimeSeries
+from rest_pandas.renderers import PandasFileRenderer, PandasExcelRenderer
 from itertable import load_file
+from unittest.mock import patch
+from io import BytesIO
+import tempfile
 import unittest
+import pandas
+import os
 
 try:
     import xlwt
 except ImportError:
     xlwt = None
 
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
 
 class ExcelTestCase(APITestCase):
     def setUp(self):
@@ -51,3 +62,51 @@ class ExcelTestCase(APITestCase):
         self.assertEqual(len(data), 5)
         self.assertEqual(data[0].date.year, 2014)
         self.assertEqual(data[0].value, 0.5)
+
+    def test_xlsx_in_memory(self):
+        with patch("rest_pandas.renderers.mkstemp") as mkstemp:
+            response = self.client.get("/excelengine.xlsx")
+        mkstemp.assert_not_called()
+        data = pandas.read_excel(BytesIO(response.content))
+        self.assertEqual(len(data), 5)
+        self.assertEqual(data["value"][0], 0.5)
+
+    @unittest.skipUnless(xlsxwriter, "requires xlsxwriter")
+    def test_xlsx_engine(self):
+        response = self.client.get("/excelengine.xlsx?engine=xlsxwriter")
+        data = pandas.read_excel(BytesIO(response.content))
+        self.assertEqual(len(data), 5)
+        self.assertEqual(data["value"][0], 0.5)
+
+    @unittest.skipUnless(xlsxwriter, "requires xlsxwriter")
+    def test_xlsx_constant_memory(self):
+        class ConstantMemoryRenderer(PandasExcelRenderer):
+            engine = "xlsxwriter"
+            engine_kwargs = {"options": {"constant_memory": True}}
+
+        df = pandas.DataFrame({"x": [1, 2, 3], "y": [4, 5, 6]})
+        with self.assertWarns(UserWarning):
+            output = ConstantMemoryRenderer().render(df)
+        data = pandas.read_excel(BytesIO(output), index_col=0)
+        self.assertEqual(data["x"].tolist(), [1, 2, 3])
+        self.assertEqual(data["y"].tolist(), [4, 5, 6])
+
+    def test_file_renderer_cleanup(self):
+        filenames = []
+
+        def mkstemp(**kwargs):
+            file, filename = tempfile.mkstemp(**kwargs)
+            filenames.append(filename)
+            return file, filename
+
+        class BrokenRenderer(PandasFileRenderer):
+            format = "csv"
+
+            def get_pandas_kwargs(self, data, renderer_context):
+                return {"invalid_argument": True}
+
+        with patch("rest_pandas.renderers.mkstemp", mkstemp):
+            with self.assertRaises(TypeError):
+                BrokenRenderer().render(pandas.DataFrame({"x": [1]}))
+        self.assertEqual(len(filenames), 1)
+        self.assertFalse(os.path.exists(filenames[0]))
@@ -0,0 +1,138 @@
+import unittest
+from rest_framework.test import APITestCase
+from tests.testapp.models import MultiTimeSeries
+from rest_pandas import executor
+from io import BytesIO
+from unittest.mock import patch
+from pandas import DataFrame, read_excel
+from pandas.testing import assert_frame_equal
+import numpy as np
+import os
+import threading
+import time
+from .settings import HAS_MATPLOTLIB
+
+
+def sleep_getpid(seconds):
+    time.sleep(seconds)
+    return os.getpid()
+
+
+def fail():
+    raise RuntimeError("failed in %s" % os.getpid())
+
+
+class ExecutorTestCase(APITestCase):
+    def setUp(self):
+        data = (
+            ("test1", "2015-01-01", 0.5),
+            ("test1", "2015-01-02", 0.4),
+            ("test1", "2015-01-03", 0.6),
+            ("test2", "2015-01-01", 0.7),
+            ("test2", "2015-01-02", 0.8),
+            ("test2", "2015-01-03", 0.0),
+        )
+        for series, date, value in data:
+            MultiTimeSeries.objects.create(
+                series=series, date=date, value=value
+            )
+
+    def tearDown(self):
+        executor.shutdown()
+
+    def enabled(self, **kwargs):
+        kwargs.setdefault("EXECUTOR", True)
+        kwargs.setdefault("EXECUTOR_MIN_ROWS", 0)
+        return patch.multiple("rest_pandas.settings", **kwargs)
+
+    def test_disabled(self):
+        self.assertEqual(executor.run(os.getpid), os.getpid())
+
+    def test_run(self):
+        with self.enabled():
+            self.assertNotEqual(executor.run(os.getpid), os.getpid())
+
+    def test_dataframe(self):
+        dataframe = DataFrame(
+            {
+                "value": np.arange(100000, dtype=float),
+                "label": ["a", "b"] * 50000,
+            }
+        )
+        with self.enabled():
+            result = executor.run(DataFrame.copy, dataframe)
+        assert_frame_equal(result, dataframe)
+
+    def test_unpicklable(self):
+        with self.enabled():
+            self.assertEqual(executor.run(lambda: os.getpid()), os.getpid())
+
+    def test_timeout(self):
+        with self.enabled(EXECUTOR_TIMEOUT=0.5):
+            with self.assertRaises(executor.ExecutorTimeout):
+                executor.run(time.sleep, 10)
+            # A new pool is started for the next call
+            self.assertEqual(executor.run(abs, -1), 1)
+
+    def test_timeout_other_task(self):
+        errors = []
+
+        def timeout():
+            try:
+                executor.run(time.sleep, 10)
+            except executor.ExecutorTimeout as e:
+                errors.append(e)
+
+        with self.enabled(EXECUTOR_TIMEOUT=2, EXECUTOR_MAX_WORKERS=2):
+            thread = threading.Thread(target=timeout)
+            thread.start()
+            time.sleep(1)
+            # Interrupted when the pool is stopped, and re-run in process
+            self.assertEqual(executor.run(sleep_getpid, 1.5), os.getpid())
+            thread.join()
+        self.assertEqual(len(errors), 1)
+
+    def test_pool_shutdown(self):
+        with self.enabled():
+            # e.g. after another thread's timeout
+            executor.get_pool().shutdown()
+            self.assertEqual(executor.run(os.getpid), os.getpid())
+            # A new pool is started for the next call
+            self.assertNotEqual(executor.run(os.getpid), os.getpid())
+
+    def test_runtime_error(self):
+        with self.enabled():
+            pid = executor.run(os.getpid)
+            with self.assertRaisesRegex(RuntimeError, "failed in %s" % pid):
+                executor.run(fail)
+
+    def test_boxplot(self):
+        expected = self.client.get("/multiboxplot.csv")
+        with self.enabled():
+            with patch.object(executor, "run", wraps=executor.run) as run:
+                response = self.client.get("/multiboxplot.csv")
+        run.assert_called()
+        self.assertEqual(response.content, expected.content)
+
+    def test_min_rows(self):
+        with self.enabled(EXECUTOR_MIN_ROWS=100):
+            with patch.object(executor, "run") as run:
+                self.client.get("/multiboxplot.csv")
+        run.assert_not_called()
+
+    def test_xlsx(self):
+        expected = self.client.get("/multitimeseries.xlsx")
+        with self.enabled():
+            response = self.client.get("/multitimeseries.xlsx")
+        assert_frame_equal(
+            read_excel(BytesIO(response.content)),
+            read_excel(BytesIO(expected.content)),
+        )
+
+    @unittest.skipUnless(HAS_MATPLOTLIB, "requires matplotlib")
+    def test_png(self):
+        expected = self.client.get("/multitimeseries.png")
+        with self.enabled():
+            response = self.client.get("/multitimeseries.png")
+        self.assertEqual(response.content[1:4], b"PNG")
+        self.assertEqual(len(response.content), len(expected.content))
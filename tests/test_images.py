@@ -1,6 +1,17 @@
 import unittest
 from rest_framework.test import APITestCase
 from tests.testapp.models import TimeSeries
+from rest_pandas import (
+    PandasBaseRenderer,
+    PandasImageRenderer,
+    PandasPNGRenderer,
+    PandasSVGRenderer,
+)
+from unittest.mock import patch
+from pandas import DataFrame
+import numpy as np
+import struct
+import sys
 from .settings import HAS_MATPLOTLIB
 
 
@@ -26,3 +37,90 @@ class ImageTestCase(APITestCase):
         response = self.client.get("/timeseries.svg")
         header = response.content[2:5]
         self.assertEqual(header, b"xml")
+
+    def test_figure_pool(self):
+        pool = PandasImageRenderer.figure_pool
+        pool.clear()
+        for i in range(pool.size + 2):
+            self.client.get("/timeseries.png")
+            self.client.get("/timeseries.svg")
+        self.assertEqual(len(pool.figures), 1)
+        self.assertEqual(pool.figures[0].axes, [])
+        if "matplotlib.pyplot" in sys.modules:
+            plt = sys.modules["matplotlib.pyplot"]
+            self.assertEqual(plt.get_fignums(), [])
+
+    def test_figure_released_on_error(self):
+        pool = PandasImageRenderer.figure_pool
+        pool.clear()
+        with patch.object(
+            PandasImageRenderer, "render_dataframe", side_effect=ValueError
+        ):
+            with self.assertRaises(ValueError):
+                self.client.get("/timeseries.png")
+        self.assertEqual(len(pool.figures), 1)
+        self.assertEqual(pool.figures[0].axes, [])
+        response = self.client.get("/timeseries.png")
+        self.assertEqual(response.content[1:4], b"PNG")
+
+    def test_png_size(self):
+        response = self.client.get("/timeseries.png?width=320&height=200")
+        self.assertEqual(self.get_png_size(response.content), (320, 200))
+
+        response = self.client.get(
+            "/timeseries.png?width=320&height=200&dpi=200"
+        )
+        self.assertEqual(self.get_png_size(response.content), (320, 200))
+
+        # Invalid and excessive values
+        response = self.client.get("/timeseries.png?width=abc&height=99999")
+        self.assertEqual(self.get_png_size(response.content), (640, 4000))
+
+    def test_view_options(self):
+        response = self.client.get("/image.png")
+        self.assertEqual(self.get_png_size(response.content), (300, 200))
+        response = self.client.get("/image.png?width=400&kind=invalid")
+        self.assertEqual(self.get_png_size(response.content), (400, 200))
+
+    def test_kind(self):
+        with patch.object(DataFrame, "plot") as plot:
+            self.client.get("/timeseries.png?kind=area")
+        self.assertEqual(plot.call_args.kwargs["kind"], "area")
+
+    def test_downsample(self):
+        data = self.get_large_dataframe()
+        with patch.object(PandasBaseRenderer, "render_dataframe") as render:
+            self.render(PandasPNGRenderer(), data)
+            self.assertEqual(len(render.call_args.args[0]), 640)
+            self.render(PandasPNGRenderer(), data, "kind=bar")
+            self.assertEqual(len(render.call_args.args[0]), len(data))
+
+    def test_svg_rasterize(self):
+        data = self.get_large_dataframe()
+        svg = self.render(PandasSVGRenderer(), data, "max_points=20000")
+        self.assertIn(b"<image", svg)
+        small_svg = self.render(PandasSVGRenderer(), data)
+        self.assertNotIn(b"<image", small_svg)
+        self.assertLess(len(small_svg), len(svg))
+
+    def test_matplotlib_backend(self):
+        with self.assertWarns(UserWarning):
+
+            class CairoRenderer(PandasPNGRenderer):
+                matplotlib_backend = "Cairo"
+
+        png = self.render(CairoRenderer(), self.get_large_dataframe())
+        self.assertEqual(png[:8], b"\x89PNG\r\n\x1a\n")
+
+    def get_large_dataframe(self):
+        return DataFrame(
+            {"value": np.sin(np.arange(20000) / 100)},
+            index=np.arange(20000),
+        )
+
+    def render(self, renderer, data, query=""):
+        request = self.client.get("/timeseries.csv?" + query).wsgi_request
+        return renderer.render(data, renderer.media_type, {"request": request})
+
+    def get_png_size(self, content):
+        return struct.unpack(">II", content[16:24])
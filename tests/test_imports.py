@@ -0,0 +1,34 @@
+import subprocess
+import sys
+import unittest
+
+
+SCRIPT = """
+import sys
+import django
+from django.conf import settings
+settings.configure(INSTALLED_APPS=["rest_framework", "rest_pandas"])
+django.setup()
+import rest_pandas.views
+print("pandas" in sys.modules)
+"""
+
+
+class ImportTestCase(unittest.TestCase):
+    def test_lazy_imports(self):
+        result = subprocess.run(
+            [sys.executable, "-c", SCRIPT],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "False")
+
+    def test_exports(self):
+        import rest_pandas
+
+        for name in rest_pandas.__all__:
+            self.assertTrue(getattr(rest_pandas, name))
+        self.assertIn("PandasView", dir(rest_pandas))
+        with self.assertRaises(AttributeError):
+            rest_pandas.PandasMissing
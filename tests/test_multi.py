@@ -3,9 +3,13 @@ from rest_framework.test import APITestCase
 from tests.testapp.models import MultiTimeSeries
 from tests.testapp.serializers import NotUnstackableSerializer
 from rest_pandas.test import parse_csv
+from rest_pandas import PandasBoxplotSerializer
 from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from unittest.mock import patch
 import os
-from .settings import HAS_MATPLOTLIB, HAS_DJANGO_5
+from .settings import HAS_DJANGO_5
 import pandas
 
 
@@ -72,6 +76,40 @@ class MultiTestCase(APITestCase):
         ).read()
         self.assertHTMLEqual(expected, response.content.decode("utf-8"))
 
+    def test_multi_series_resample(self):
+        response = self.client.get("/multitimeseries.csv?resample=2D")
+        self.assertEqual(
+            """,value,value
+            series,test1,test2
+            date,,
+            2015-01-01,0.45,0.75
+            2015-01-03,0.4,0.45
+            2015-01-05,0.1,0.3
+            """.replace(
+                " ", ""
+            ),
+            response.content.decode("utf-8"),
+        )
+
+    def test_multi_series_lttb(self):
+        url = "/multitimeseries.csv?resample=lttb"
+        response = self.client.get(url + "&points=3")
+        self.assertEqual(
+            """,value,value
+            series,test1,test2
+            date,,
+            2015-01-01,0.5,0.7
+            2015-01-03,0.6,0.0
+            2015-01-05,0.1,0.3
+            """.replace(
+                " ", ""
+            ),
+            response.content.decode("utf-8"),
+        )
+
+        response = self.client.get(url + "&points=2")
+        self.assertEqual(response.status_code, 400)
+
     def test_multi_scatter(self):
         response = self.client.get("/multiscatter.csv")
         header = ",test1-value,test2-value\ndate,,"
@@ -89,7 +127,6 @@ class MultiTestCase(APITestCase):
             response.content.decode("utf-8"),
         )
 
-    @unittest.skipUnless(HAS_MATPLOTLIB, "requires matplotlib")
     def test_multi_boxplot(self):
         # Default: group=series-year
         response = self.client.get("/multiboxplot.csv")
@@ -114,7 +151,39 @@ class MultiTestCase(APITestCase):
         self.assertEqual(round(stats["value-mean"], 8), 0.54)
         self.assertEqual(stats["value-whishi"], 0.9)
 
-    @unittest.skipUnless(HAS_MATPLOTLIB, "requires matplotlib")
+    @unittest.skipUnless(
+        connection.vendor == "postgresql", "requires PostgreSQL"
+    )
+    def test_multi_boxplot_database(self):
+        MultiTimeSeries.objects.create(
+            series="test1", date="2016-01-01", value=3.5
+        )
+        for group in ("series", "series-year", "year", "month"):
+            url = "/multiboxplot.csv?group=" + group
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertIn("percentile_cont", queries[0]["sql"])
+            with patch.object(
+                PandasBoxplotSerializer, "database_boxplots", False
+            ):
+                expected = self.client.get(url)
+            # Means may differ in the last digit
+            datasets = self.parse_csv(response)
+            expected = self.parse_csv(expected)
+            self.assertEqual(len(datasets), len(expected))
+            for dataset, expected_dataset in zip(datasets, expected):
+                rows = dataset.pop("data")
+                expected_rows = expected_dataset.pop("data")
+                self.assertEqual(dataset, expected_dataset)
+                self.assertEqual(len(rows), len(expected_rows))
+                for row, expected_row in zip(rows, expected_rows):
+                    self.assertEqual(row.keys(), expected_row.keys())
+                    for key, value in row.items():
+                        if isinstance(value, float):
+                            self.assertAlmostEqual(value, expected_row[key])
+                        else:
+                            self.assertEqual(value, expected_row[key])
+
     def test_multi_boxplot_series(self):
         response = self.client.get("/multiboxplot.csv?group=series")
         datasets = self.parse_csv(response)[0]["data"]
@@ -136,7 +205,6 @@ class MultiTestCase(APITestCase):
         self.assertEqual(round(stats["value-mean"], 8), 0.54)
         self.assertEqual(stats["value-whishi"], 0.9)
 
-    @unittest.skipUnless(HAS_MATPLOTLIB, "requires matplotlib")
     def test_multi_boxplot_series_month(self):
         response = self.client.get("/multiboxplot.csv?group=series-month")
 
@@ -160,7 +228,6 @@ class MultiTestCase(APITestCase):
         self.assertEqual(round(stats["value-mean"], 8), 0.54)
         self.assertEqual(stats["value-whishi"], 0.9)
 
-    @unittest.skipUnless(HAS_MATPLOTLIB, "requires matplotlib")
     def test_multi_boxplot_year(self):
         response = self.client.get("/multiboxplot.csv?group=year")
 
@@ -0,0 +1,188 @@
+from rest_framework.test import APITestCase
+from tests.testapp.models import TimeSeries, MultiTimeSeries, ComplexTimeSeries
+from rest_pandas.test import parse_csv
+from itertable import load_string
+
+
+class PaginationTestCase(APITestCase):
+    def setUp(self):
+        data = (
+            ("2014-01-01", 0.5),
+            ("2014-01-02", 0.4),
+            ("2014-01-03", 0.6),
+            ("2014-01-04", 0.2),
+            ("2014-01-05", 0.1),
+        )
+        for date, value in data:
+            TimeSeries.objects.create(date=date, value=value)
+            MultiTimeSeries.objects.create(
+                series="test1", date=date, value=value
+            )
+            MultiTimeSeries.objects.create(
+                series="test2", date=date, value=value * 2
+            )
+
+    def test_no_limit(self):
+        response = self.client.get("/paginated.csv")
+        self.assertEqual(len(self.load_string(response)), 5)
+        self.assertNotIn("X-Total-Count", response)
+        self.assertNotIn("Link", response)
+
+    def test_limit_offset(self):
+        response = self.client.get("/paginated.csv?limit=2")
+        data = self.load_string(response)
+        self.assertEqual([row.id for row in data], ["1", "2"])
+        self.assertEqual(response["X-Total-Count"], "5")
+        self.assertEqual(
+            response["Link"],
+            '<http://testserver/paginated.csv?limit=2&offset=2>; rel="next"',
+        )
+
+        response = self.client.get("/paginated.csv?limit=2&offset=4")
+        data = self.load_string(response)
+        self.assertEqual([row.id for row in data], ["5"])
+        self.assertEqual(response["X-Total-Count"], "5")
+        self.assertNotIn("X-Next-Cursor", response)
+        self.assertEqual(
+            response["Link"],
+            '<http://testserver/paginated.csv?limit=2&offset=2>; rel="prev"',
+        )
+
+    def test_keyset(self):
+        ids = []
+        url = "/paginated.csv?limit=2"
+        pages = 0
+        while url:
+            response = self.client.get(url)
+            ids += [row.id for row in self.load_string(response)]
+            self.assertEqual(response["X-Total-Count"], "5")
+            pages += 1
+            cursor = response.get("X-Next-Cursor")
+            url = cursor and "/paginated.csv?limit=2&after=" + cursor
+        self.assertEqual(pages, 3)
+        self.assertEqual(ids, ["1", "2", "3", "4", "5"])
+
+    def test_invalid_cursor(self):
+        response = self.client.get("/paginated.csv?limit=2&after=invalid")
+        self.assertEqual(response.status_code, 404)
+
+    def test_unstacked(self):
+        # Pages contain whole dates, not rows
+        response = self.client.get("/multipaginated.csv?limit=2&offset=1")
+        self.assertEqual(response["X-Total-Count"], "5")
+        self.assertEqual(
+            """,value,value
+            series,test1,test2
+            date,,
+            2014-01-02,0.4,0.8
+            2014-01-03,0.6,1.2
+            """.replace(
+                " ", ""
+            ),
+            response.content.decode("utf-8"),
+        )
+
+        cursor = response["X-Next-Cursor"]
+        response = self.client.get(
+            "/multipaginated.csv?limit=10&after=" + cursor
+        )
+        self.assertNotIn("X-Next-Cursor", response)
+        datasets = parse_csv(response.content.decode("utf-8"))
+        for dataset in datasets:
+            self.assertEqual(
+                [row["date"] for row in dataset["data"]],
+                ["2014-01-04", "2014-01-05"],
+            )
+
+    def test_scatter(self):
+        response = self.client.get("/multiscatterpaginated.csv?limit=3")
+        self.assertEqual(response["X-Total-Count"], "5")
+        self.assertEqual(
+            """,test1-value,test2-value
+            date,,
+            2014-01-01,0.5,1.0
+            2014-01-02,0.4,0.8
+            2014-01-03,0.6,1.2
+            """.replace(
+                " ", ""
+            ),
+            response.content.decode("utf-8"),
+        )
+
+    def test_composite_index(self):
+        for date in ("2014-01-01", "2014-01-02"):
+            for type in ("routine", "special"):
+                for site in ("site1", "site2"):
+                    ComplexTimeSeries.objects.create(
+                        site=site,
+                        parameter="flow",
+                        units="cfs",
+                        date=date,
+                        type=type,
+                        value=0.5,
+                    )
+
+        rows = []
+        url = "/complexpaginated.csv?limit=1"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response["X-Total-Count"], "4")
+            datasets = parse_csv(response.content.decode("utf-8"))
+            self.assertEqual(len(datasets), 2)
+            row = datasets[0]["data"][0]
+            rows.append((row["date"], row["type"]))
+            cursor = response.get("X-Next-Cursor")
+            url = cursor and "/complexpaginated.csv?limit=1&after=" + cursor
+        self.assertEqual(
+            rows,
+            [
+                ("2014-01-01", "routine"),
+                ("2014-01-01", "special"),
+                ("2014-01-02", "routine"),
+                ("2014-01-02", "special"),
+            ],
+        )
+
+    def test_null_index(self):
+        for units in (None, "cfs", "ft"):
+            for date in ("2014-01-01", "2014-01-02"):
+                ComplexTimeSeries.objects.create(
+                    site="site1",
+                    parameter="flow",
+                    units=units,
+                    date=date,
+                    type="routine",
+                    value=0.5,
+                )
+
+        for param in ("offset", "after"):
+            rows = []
+            base_url = "/complexunitspaginated.csv?limit=1"
+            url = base_url
+            while url:
+                response = self.client.get(url)
+                self.assertEqual(response["X-Total-Count"], "6")
+                lines = response.content.decode("utf-8").strip().split("\n")
+                self.assertEqual(len(lines), 6)
+                rows.append(lines[-1].strip())
+                if param == "after":
+                    cursor = response.get("X-Next-Cursor")
+                    url = cursor and base_url + "&after=" + cursor
+                elif 'rel="next"' in response.get("Link", ""):
+                    url = base_url + "&offset=%s" % len(rows)
+                else:
+                    url = None
+            self.assertEqual(
+                rows,
+                [
+                    "-,2014-01-01,0.5",
+                    "-,2014-01-02,0.5",
+                    "cfs,2014-01-01,0.5",
+                    "cfs,2014-01-02,0.5",
+                    "ft,2014-01-01,0.5",
+                    "ft,2014-01-02,0.5",
+                ],
+            )
+
+    def load_string(self, response):
+        return load_string(response.content.decode("utf-8"))
@@ -0,0 +1,78 @@
+import unittest
+from rest_framework.test import APITestCase
+from tests.testapp.models import TimeSeries, ComplexTimeSeries
+from .settings import HAS_PYARROW
+from io import BytesIO
+import pandas
+
+
+@unittest.skipUnless(HAS_PYARROW, "requires pyarrow")
+class ParquetTestCase(APITestCase):
+    def setUp(self):
+        data = (
+            ("2014-01-01", 0.5),
+            ("2014-01-02", 0.4),
+            ("2014-01-03", 0.6),
+        )
+        for date, value in data:
+            TimeSeries.objects.create(date=date, value=value)
+            for site in ("site1", "site2"):
+                ComplexTimeSeries.objects.create(
+                    site=site,
+                    parameter="flow",
+                    units="cfs",
+                    date=date,
+                    type="routine",
+                    value=value,
+                )
+
+    def test_parquet(self):
+        response = self.client.get("/timeseries.parquet")
+        self.assertEqual(
+            response["Content-Type"], "application/vnd.apache.parquet"
+        )
+        df = pandas.read_parquet(BytesIO(response.content))
+        self.assertEqual(df.index.name, "id")
+        self.assertEqual(list(df.columns), ["date", "value"])
+        self.assertEqual(df["value"].tolist(), [0.5, 0.4, 0.6])
+
+    def test_parquet_unstacked(self):
+        response = self.client.get("/complextimeseries.parquet")
+        df = pandas.read_parquet(BytesIO(response.content))
+        self.assertEqual(df.index.names, ["date", "type"])
+        self.assertEqual(
+            df.columns.names, ["", "units", "parameter", "site"]
+        )
+        self.assertEqual(
+            df[("value", "cfs", "flow", "site2")].tolist(), [0.5, 0.4, 0.6]
+        )
+
+    def test_parquet_compression(self):
+        import pyarrow.parquet
+
+        for compression in ("snappy", "zstd", "none"):
+            response = self.client.get(
+                "/timeseries.parquet?compression=" + compression
+            )
+            metadata = pyarrow.parquet.ParquetFile(
+                BytesIO(response.content)
+            ).metadata
+            if compression == "none":
+                compression = "uncompressed"
+            self.assertEqual(
+                metadata.row_group(0).column(0).compression,
+                compression.upper(),
+            )
+
+    def test_arrow(self):
+        import pyarrow
+
+        response = self.client.get("/complextimeseries.arrow?compression=lz4")
+        self.assertEqual(
+            response["Content-Type"], "application/vnd.apache.arrow.stream"
+        )
+        df = pyarrow.ipc.open_stream(response.content).read_pandas()
+        self.assertEqual(df.index.names, ["date", "type"])
+        self.assertEqual(
+            df[("value", "cfs", "flow", "site1")].tolist(), [0.5, 0.4, 0.6]
+        )
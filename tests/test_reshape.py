@@ -0,0 +1,114 @@
+import unittest
+from pandas import DataFrame, MultiIndex, array, date_range
+from pandas.testing import assert_frame_equal
+from rest_pandas.reshape import unstack_levels, unstack_scatter
+from rest_pandas.stats import boxplot_stats
+import numpy as np
+from .settings import HAS_MATPLOTLIB
+
+
+class ReshapeTestCase(unittest.TestCase):
+    def get_dataframe(self, rows=200):
+        rng = np.random.default_rng(0)
+        dataframe = DataFrame(
+            {
+                "date": rng.choice(date_range("2015-01-01", periods=20), rows),
+                "site": rng.choice(["site1", "site2", "site3"], rows),
+                "parameter": rng.choice(["flow", "height"], rows),
+                "value": np.where(rng.random(rows) < 0.1, np.nan, 1.5),
+                "count": rng.integers(0, 10, rows),
+                "valid": rng.random(rows) < 0.5,
+                "flag": rng.choice(["Q", None], rows),
+                "level": array(rng.integers(0, 3, rows), dtype="Int64"),
+            }
+        )
+        dataframe = dataframe.drop_duplicates(["date", "site", "parameter"])
+        dataframe = dataframe.set_index(["date", "site", "parameter"])
+        dataframe.columns.name = ""
+        return dataframe
+
+    def unstack(self, dataframe, levels):
+        for level in levels:
+            dataframe = dataframe.unstack(level)
+        dataframe = dataframe.dropna(axis=0, how="all")
+        return dataframe.dropna(axis=1, how="all")
+
+    def test_unstack_levels(self):
+        dataframe = self.get_dataframe()
+        for levels in (
+            ["parameter"],
+            ["parameter", "site"],
+            ["site", "date"],
+            ["date"],
+        ):
+            assert_frame_equal(
+                unstack_levels(dataframe, levels),
+                self.unstack(dataframe, levels),
+            )
+
+    def test_complete(self):
+        # No missing combinations, so integer and boolean columns are kept
+        dataframe = DataFrame(
+            {"count": [1, 2, 3, 4], "valid": [True, False, True, True]},
+            index=MultiIndex.from_product(
+                [["a", "b"], ["x", "y"]], names=["row", "col"]
+            ),
+        )
+        result = unstack_levels(dataframe, ["col"])
+        assert_frame_equal(result, self.unstack(dataframe, ["col"]))
+        self.assertEqual(result["count"].dtypes.tolist(), ["int64"] * 2)
+
+    def test_duplicates(self):
+        dataframe = self.get_dataframe()
+        dataframe = dataframe.reset_index("date", drop=True)
+        with self.assertRaises(ValueError):
+            unstack_levels(dataframe, ["parameter"])
+
+    def test_unstack_scatter(self):
+        dataframe = self.get_dataframe()[["value", "count", "level"]]
+        for coords, headers in (
+            (["parameter"], ["site"]),
+            (["parameter"], []),
+            (["site", "parameter"], []),
+        ):
+            expected = dataframe
+            for level in coords:
+                expected = expected.unstack(level)
+            expected = expected.dropna(axis=1, how="all")
+            expected = expected.dropna(axis=0, how="any")
+            for level in headers:
+                expected = expected.unstack(level)
+            assert_frame_equal(
+                unstack_scatter(dataframe, coords, headers), expected
+            )
+
+    def test_boxplot_stats(self):
+        rng = np.random.default_rng(0)
+        values = rng.normal(size=20000)
+        groups = rng.integers(0, 5, len(values))
+        stats = boxplot_stats(values, groups)
+        for code in range(5):
+            group = values[groups == code]
+            self.assertAlmostEqual(stats["mean"][code], np.mean(group))
+            self.assertAlmostEqual(stats["med"][code], np.median(group))
+            self.assertEqual(stats["count"][code], len(group))
+
+    @unittest.skipUnless(HAS_MATPLOTLIB, "requires matplotlib")
+    def test_boxplot_stats_matplotlib(self):
+        from matplotlib.cbook import boxplot_stats as mpl_boxplot_stats
+
+        rng = np.random.default_rng(0)
+        values = rng.normal(size=1000)
+        groups = rng.integers(0, 3, len(values))
+        stats = boxplot_stats(values, groups)
+        for code in range(3):
+            (expected,) = mpl_boxplot_stats(values[groups == code])
+            for name, value in expected.items():
+                if name == "fliers":
+                    fliers = stats[name][code]
+                    np.testing.assert_allclose(
+                        [float(v) for v in fliers.split("|") if fliers],
+                        value,
+                    )
+                else:
+                    self.assertTrue(np.isclose(stats[name][code], value))
@@ -1,11 +1,21 @@
 import unittest
-from rest_framework.test import APITestCase
+from rest_framework.test import APITestCase, APIRequestFactory
+from rest_framework.request import Request
+from rest_framework import serializers
 from tests.testapp.models import TimeSeries, CustomIndexSeries
+from tests.testapp.serializers import (
+    TimeSeriesDatesSerializer,
+    TimeSeriesColumnarSerializer,
+    TimeSeriesTypedSerializer,
+)
 from itertable import load_string
 import json
 import datetime
 import os
-from .settings import HAS_DJANGO_PANDAS, HAS_DJANGO_5
+import pandas as pd
+from rest_pandas import PandasJSONRenderer, PandasSerializer
+from rest_pandas.serializers import get_column
+from .settings import HAS_DJANGO_PANDAS, HAS_DJANGO_5, HAS_ORJSON
 
 
 class PandasTestCase(APITestCase):
@@ -38,6 +48,81 @@ class PandasTestCase(APITestCase):
         self.assertEqual(len(data), 5)
         self.assertEqual(data[0].value, "0.5")
 
+    def test_view_columnar(self):
+        for format in ("csv", "json"):
+            expected = self.client.get("/timeseries." + format)
+            with self.assertNumQueries(1):
+                response = self.client.get("/timeseriescolumnar." + format)
+            self.assertEqual(expected.content, response.content)
+
+    def test_view_columnar_fallback(self):
+        response = self.client.get("/timeseriesmethod.csv")
+        data = self.load_string(response)
+        self.assertEqual(len(data), 5)
+        self.assertEqual(data[0].value, "0.5")
+        self.assertEqual(data[0].double, "1.0")
+
+    def test_dtypes(self):
+        queryset = TimeSeries.objects.all()
+
+        # Inferred by default
+        child = TimeSeriesColumnarSerializer()
+        df = PandasSerializer(queryset, child=child).data
+        self.assertEqual(df.index.dtype, "int64")
+        self.assertEqual(df["value"].dtype, "float64")
+
+        # Columns typed from the field classes
+        child = TimeSeriesTypedSerializer()
+        df = PandasSerializer(queryset, child=child).data
+        self.assertEqual(df.index.dtype, "Int64")
+        self.assertEqual(df["value"].dtype, "float64")
+        self.assertEqual(df["date"].dtype, object)
+
+        # Meta.pandas_dtypes
+        child = TimeSeriesDatesSerializer()
+        df = PandasSerializer(queryset, child=child).data
+        self.assertEqual(df.index.dtype, "int64")
+        self.assertEqual(df["date"].dtype, "datetime64[ns]")
+
+        # Incompatible values are left as-is
+        with self.assertLogs("rest_pandas", "WARNING"):
+            values = get_column(["2014-01-01"], "Int64", "date")
+        self.assertEqual(values, ["2014-01-01"])
+
+    def test_dataframe_input(self):
+        class XYSerializer(serializers.Serializer):
+            x = serializers.IntegerField()
+            y = serializers.IntegerField()
+
+            class Meta:
+                pandas_dtypes = {"y": "float64"}
+
+        class XYPandasSerializer(PandasSerializer):
+            def get_index_fields(self):
+                return ["x"]
+
+        source = pd.DataFrame({"x": [1, 2], "y": [3, 4]})
+        for i in range(2):
+            df = XYPandasSerializer(source, child=XYSerializer()).data
+            self.assertEqual(df.index.name, "x")
+            self.assertEqual(df["y"].dtype, "float64")
+
+        # The source DataFrame is not modified
+        self.assertEqual(list(source.columns), ["x", "y"])
+        self.assertEqual(source["y"].dtype, "int64")
+
+    def test_view_csv_fields(self):
+        response = self.client.get("/timeseries.csv?fields=value")
+        data = self.load_string(response)
+        self.assertEqual(len(data), 5)
+        self.assertEqual(list(data.field_map.keys()), ["id", "value"])
+        self.assertEqual(data[0].value, "0.5")
+
+    def test_view_csv_labels_fields(self):
+        response = self.client.get("/timeserieslabels.csv?fields=Event Date")
+        data = self.load_string(response)
+        self.assertEqual(list(data.field_map.keys()), ["id", "Event Date"])
+
     def test_view_csv_labels(self):
         response = self.client.get("/timeserieslabels.csv")
         data = self.load_string(response)
@@ -78,6 +163,69 @@ class PandasTestCase(APITestCase):
         self.assertEqual(len(data.values()), 5)
         self.assertEqual(data["1"]["value"], 0.5)
 
+    def test_json_records_index_unmodified(self):
+        df = pd.DataFrame(
+            {"value": [0.5, 0.4, 0.6]},
+            index=pd.Index([1, 2, 3], name="id"),
+        )
+        renderer = PandasJSONRenderer()
+        renderer.chunk_size = 2
+        request = Request(APIRequestFactory().get("/"))
+        output = renderer.render(df, renderer_context={"request": request})
+        self.assertEqual(
+            output, df.reset_index().to_json(orient="records")
+        )
+        self.assertEqual(df.index.name, "id")
+        self.assertEqual(list(df.columns), ["value"])
+
+    @unittest.skipUnless(HAS_ORJSON, "requires orjson")
+    def test_view_json_orjson(self):
+        expected = self.client.get("/timeseries.json")
+        response = self.client.get("/orjson.json")
+        self.assertEqual(
+            json.loads(expected.content.decode("utf-8")),
+            json.loads(response.content.decode("utf-8")),
+        )
+
+        expected = self.client.get("/timeseries.json?date_format=epoch")
+        response = self.client.get("/orjson.json?date_format=epoch")
+        self.assertEqual(
+            json.loads(expected.content.decode("utf-8")),
+            json.loads(response.content.decode("utf-8")),
+        )
+
+    @unittest.skipUnless(HAS_ORJSON, "requires orjson")
+    def test_json_orjson_nullable(self):
+        from tests.testapp.renderers import OrjsonRenderer
+
+        df = pd.DataFrame(
+            {
+                "int": pd.array([1, None, 3], dtype="Int64"),
+                "float": pd.array([0.5, None, 1.5], dtype="Float64"),
+                "bool": pd.array([True, None, False], dtype="boolean"),
+                "str": pd.array(["a", None, "c"], dtype="string"),
+                "cat": pd.Categorical(["x", None, "y"]),
+                "date": pd.to_datetime(["2014-01-01", None, "2014-01-03"]),
+            },
+            index=pd.Index([1, 2, 3], name="id"),
+        )
+        context = {"request": Request(APIRequestFactory().get("/"))}
+        expected = PandasJSONRenderer().render(df, renderer_context=context)
+        output = OrjsonRenderer().render(df, renderer_context=context)
+        self.assertEqual(json.loads(expected), json.loads(output))
+        self.assertEqual(
+            json.loads(output)[1],
+            {
+                "id": 2,
+                "int": None,
+                "float": None,
+                "bool": None,
+                "str": None,
+                "cat": None,
+                "date": None,
+            },
+        )
+
     @unittest.skipUnless(HAS_DJANGO_5, "requires django 5")
     def test_view_html(self):
         response = self.client.get("/timeseries?test=1")
@@ -119,6 +267,30 @@ class PandasTestCase(APITestCase):
         data = self.load_string(response)
         self.assertEqual(data[0].date, "01-01-2014")
 
+    def test_streaming_csv(self):
+        expected = self.client.get("/timeseries.csv")
+        response = self.client.get("/streaming.csv")
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertEqual(
+            response["Content-Disposition"],
+            'attachment; filename="Time Series.csv"',
+        )
+        chunks = list(response.streaming_content)
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(expected.content, b"".join(chunks))
+
+    def test_streaming_json(self):
+        expected = self.client.get("/timeseries.json")
+        response = self.client.get("/streaming.json")
+        self.assertTrue(response.streaming)
+        self.assertEqual(
+            response["Content-Type"], "application/json; charset=utf-8"
+        )
+        chunks = list(response.streaming_content)
+        self.assertEqual(len(chunks), 7)
+        self.assertEqual(expected.content, b"".join(chunks))
+
     def test_pandas_mixin(self):
         response = self.client.get("/mixin.csv")
         data = self.load_string(response)
@@ -1,4 +1,11 @@
-from rest_pandas.renderers import PandasCSVRenderer
+from rest_pandas.renderers import (
+    PandasCSVRenderer,
+    PandasStreamingCSVRenderer,
+    PandasJSONRenderer,
+    PandasStreamingJSONRenderer,
+    PandasExcelRenderer,
+    PandasLargeExcelRenderer,
+)
 
 
 class CustomCSVRenderer(PandasCSVRenderer):
@@ -8,3 +15,40 @@ class CustomCSVRenderer(PandasCSVRenderer):
         )
         kwargs["date_format"] = "%d-%m-%Y"
         return kwargs
+
+
+class SmallChunkCSVRenderer(PandasStreamingCSVRenderer):
+    chunk_size = 2
+
+
+class SmallChunkJSONRenderer(PandasStreamingJSONRenderer):
+    chunk_size = 2
+
+
+class OrjsonRenderer(PandasJSONRenderer):
+    json_backend = "orjson"
+    chunk_size = 2
+
+
+class CachedCSVRenderer(PandasCSVRenderer):
+    render_cache = True
+
+
+class OpenpyxlRenderer(PandasExcelRenderer):
+    engine = "openpyxl"
+
+
+class XlsxWriterRenderer(PandasExcelRenderer):
+    engine = "xlsxwriter"
+    engine_kwargs = {"options": {"strings_to_numbers": True}}
+
+
+class SmallSheetExcelRenderer(PandasLargeExcelRenderer):
+    engine = "openpyxl"
+    max_rows = 8
+    chunk_size = 2
+    block_size = 1024
+
+
+class SmallSheetXlsxWriterRenderer(SmallSheetExcelRenderer):
+    engine = "xlsxwriter"
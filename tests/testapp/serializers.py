@@ -24,6 +24,28 @@ class TimeSeriesNoIdSerializer(TimeSeriesSerializer):
         exclude = ["id"]
 
 
+class TimeSeriesColumnarSerializer(TimeSeriesSerializer):
+    class Meta(TimeSeriesSerializer.Meta):
+        pandas_columnar = True
+
+
+class TimeSeriesTypedSerializer(TimeSeriesColumnarSerializer):
+    class Meta(TimeSeriesColumnarSerializer.Meta):
+        pandas_typed = True
+
+
+class TimeSeriesDatesSerializer(TimeSeriesSerializer):
+    class Meta(TimeSeriesSerializer.Meta):
+        pandas_dtypes = {"date": "datetime64[ns]"}
+
+
+class TimeSeriesMethodSerializer(TimeSeriesColumnarSerializer):
+    double = serializers.SerializerMethodField()
+
+    def get_double(self, instance):
+        return instance.value * 2
+
+
 class TimeSeriesLabelsSerializer(ModelSerializer):
     class Meta:
         model = TimeSeriesLabels
@@ -51,6 +73,17 @@ class ComplexTimeSeriesSerializer(ModelSerializer):
         pandas_unstacked_header = ["site", "parameter", "units"]
 
 
+class ComplexUnitsSerializer(ComplexTimeSeriesSerializer):
+    class Meta(ComplexTimeSeriesSerializer.Meta):
+        pandas_index = ["units", "date"]
+        pandas_unstacked_header = ["site", "parameter", "type"]
+
+
+class ComplexColumnarSerializer(ComplexTimeSeriesSerializer):
+    class Meta(ComplexTimeSeriesSerializer.Meta):
+        pandas_columnar = True
+
+
 class ComplexScatterSerializer(ComplexTimeSeriesSerializer):
     class Meta(ComplexTimeSeriesSerializer.Meta):
         exclude = ["id", "flag"]
@@ -67,6 +100,21 @@ class ComplexBoxplotSerializer(ComplexTimeSeriesSerializer):
         pandas_boxplot_header = ["units", "parameter"]
 
 
+class ComplexCategoricalSerializer(ComplexTimeSeriesSerializer):
+    class Meta(ComplexTimeSeriesSerializer.Meta):
+        pandas_categorical = True
+
+
+class ComplexCategoricalScatterSerializer(ComplexScatterSerializer):
+    class Meta(ComplexScatterSerializer.Meta):
+        pandas_categorical = True
+
+
+class ComplexCategoricalBoxplotSerializer(ComplexBoxplotSerializer):
+    class Meta(ComplexBoxplotSerializer.Meta):
+        pandas_categorical = ["site", "units", "parameter"]
+
+
 class ComplexBoxplotExtraSerializer(ComplexTimeSeriesSerializer):
     class Meta:
         model = ComplexTimeSeries
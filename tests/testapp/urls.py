@@ -7,45 +7,103 @@ from .views import (
     FromFileView,
     TimeSeriesView,
     TimeSeriesNoIdView,
+    TimeSeriesColumnarView,
+    TimeSeriesMethodView,
     TimeSeriesLabelsView,
     TimeSeriesMixedRendererView,
     TimeSeriesCustomCSVView,
+    TimeSeriesStreamingView,
+    TimeSeriesImageView,
+    TimeSeriesOrjsonView,
+    TimeSeriesCacheView,
+    TimeSeriesCacheAliasView,
+    TimeSeriesRenderCacheView,
+    TimeSeriesExcelEngineView,
     TimeSeriesMixinView,
     TimeSeriesNoMixinView,
     DjangoPandasView,
     TimeSeriesViewSet,
     MultiTimeSeriesView,
+    MultiCacheView,
     MultiScatterView,
     MultiBoxplotView,
     ComplexTimeSeriesView,
+    ComplexColumnarView,
+    ComplexStreamingView,
+    ComplexLargeExcelView,
     ComplexScatterView,
     ComplexBoxplotView,
     ComplexBoxplotExtraView,
+    ComplexCategoricalView,
+    ComplexCategoricalScatterView,
+    ComplexCategoricalBoxplotView,
     CustomIndexSeriesView,
+    TimeSeriesPaginatedView,
+    MultiPaginatedView,
+    MultiScatterPaginatedView,
+    ComplexPaginatedView,
+    ComplexUnitsPaginatedView,
+    AsyncNoModelView,
+    AsyncTimeSeriesView,
+    AsyncTimeSeriesStreamingView,
+    AsyncTimeSeriesViewSet,
+    AsyncMultiTimeSeriesView,
+    AsyncMultiBoxplotView,
+    AsyncComplexTimeSeriesView,
 )
 
 router = DefaultRouter()
 router.register("timeseries", TimeSeriesViewSet)
+router.register(
+    "asynctimeseries", AsyncTimeSeriesViewSet, basename="asynctimeseries"
+)
 
 urlpatterns = [
     path("nomodel", NoModelView.as_view()),
     path("fromfile", FromFileView.as_view()),
     path("timeseries", TimeSeriesView.as_view()),
     path("timeseriesnoid", TimeSeriesNoIdView.as_view()),
+    path("timeseriescolumnar", TimeSeriesColumnarView.as_view()),
+    path("timeseriesmethod", TimeSeriesMethodView.as_view()),
     path("timeserieslabels", TimeSeriesLabelsView.as_view()),
     path("mixedrenderers", TimeSeriesMixedRendererView.as_view()),
     path("customcsv", TimeSeriesCustomCSVView.as_view()),
+    path("streaming", TimeSeriesStreamingView.as_view()),
+    path("image", TimeSeriesImageView.as_view()),
+    path("orjson", TimeSeriesOrjsonView.as_view()),
+    path("cache", TimeSeriesCacheView.as_view()),
+    path("cachealias", TimeSeriesCacheAliasView.as_view()),
+    path("rendercache", TimeSeriesRenderCacheView.as_view()),
+    path("excelengine", TimeSeriesExcelEngineView.as_view()),
     path("mixin", TimeSeriesMixinView.as_view()),
     path("nomixin", TimeSeriesNoMixinView.as_view()),
     path("djangopandas", DjangoPandasView.as_view()),
     path("multitimeseries", MultiTimeSeriesView.as_view()),
+    path("multicache", MultiCacheView.as_view()),
     path("multiscatter", MultiScatterView.as_view()),
     path("multiboxplot", MultiBoxplotView.as_view()),
     path("complextimeseries", ComplexTimeSeriesView.as_view()),
+    path("complexcolumnar", ComplexColumnarView.as_view()),
+    path("complexstreaming", ComplexStreamingView.as_view()),
+    path("complexlargeexcel", ComplexLargeExcelView.as_view()),
     path("complexscatter", ComplexScatterView.as_view()),
     path("complexboxplot", ComplexBoxplotView.as_view()),
     path("complexboxplotextra", ComplexBoxplotExtraView.as_view()),
+    path("complexcategorical", ComplexCategoricalView.as_view()),
+    path("complexcategoricalscatter", ComplexCategoricalScatterView.as_view()),
+    path("complexcategoricalboxplot", ComplexCategoricalBoxplotView.as_view()),
     path("customindex", CustomIndexSeriesView.as_view()),
+    path("paginated", TimeSeriesPaginatedView.as_view()),
+    path("multipaginated", MultiPaginatedView.as_view()),
+    path("multiscatterpaginated", MultiScatterPaginatedView.as_view()),
+    path("complexpaginated", ComplexPaginatedView.as_view()),
+    path("complexunitspaginated", ComplexUnitsPaginatedView.as_view()),
+    path("asyncnomodel", AsyncNoModelView.as_view()),
+    path("asynctimeseries", AsyncTimeSeriesView.as_view()),
+    path("asyncstreaming", AsyncTimeSeriesStreamingView.as_view()),
+    path("asyncmultitimeseries", AsyncMultiTimeSeriesView.as_view()),
+    path("asyncmultiboxplot", AsyncMultiBoxplotView.as_view()),
+    path("asynccomplextimeseries", AsyncComplexTimeSeriesView.as_view()),
 ]
 urlpatterns = format_suffix_patterns(urlpatterns)
 urlpatterns += [
@@ -3,9 +3,13 @@ from rest_pandas import (
     PandasSimpleView,
     PandasView,
     PandasViewSet,
+    AsyncPandasSimpleView,
+    AsyncPandasView,
+    AsyncPandasViewSet,
     PandasUnstackedSerializer,
     PandasScatterSerializer,
     PandasBoxplotSerializer,
+    PandasPagination,
 )
 from rest_framework import renderers
 from rest_framework.generics import ListAPIView
@@ -20,15 +24,33 @@ from .models import (
 from .serializers import (
     TimeSeriesSerializer,
     TimeSeriesNoIdSerializer,
+    TimeSeriesColumnarSerializer,
+    TimeSeriesDatesSerializer,
+    TimeSeriesMethodSerializer,
     TimeSeriesLabelsSerializer,
     MultiTimeSeriesSerializer,
     ComplexTimeSeriesSerializer,
+    ComplexColumnarSerializer,
+    ComplexUnitsSerializer,
     ComplexScatterSerializer,
     ComplexBoxplotSerializer,
     ComplexBoxplotExtraSerializer,
+    ComplexCategoricalSerializer,
+    ComplexCategoricalScatterSerializer,
+    ComplexCategoricalBoxplotSerializer,
     CustomIndexSeriesSerializer,
 )
-from .renderers import CustomCSVRenderer
+from .renderers import (
+    CustomCSVRenderer,
+    SmallChunkCSVRenderer,
+    SmallChunkJSONRenderer,
+    OrjsonRenderer,
+    CachedCSVRenderer,
+    OpenpyxlRenderer,
+    XlsxWriterRenderer,
+    SmallSheetExcelRenderer,
+    SmallSheetXlsxWriterRenderer,
+)
 import pandas as pd
 
 
@@ -70,6 +92,16 @@ class TimeSeriesNoIdView(PandasView):
     serializer_class = TimeSeriesNoIdSerializer
 
 
+class TimeSeriesColumnarView(PandasView):
+    queryset = TimeSeries.objects.all()
+    serializer_class = TimeSeriesColumnarSerializer
+
+
+class TimeSeriesMethodView(PandasView):
+    queryset = TimeSeries.objects.all()
+    serializer_class = TimeSeriesMethodSerializer
+
+
 class TimeSeriesLabelsView(PandasView):
     queryset = TimeSeriesLabels.objects.all()
     serializer_class = TimeSeriesLabelsSerializer
@@ -88,15 +120,59 @@ class TimeSeriesMixedRendererView(PandasView):
 
 class TimeSeriesCustomCSVView(PandasView):
     queryset = TimeSeries.objects.all()
-    serializer_class = TimeSeriesSerializer
+    serializer_class = TimeSeriesDatesSerializer
 
     renderer_classes = [
         CustomCSVRenderer,
     ]
 
-    def transform_dataframe(self, df):
-        df["date"] = df["date"].astype("datetime64[ns]")
-        return df
+
+class TimeSeriesStreamingView(PandasView):
+    queryset = TimeSeries.objects.all()
+    serializer_class = TimeSeriesSerializer
+    renderer_classes = [SmallChunkCSVRenderer, SmallChunkJSONRenderer]
+
+    def get_pandas_filename(self, request, format):
+        return "Time Series"
+
+
+class TimeSeriesImageView(PandasView):
+    queryset = TimeSeries.objects.all()
+    serializer_class = TimeSeriesSerializer
+    pandas_image_options = {"width": 300, "height": 200, "kind": "bar"}
+
+
+class TimeSeriesOrjsonView(PandasView):
+    queryset = TimeSeries.objects.all()
+    serializer_class = TimeSeriesSerializer
+    renderer_classes = [OrjsonRenderer]
+
+
+class TimeSeriesCacheView(PandasView):
+    queryset = TimeSeries.objects.all()
+    serializer_class = TimeSeriesSerializer
+    pandas_cache = True
+
+
+class TimeSeriesCacheAliasView(TimeSeriesCacheView):
+    pandas_cache_alias = "pandas"
+
+
+class TimeSeriesRenderCacheView(PandasView):
+    queryset = TimeSeries.objects.all()
+    serializer_class = TimeSeriesSerializer
+    renderer_classes = [CachedCSVRenderer]
+
+
+class TimeSeriesExcelEngineView(PandasView):
+    queryset = TimeSeries.objects.all()
+    serializer_class = TimeSeriesSerializer
+    renderer_classes = [OpenpyxlRenderer]
+
+    def get_renderers(self):
+        if self.request.GET.get("engine") == "xlsxwriter":
+            return [XlsxWriterRenderer()]
+        return super().get_renderers()
 
 
 class TimeSeriesViewSet(PandasViewSet):
@@ -133,6 +209,11 @@ class MultiTimeSeriesView(PandasView):
     pandas_serializer_class = PandasUnstackedSerializer
 
 
+class MultiCacheView(MultiTimeSeriesView):
+    pandas_cache = True
+    pandas_cache_timeout = 60
+
+
 class MultiScatterView(PandasView):
     queryset = MultiTimeSeries.objects.all()
     serializer_class = MultiTimeSeriesSerializer
@@ -151,6 +232,25 @@ class ComplexTimeSeriesView(PandasView):
     pandas_serializer_class = PandasUnstackedSerializer
 
 
+class ComplexColumnarView(PandasView):
+    queryset = ComplexTimeSeries.objects.all()
+    serializer_class = ComplexColumnarSerializer
+    pandas_serializer_class = PandasUnstackedSerializer
+
+
+class ComplexStreamingView(ComplexTimeSeriesView):
+    renderer_classes = [SmallChunkCSVRenderer]
+
+
+class ComplexLargeExcelView(ComplexTimeSeriesView):
+    renderer_classes = [SmallSheetExcelRenderer]
+
+    def get_renderers(self):
+        if self.request.GET.get("engine") == "xlsxwriter":
+            return [SmallSheetXlsxWriterRenderer()]
+        return super().get_renderers()
+
+
 class ComplexScatterView(PandasView):
     queryset = ComplexTimeSeries.objects.all()
     serializer_class = ComplexScatterSerializer
@@ -163,6 +263,18 @@ class ComplexBoxplotView(PandasView):
     pandas_serializer_class = PandasBoxplotSerializer
 
 
+class ComplexCategoricalView(ComplexTimeSeriesView):
+    serializer_class = ComplexCategoricalSerializer
+
+
+class ComplexCategoricalScatterView(ComplexScatterView):
+    serializer_class = ComplexCategoricalScatterSerializer
+
+
+class ComplexCategoricalBoxplotView(ComplexBoxplotView):
+    serializer_class = ComplexCategoricalBoxplotSerializer
+
+
 class ComplexBoxplotExtraView(PandasView):
     queryset = ComplexTimeSeries.objects.all()
     serializer_class = ComplexBoxplotExtraSerializer
@@ -172,3 +284,65 @@ class ComplexBoxplotExtraView(PandasView):
 class CustomIndexSeriesView(PandasView):
     queryset = CustomIndexSeries.objects.all()
     serializer_class = CustomIndexSeriesSerializer
+
+
+class TimeSeriesPaginatedView(TimeSeriesView):
+    pagination_class = PandasPagination
+
+
+class MultiPaginatedView(MultiTimeSeriesView):
+    pagination_class = PandasPagination
+
+
+class MultiScatterPaginatedView(MultiScatterView):
+    pagination_class = PandasPagination
+
+
+class ComplexPaginatedView(ComplexTimeSeriesView):
+    pagination_class = PandasPagination
+
+
+class ComplexUnitsPaginatedView(ComplexPaginatedView):
+    serializer_class = ComplexUnitsSerializer
+
+
+class AsyncNoModelView(AsyncPandasSimpleView):
+    async def get_data(self, request, *args, **kwargs):
+        return [
+            {"x": 5, "y": 7},
+            {"x": 3, "y": 2},
+        ]
+
+
+class AsyncTimeSeriesView(AsyncPandasView):
+    queryset = TimeSeries.objects.all()
+    serializer_class = TimeSeriesSerializer
+    pandas_chunk_size = 2
+
+
+class AsyncTimeSeriesStreamingView(AsyncTimeSeriesView):
+    renderer_classes = [SmallChunkCSVRenderer, SmallChunkJSONRenderer]
+
+
+class AsyncTimeSeriesViewSet(AsyncPandasViewSet):
+    queryset = TimeSeries.objects.all()
+    serializer_class = TimeSeriesSerializer
+
+
+class AsyncMultiTimeSeriesView(AsyncPandasView):
+    queryset = MultiTimeSeries.objects.all()
+    serializer_class = MultiTimeSeriesSerializer
+    pandas_serializer_class = PandasUnstackedSerializer
+    pandas_cache = True
+
+
+class AsyncMultiBoxplotView(AsyncPandasView):
+    queryset = MultiTimeSeries.objects.all()
+    serializer_class = MultiTimeSeriesSerializer
+    pandas_serializer_class = PandasBoxplotSerializer
+
+
+class AsyncComplexTimeSeriesView(AsyncPandasView):
+    queryset = ComplexTimeSeries.objects.all()
+    serializer_class = ComplexTimeSeriesSerializer
+    pandas_serializer_class = PandasUnstackedSerializer